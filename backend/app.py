@@ -1,7 +1,10 @@
 # backend/app.py
 # backend/app.py
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
 from flask import Flask, jsonify, request
 
 from pdf_extractor.hdfc_extractor import HDFCExtractor
@@ -10,7 +13,16 @@ from pdf_extractor.sbi_extractor import SBIExtractor
 from pdf_extractor.union_extractor import UnionExtractor
 from pdf_extractor.boi_extractor import BOIExtractor
 from pdf_extractor.central_extractor import CentralExtractor
+from pdf_extractor.budget import ExtractionBudget
 from normalizer.transaction_normalizer import TransactionNormalizer
+from normalizer.categorizer import CATEGORIZER
+from normalizer.normalized_format import (FORMAT_VERSION, FORMAT_VERSIONS, NormalizedWriter, STREAM_FORMATS,
+                                          write_normalized_version)
+from normalizer.records import record_default
+from pipeline.extraction_cache import ExtractionCache
+from pipeline.manifest import BatchManifest
+from pipeline.scheduler import BatchJob, longest_first, makespan_report
+from pipeline.stages import Stage, StagedPipeline
 
 app = Flask(__name__)   # 👈 THIS IS WHAT GUNICORN NEEDS
 
@@ -25,40 +37,338 @@ class BankStatementProcessor:
         'central': CentralExtractor,
         'central_bank': CentralExtractor
     }
-
-    def __init__(self):
+    # process_all's stages after discovery, in order; see _stages
+    STAGES = ("read", "extract", "normalize", "write")
+    # Summary row fields that describe one run, not the file: neither kept
+    # in the manifest nor replayed for a PDF skipped as unchanged
+    RUN_METRICS = ("cached", "peak_rss_mb", "seconds")
+
+    def __init__(self, use_cache: bool = True, low_memory: bool = False,
+                 max_seconds: float = None, max_pages: int = None, stream_format: str = None,
+                 workers: int = 1, incremental: bool = True, stage_workers: Dict[str, int] = None,
+                 queue_size: int = 2, format_version: int = FORMAT_VERSION, page_workers: int = 1):
         project_root = Path(__file__).parent.parent
         self.raw_pdf_dir = project_root / 'data' / 'raw_pdfs'
         self.extracted_json_dir = project_root / 'data' / 'extracted_json'
         self.normalized_json_dir = project_root / 'data' / 'normalized_json'
+        # What earlier runs processed; see BatchManifest
+        self.manifest_path = project_root / 'data' / 'normalized_manifest.json'
+        self.cache = ExtractionCache(
+            project_root / 'data' / 'cache' / 'extraction',
+            normalizer_version=TransactionNormalizer.VERSION
+        ) if use_cache else None
+        # Release pdfplumber page caches as pages are read
+        self.low_memory = low_memory
+        # Per-document budget; a document that exceeds it is returned partial
+        self.max_seconds = max_seconds
+        self.max_pages = max_pages
+        # "json" / "ndjson": stream each statement straight to
+        # normalized_json instead of building it in memory (no cache)
+        if stream_format is not None and stream_format not in STREAM_FORMATS:
+            raise ValueError(f"Unknown stream format: {stream_format}")
+        self.stream_format = stream_format
+        # Layout of normalized_json when not streaming: 2 (compact columns,
+        # what the Mongo importers read) or 1 (row objects, indent=2)
+        if format_version not in FORMAT_VERSIONS:
+            raise ValueError(f"Unknown normalized format version: {format_version}")
+        self.format_version = format_version
+        # Processes PDFs are fanned out to; 1 processes them in this process
+        self.workers = workers or 1
+        # Processes each PDF's pages are read in (BasePDFExtractor's
+        # workers); for a few long PDFs rather than many short ones
+        self.page_workers = page_workers or 1
+        # Threads per stage (extract: PDFs extracted at once, defaults to
+        # workers) and the most items waiting in front of each stage
+        unknown = set(stage_workers or {}) - set(self.STAGES)
+        if unknown:
+            raise ValueError(f"Unknown stage: {', '.join(sorted(unknown))}")
+        self.stage_workers = {"read": 1, "extract": self.workers, "normalize": 1, "write": 1,
+                              **(stage_workers or {})}
+        self.queue_size = queue_size
+        # Skip PDFs the manifest shows unchanged since they were processed;
+        # False re-processes every PDF (the manifest is still updated)
+        self.incremental = incremental
+        # Batch-level figures of the last process_all run (schedule makespan,
+        # per-stage counts and timings, manifest counts)
+        self.batch_summary = {}
 
     def process_all(self):
         if not self.raw_pdf_dir.exists():
             return {"error": "raw_pdfs directory not found"}
 
-        results = []
+        discovery_started = time.perf_counter()
+        discovered = self._discover()
+        manifest = BatchManifest(self.manifest_path, self.raw_pdf_dir)
+        pruned = manifest.prune(pdf_file for _, pdf_file in discovered)
+
+        # Unchanged PDFs report their recorded summary; only the rest are jobs
+        results = [None] * len(discovered)
+        fingerprints = {}
+        jobs = []
+        for index, (bank_name, pdf_file) in enumerate(discovered):
+            fingerprint = self._fingerprint(bank_name)
+            try:
+                entry = manifest.unchanged(pdf_file, fingerprint)
+            except OSError:
+                entry = None
+            if entry is not None and self.incremental:
+                results[index] = {**self._file_summary(entry["summary"]), "unchanged": True}
+            else:
+                fingerprints[index] = fingerprint
+                jobs.append(BatchJob(index, bank_name, pdf_file))
+
+        # Several PDFs in extraction at once means one process each; they are
+        # fed in longest first (by page count) so no long one starts last
+        workers = max(min(self.stage_workers["extract"], len(jobs)), 1)
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Page counts are read only here, for the pool's order
+        ordered = longest_first(jobs) if pool else jobs
+        pipeline = StagedPipeline(self._stages(pool, workers))
+        # Discovery (listing, manifest checks, page counts) is done up front
+        # for the longest-first order; its time is reported as the source's
+        pipeline.source.busy_seconds = time.perf_counter() - discovery_started
+        started = time.perf_counter()
+        durations = {}
+        try:
+            items = ({"job": job, "fingerprint": fingerprints[job.index]}
+                     for job in ordered)
+            # Results are stored at their discovery index, whatever order they finish in
+            for item, error, stage_seconds in pipeline.run(items):
+                job = item["job"]
+                result = self._failure(job.bank_name, job.pdf_file, error) if error else item["result"]
+                result["seconds"] = round(sum(stage_seconds.values()), 3)
+                results[job.index] = result
+                # The schedule is judged on the stage the workers share
+                durations[job.index] = stage_seconds.get("extract", 0.0)
+        finally:
+            if pool:
+                pool.shutdown()
+        wall_seconds = time.perf_counter() - started
+
+        # Failed and partial results are not recorded, so the next run retries them
+        for job in jobs:
+            result = results[job.index]
+            if "error" not in result and not result.get("truncated"):
+                manifest.record(job.pdf_file, fingerprints[job.index],
+                                (result.get("extracted"), result.get("output")), self._file_summary(result))
+            else:
+                manifest.forget(job.pdf_file)
+        manifest.save()
+
+        self.batch_summary = {
+            "schedule": makespan_report(jobs, durations, workers, wall_seconds),
+            "stages": pipeline.report(),
+            "manifest": {
+                "processed": len(jobs),
+                "unchanged": len(discovered) - len(jobs),
+                "pruned": pruned
+            }
+        }
+        return results
 
-        for bank_folder in self.raw_pdf_dir.iterdir():
+    @classmethod
+    def _file_summary(cls, result: Dict) -> Dict:
+        """The summary row without the per-run metrics"""
+        return {field: value for field, value in result.items() if field not in cls.RUN_METRICS}
+
+    def _fingerprint(self, bank_name: str) -> Dict:
+        """What a PDF's recorded result depends on besides its content"""
+        extractor_class = self.EXTRACTORS[bank_name]
+        return {
+            "extractor": extractor_class.__name__,
+            "extractor_version": getattr(extractor_class, 'EXTRACTOR_VERSION', '0'),
+            "normalizer_version": TransactionNormalizer.VERSION,
+            "output_format": self.stream_format or f"v{self.format_version}"
+        }
+
+    def _discover(self) -> List[Tuple[str, Path]]:
+        """(bank folder name, PDF path) for every PDF with an extractor, sorted"""
+        jobs = []
+        for bank_folder in sorted(self.raw_pdf_dir.iterdir()):
             if not bank_folder.is_dir():
                 continue
 
             bank_name = bank_folder.name.lower()
-            extractor_class = self.EXTRACTORS.get(bank_name)
-            if not extractor_class:
+            if bank_name not in self.EXTRACTORS:
                 continue
 
-            for pdf_file in bank_folder.glob("*.pdf"):
-                extractor = extractor_class(str(pdf_file))
-                statement_data = extractor.extract()
-
-                normalized = TransactionNormalizer.normalize_statement(statement_data)
-                results.append({
-                    "bank": bank_name,
-                    "file": pdf_file.name,
-                    "transactions": len(normalized)
-                })
-
-        return results
+            jobs.extend((bank_name, pdf_file) for pdf_file in sorted(bank_folder.glob("*.pdf")))
+        return jobs
+
+    @staticmethod
+    def _failure(bank_name: str, pdf_file: Path, error: Exception) -> Dict:
+        return {
+            "bank": bank_name,
+            "file": pdf_file.name,
+            "error": f"{type(error).__name__}: {error}"
+        }
+
+    def _stages(self, pool: ProcessPoolExecutor, extract_workers: int) -> List[Stage]:
+        """
+        read -> extract -> normalize -> write, on threads
+        Each stage has its own worker count and a bounded queue in front of
+        it: a slow disk or a run of huge PDFs fills a queue and holds the
+        stages before it back, so at most queue_size items (each a PDF's
+        bytes or a statement) wait at any stage. Stream mode extracts,
+        normalizes and writes row by row in the extract stage; the later
+        stages pass its items through.
+        """
+        def read(item):
+            # Pool workers read the PDF themselves; only its hash is needed here
+            return self._read(item, keep_bytes=pool is None)
+
+        def extract(item):
+            return self._extract(item, pool)
+
+        return [
+            Stage("read", read, self.stage_workers["read"], self.queue_size),
+            Stage("extract", extract, extract_workers, self.queue_size),
+            Stage("normalize", self._normalize, self.stage_workers["normalize"], self.queue_size),
+            Stage("write", self._write, self.stage_workers["write"], self.queue_size)
+        ]
+
+    def _read(self, item: Dict, keep_bytes: bool = True) -> Dict:
+        """
+        Stage: the PDF's bytes, hashed here unless the manifest already did
+        Without keep_bytes only the hash is computed, streaming the file
+        """
+        fingerprint = item["fingerprint"]
+        if keep_bytes:
+            item["pdf_bytes"] = item["job"].pdf_file.read_bytes()
+            fingerprint.setdefault("sha256", ExtractionCache.hash_bytes(item["pdf_bytes"]))
+        elif "sha256" not in fingerprint:
+            fingerprint["sha256"] = ExtractionCache.hash_file(item["job"].pdf_file)
+        if self.cache and not self.stream_format:
+            job = item["job"]
+            item["cache_key"] = self.cache.key_for(job.pdf_file, self.EXTRACTORS[job.bank_name],
+                                                   fingerprint["sha256"])
+        return item
+
+    def _extract(self, item: Dict, pool: ProcessPoolExecutor = None) -> Dict:
+        """
+        Stage: statement data from the cache, else from the extractor
+        With a pool, a worker is sent only the job's _extraction_config()
+        and reads the PDF itself; the cache is checked here first
+        """
+        config = self._extraction_config(item["job"])
+        pdf_bytes = item.pop("pdf_bytes", None)
+        if self.stream_format:
+            item["result"] = _stream_task(config, pdf_bytes) if pool is None else \
+                pool.submit(_stream_task, config).result()
+            return item
+
+        entry = self.cache.get(item["cache_key"]) if item.get("cache_key") else None
+        if entry:
+            item.update(statement=entry["statement"], normalized=entry["normalized"], cached=True, peak_rss=0)
+            return item
+
+        statement, peak_rss = _extract_task(config, pdf_bytes) if pool is None else \
+            pool.submit(_extract_task, config).result()
+        item.update(statement=statement, cached=False, peak_rss=peak_rss)
+        return item
+
+    def _extraction_config(self, job: BatchJob) -> Dict:
+        """What extracting job's PDF takes: small and picklable, it is all a pool worker is sent"""
+        config = {
+            "pdf_file": str(job.pdf_file),
+            "bank_name": job.bank_name,
+            "extractor_class": self.EXTRACTORS[job.bank_name],
+            "page_workers": self.page_workers,
+            "low_memory": self.low_memory,
+            "max_seconds": self.max_seconds,
+            "max_pages": self.max_pages
+        }
+        if self.stream_format:
+            config["stream_format"] = self.stream_format
+            config["output"] = str(self.normalized_json_dir / f"{job.pdf_file.stem}_normalized.{self.stream_format}")
+        return config
+
+    def _normalize(self, item: Dict) -> Dict:
+        """Stage: normalized rows, cached with the statement they came from"""
+        if "result" in item or "normalized" in item:
+            return item
+        item["normalized"] = TransactionNormalizer.normalize_statement(item["statement"])
+        # Partial results are never cached
+        if item.get("cache_key") and not item["statement"].get("truncated"):
+            self.cache.put(item["cache_key"], item["statement"], item["normalized"])
+        return item
+
+    def _write(self, item: Dict) -> Dict:
+        """Stage: the output files; only the job and its summary row go on"""
+        if "result" in item:
+            return item
+        job = item["job"]
+        statement_data, normalized = item["statement"], item["normalized"]
+        extracted_output = self.extracted_json_dir / job.bank_name / f"{job.pdf_file.stem}.json"
+        normalized_output = self.normalized_json_dir / f"{job.pdf_file.stem}_normalized.json"
+        self._write_outputs(statement_data, normalized, extracted_output, normalized_output)
+        peak_rss = item["peak_rss"]
+        return {
+            "job": job,
+            "result": {
+                "bank": job.bank_name,
+                "file": job.pdf_file.name,
+                "transactions": len(normalized),
+                "cached": item["cached"],
+                "truncated": statement_data.get("truncated", False),
+                # Share of rows that fit the balance chain; see BalanceReconciler
+                "integrity": statement_data.get("reconciliation", {}).get("integrity"),
+                "peak_rss_mb": round(peak_rss / (1024 * 1024), 1) if peak_rss else None,
+                "extracted": str(extracted_output),
+                "output": str(normalized_output)
+            }
+        }
+
+    def _write_outputs(self, statement_data: Dict, normalized: List, extracted_output: Path, normalized_output: Path):
+        """The extractor's JSON (indent=2) and the normalized statement in format_version"""
+        extracted_output.parent.mkdir(parents=True, exist_ok=True)
+        with open(extracted_output, 'w') as f:
+            json.dump(statement_data, f, indent=2, default=record_default)
+        write_normalized_version(normalized_output, statement_data, normalized, self.format_version)
+
+
+def _extractor(config: Dict, pdf_bytes: bytes = None):
+    """The configured extractor; without pdf_bytes it reads config["pdf_file"] itself"""
+    budget = ExtractionBudget(config["max_seconds"], config["max_pages"])
+    return config["extractor_class"](config["pdf_file"], workers=config["page_workers"],
+                                     low_memory=config["low_memory"], budget=budget, pdf_bytes=pdf_bytes)
+
+
+def _extract_task(config: Dict, pdf_bytes: bytes = None) -> Tuple[Dict, int]:
+    """process_all's extraction of one PDF, in this process or a pool worker: (statement, peak RSS)"""
+    extractor = _extractor(config, pdf_bytes)
+    return extractor.extract(), extractor.peak_rss
+
+
+def _stream_task(config: Dict, pdf_bytes: bytes = None) -> Dict:
+    """
+    Stream mode's extraction of one PDF, in this process or a pool worker
+    extract_iter() -> normalize_iter() -> NormalizedWriter, one row at a
+    time: memory is one page of rows plus buffers, whatever the length.
+    Returns the summary row
+    """
+    extractor = _extractor(config, pdf_bytes)
+    transactions = extractor.extract_iter()
+    statement_data = {field: getattr(extractor, field)
+                      for field in ('bank_name', 'account_number', 'account_holder', 'statement_period')}
+    normalized = TransactionNormalizer.normalize_iter(
+        transactions,
+        TransactionNormalizer.normalize_bank_name(extractor.bank_name),
+        extractor.account_number
+    )
+
+    with NormalizedWriter(config["output"], statement_data, config["stream_format"]) as writer:
+        count = writer.write_all(normalized)
+    return {
+        "bank": config["bank_name"],
+        "file": Path(config["pdf_file"]).name,
+        "transactions": count,
+        "cached": False,
+        "truncated": extractor.truncated_reason is not None,
+        "integrity": (extractor.reconciliation or {}).get("integrity"),
+        "peak_rss_mb": round(extractor.peak_rss / (1024 * 1024), 1) if extractor.peak_rss else None,
+        "output": config["output"]
+    }
 
 
 # ------------------ ROUTES ------------------
@@ -70,9 +380,65 @@ def health():
 
 @app.route("/process-all", methods=["POST"])
 def process_all_route():
-    processor = BankStatementProcessor()
+    # Writes data/extracted_json and data/normalized_json.
+    # ?refresh=1 bypasses the extraction cache and the manifest, ?low_memory=1 flushes page caches,
+    # ?max_seconds=&max_pages= bound the work spent on each document,
+    # ?stream=json|ndjson writes each statement to normalized_json row by row,
+    # ?format_version=1|2 picks the normalized_json layout when not streaming (default 2),
+    # ?workers=N processes N PDFs at a time in a process pool,
+    # ?page_workers=N reads each PDF's pages in N processes,
+    # ?stages=read:2,write:2 sets threads per stage, ?queue_size=N the items queued before each
+    stream_format = request.args.get("stream")
+    if stream_format is not None and stream_format not in STREAM_FORMATS:
+        return jsonify({"error": f"stream must be one of {', '.join(STREAM_FORMATS)}"}), 400
+    format_version = request.args.get("format_version", FORMAT_VERSION, type=int)
+    if format_version not in FORMAT_VERSIONS:
+        return jsonify({"error": f"format_version must be one of {', '.join(map(str, FORMAT_VERSIONS))}"}), 400
+    stage_workers = {}
+    for spec in filter(None, request.args.get("stages", "").split(",")):
+        name, _, count = spec.partition(":")
+        if name not in BankStatementProcessor.STAGES or not count.isdigit() or int(count) < 1:
+            return jsonify({"error": f"stages must be name:count pairs, names from "
+                                     f"{', '.join(BankStatementProcessor.STAGES)}"}), 400
+        stage_workers[name] = int(count)
+    processor = BankStatementProcessor(
+        use_cache=request.args.get("refresh") != "1",
+        low_memory=request.args.get("low_memory") == "1",
+        max_seconds=request.args.get("max_seconds", type=float),
+        max_pages=request.args.get("max_pages", type=int),
+        stream_format=stream_format,
+        workers=request.args.get("workers", 1, type=int),
+        page_workers=request.args.get("page_workers", 1, type=int),
+        incremental=request.args.get("refresh") != "1",
+        stage_workers=stage_workers,
+        queue_size=request.args.get("queue_size", 2, type=int),
+        format_version=format_version
+    )
     result = processor.process_all()
-    return jsonify(result)
+    if isinstance(result, dict):
+        return jsonify(result)
+    return jsonify({"results": result, "summary": processor.batch_summary})
+
+
+@app.route("/categorize", methods=["POST"])
+def categorize_route():
+    # Body: {"transactions": [...]} with raw (debit/credit) or normalized
+    # (amount/transaction_type) rows; each row comes back with a "category"
+    # and a canonical "merchant" (bank-specific rules apply when rows carry
+    # bank_name)
+    payload = request.get_json(silent=True)
+    transactions = payload.get("transactions") if isinstance(payload, dict) else payload
+    if not isinstance(transactions, list) or not all(isinstance(row, dict) for row in transactions):
+        return jsonify({"error": "expected a JSON list of transaction objects"}), 400
+    if not all(CATEGORIZER.has_valid_amounts(row) for row in transactions):
+        return jsonify({"error": "debit, credit and amount must be numbers or strings"}), 400
+
+    categorized = CATEGORIZER.categorize_transactions(transactions)
+    return jsonify({
+        "transactions": categorized,
+        "categories_summary": CATEGORIZER.categories_summary(categorized),
+        "merchants_summary": CATEGORIZER.merchants_summary(categorized)
+    })
 
 
 '''
@@ -0,0 +1,78 @@
+# backend/benchmark_text_backend.py
+# Compares every text backend against pdfplumber on the raw PDFs:
+#   1. page text must be the identical string, timed per backend
+#   2. each extractor run with each backend must produce identical output
+# Usage: python benchmark_text_backend.py [raw_pdfs_dir]
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import pdfplumber
+
+from app import BankStatementProcessor
+from pdf_extractor.text_backends import TEXT_BACKENDS
+
+project_root = Path(__file__).parent.parent
+raw_pdf_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else project_root / "data" / "raw_pdfs"
+
+text_totals = {name: 0.0 for name in TEXT_BACKENDS}
+extract_totals = {name: 0.0 for name in TEXT_BACKENDS}
+text_mismatches = []
+extract_mismatches = []
+pdf_count = 0
+page_count = 0
+
+print(f"Benchmarking text backends on: {raw_pdf_dir}")
+print("=" * 80)
+
+for bank_folder in sorted(raw_pdf_dir.iterdir()):
+    extractor_class = BankStatementProcessor.EXTRACTORS.get(bank_folder.name.lower())
+    if not bank_folder.is_dir() or not extractor_class:
+        continue
+
+    for pdf_file in sorted(bank_folder.glob("*.pdf")):
+        pdf_count += 1
+
+        # Text layer, page by page; each backend gets a fresh handle so no
+        # backend benefits from another's parsed pages
+        texts = {}
+        for name, backend in TEXT_BACKENDS.items():
+            with pdfplumber.open(pdf_file) as pdf:
+                start = time.perf_counter()
+                texts[name] = [backend.extract_text(page) for page in pdf.pages]
+                text_totals[name] += time.perf_counter() - start
+        page_count += len(texts["pdfplumber"])
+        for page_number, text in enumerate(texts["pdfplumber"], 1):
+            if any(texts[name][page_number - 1] != text for name in TEXT_BACKENDS):
+                text_mismatches.append(f"{pdf_file} page {page_number}")
+
+        # Full extraction
+        results = {}
+        for name in TEXT_BACKENDS:
+            start = time.perf_counter()
+            # Extractors print progress; keep the report readable
+            with redirect_stdout(StringIO()):
+                results[name] = extractor_class(str(pdf_file), text_backend=name).extract()
+            extract_totals[name] += time.perf_counter() - start
+        same = all(result == results["pdfplumber"] for result in results.values())
+        if not same:
+            extract_mismatches.append(pdf_file)
+
+        count = len(results["pdfplumber"]["transactions"])
+        print(f"{'OK  ' if same else 'DIFF'} {bank_folder.name}/{pdf_file.name}: "
+              f"{len(texts['pdfplumber'])} pages, {count} txns")
+
+print("=" * 80)
+print(f"PDFs: {pdf_count}, pages: {page_count}")
+print(f"Text layer: {len(text_mismatches)} page mismatches")
+for name, total in text_totals.items():
+    speedup = text_totals["pdfplumber"] / total if total else 0
+    print(f"  {name:<12} {total:8.2f}s  ({speedup:.2f}x vs pdfplumber)")
+print(f"Extraction: {len(extract_mismatches)} statement mismatches")
+for name, total in extract_totals.items():
+    speedup = extract_totals["pdfplumber"] / total if total else 0
+    print(f"  {name:<12} {total:8.2f}s  ({speedup:.2f}x vs pdfplumber)")
+for mismatch in text_mismatches + extract_mismatches:
+    print(f"  DIFF: {mismatch}")
@@ -0,0 +1,53 @@
+# backend/convert_normalized.py
+# Rewrites v1 normalized JSON files in the v2 compact format, checking that
+# each v2 file reads back to the identical v1 document, and reports the
+# size and load time of both.
+# Usage: python convert_normalized.py [normalized_json_dir] [output_dir]
+#        (output_dir defaults to the input dir, i.e. convert in place)
+import json
+import sys
+import time
+from pathlib import Path
+
+from normalizer.normalized_format import NormalizedStatement, write_normalized
+
+project_root = Path(__file__).parent.parent
+input_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else project_root / "data" / "normalized_json"
+output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else input_dir
+
+v1_bytes = v2_bytes = 0
+v1_seconds = v2_seconds = 0.0
+converted = 0
+mismatches = []
+
+for path in sorted(input_dir.glob("*_normalized.json")):
+    start = time.perf_counter()
+    with open(path, 'r') as f:
+        document = json.load(f)
+    elapsed = time.perf_counter() - start
+    if document.get("format_version", 1) >= 2:
+        continue
+
+    v1_bytes += path.stat().st_size
+    v1_seconds += elapsed
+
+    output_path = output_dir / path.name
+    write_normalized(output_path, document, document.get("transactions", []))
+    v2_bytes += output_path.stat().st_size
+
+    start = time.perf_counter()
+    statement = NormalizedStatement.load(output_path)
+    v2_seconds += time.perf_counter() - start
+
+    if statement.to_v1() != document:
+        mismatches.append(path.name)
+    converted += 1
+
+print(f"Converted {converted} files into {output_dir}")
+if converted:
+    print(f"  v1: {v1_bytes / 1024:10.1f} KiB  {v1_seconds * 1000:8.1f} ms to load")
+    print(f"  v2: {v2_bytes / 1024:10.1f} KiB  {v2_seconds * 1000:8.1f} ms to load "
+          f"({v1_bytes / v2_bytes:.1f}x smaller, {v1_seconds / v2_seconds:.1f}x faster)")
+print(f"Round-trip mismatches: {len(mismatches)}")
+for name in mismatches:
+    print(f"  DIFF: {name}")
@@ -4,6 +4,7 @@
 const fs = require('fs').promises;
 const path = require('path');
 const { MongoClient } = require('mongodb');
+const { expandNormalized } = require('./normalized_format');
 
 const MONGO_URI = 'mongodb://localhost:27017';
 const DB_NAME = 'bankfusion_db';
@@ -291,7 +292,7 @@ class BankWiseImporter {
   async importFile(filePath, filename, bank, collectionName) {
     try {
       const content = await fs.readFile(filePath, 'utf8');
-      const jsonData = JSON.parse(content);
+      const jsonData = expandNormalized(JSON.parse(content));
       
       const normalized = this.normalizeStatement(jsonData, filename);
       
@@ -347,7 +348,7 @@ class BankWiseImporter {
         try {
           const filePath = path.join(dirPath, file);
           const content = await fs.readFile(filePath, 'utf8');
-          const jsonData = JSON.parse(content);
+          const jsonData = expandNormalized(JSON.parse(content));
           const bank = this.detectBank(file, jsonData);
           
           if (!filesByBank[bank]) {
@@ -4,6 +4,7 @@
 const fs = require('fs').promises;
 const path = require('path');
 const { MongoClient } = require('mongodb');
+const { expandNormalized } = require('./normalized_format');
 
 // MongoDB Configuration
 const MONGO_URI = 'mongodb://localhost:27017';
@@ -176,7 +177,7 @@ class NormalizedDataImporter {
   async importFile(filePath, filename) {
     try {
       const content = await fs.readFile(filePath, 'utf8');
-      const jsonData = JSON.parse(content);
+      const jsonData = expandNormalized(JSON.parse(content));
       
       const normalized = this.normalizeData(jsonData, filename);
       
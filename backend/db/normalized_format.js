@@ -0,0 +1,36 @@
+// File: backend/db/normalized_format.js
+// Reads normalized JSON in either format written by the Python pipeline:
+// v1 has a "transactions" array of row objects; v2 (format_version 2) keeps
+// per-row fields as parallel "columns" and stores values shared by every
+// row once in "row_constants"; fields listed in "paise_columns" hold integer
+// paise. expandNormalized() turns v2 back into v1 rows with rupee amounts.
+
+function expandNormalized(data) {
+  if (!data || !(data.format_version >= 2)) {
+    return data;
+  }
+
+  const { fields, row_constants: constants, row_count: rowCount } = data;
+  const columns = { ...data.columns };
+  for (const field of data.paise_columns || []) {
+    columns[field] = columns[field].map(paise => paise / 100);
+  }
+  const transactions = new Array(rowCount);
+  for (let i = 0; i < rowCount; i++) {
+    const tx = {};
+    for (const field of fields) {
+      tx[field] = field in columns ? columns[field][i] : constants[field];
+    }
+    transactions[i] = tx;
+  }
+
+  return {
+    bank_name: data.bank_name,
+    account_number: data.account_number,
+    account_holder: data.account_holder,
+    statement_period: data.statement_period,
+    transactions
+  };
+}
+
+module.exports = { expandNormalized };
@@ -1,4 +1,17 @@
 # backend/normalizer/__init__.py
 from .transaction_normalizer import TransactionNormalizer
+from .date_parser import DateParser
+from .amounts import parse_paise, to_paise, to_rupees
+from .records import NormalizedTransaction, Transaction, record_default
+from .keyword_automaton import CATEGORY_KEYWORDS, KeywordAutomaton, KeywordTagger
+from .categorizer import MERCHANT_CATEGORIES, TransactionCategorizer
+from .merchants import BANK_TOKEN_RULES, MerchantCanonicalizer
+from .normalized_format import (NormalizedStatement, NormalizedWriter, iter_ndjson, read_normalized,
+                                write_normalized, write_normalized_stream, write_normalized_version)
 
-__all__ = ['TransactionNormalizer']
\ No newline at end of file
+__all__ = ['TransactionNormalizer', 'DateParser', 'CATEGORY_KEYWORDS', 'KeywordAutomaton', 'KeywordTagger',
+           'MERCHANT_CATEGORIES', 'TransactionCategorizer', 'BANK_TOKEN_RULES', 'MerchantCanonicalizer',
+           'NormalizedStatement', 'NormalizedWriter', 'iter_ndjson', 'read_normalized', 'write_normalized',
+           'write_normalized_stream', 'write_normalized_version',
+           'parse_paise', 'to_paise', 'to_rupees',
+           'Transaction', 'NormalizedTransaction', 'record_default']
\ No newline at end of file
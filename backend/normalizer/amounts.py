@@ -0,0 +1,71 @@
+# backend/normalizer/amounts.py
+# Fixed-point amounts: integer paise (1/100 rupee) inside the pipeline,
+# rupee floats only at the JSON boundary, so sums and balance checks are
+# exact integer arithmetic
+import math
+from typing import Union
+
+# Characters an amount string is reduced to before parsing: "62,541.51Cr",
+# "Rs. 1,813.63" and "(Dr) 500" keep only their digits, sign, point and commas
+_AMOUNT_CHARS = frozenset('0123456789.,-')
+# Trailing markers stripped on the fast path
+_SUFFIX_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz() '
+
+
+def parse_paise(value) -> int:
+    """
+    Amount string or number to integer paise, 0 when it isn't one
+    Same reading as BasePDFExtractor.parse_amount always had (strip
+    everything but digits, '.', ',' and '-', drop the commas, then parse an
+    optionally negative decimal) but without a regex or a float: the rupee
+    and paise parts are read as integers. A third decimal rounds half up.
+    """
+    if not value:
+        return 0
+    if isinstance(value, (int, float)):
+        return to_paise(value)
+
+    # Fast path: the usual "1,813.63" / "62,541.51Cr" / "500.00 (Dr)" shapes
+    # only need commas dropped and a letter suffix stripped
+    text = str(value).replace(',', '').strip().rstrip(_SUFFIX_CHARS)
+    negative = text.startswith('-')
+    if negative:
+        text = text[1:]
+    rupees, _, fraction = text.partition('.')
+    if not _is_decimal(rupees, fraction):
+        # Anything else goes through the full character filter
+        text = ''.join(filter(_AMOUNT_CHARS.__contains__, str(value))).replace(',', '')
+        negative = text.startswith('-')
+        if negative:
+            text = text[1:]
+        rupees, _, fraction = text.partition('.')
+        if not _is_decimal(rupees, fraction):
+            return 0
+
+    paise = int(rupees or 0) * 100 + int(fraction[:2].ljust(2, '0'))
+    if len(fraction) > 2 and fraction[2] >= '5':
+        paise += 1
+    return -paise if negative else paise
+
+
+def _is_decimal(rupees: str, fraction: str) -> bool:
+    """ASCII digits on at least one side of the point, nothing else"""
+    if not rupees and not fraction:
+        return False
+    return (not rupees or (rupees.isascii() and rupees.isdigit())) and \
+        (not fraction or (fraction.isascii() and fraction.isdigit()))
+
+
+def to_paise(amount: Union[int, float, None]) -> int:
+    """Rupee number to integer paise; NaN and infinities, like None, are 0"""
+    if not amount:
+        return 0
+    paise = amount * 100
+    if isinstance(paise, float) and not math.isfinite(paise):
+        return 0
+    return round(paise)
+
+
+def to_rupees(paise: int) -> float:
+    """Integer paise to the rupee float written to JSON (the nearest double, e.g. 181363 -> 1813.63)"""
+    return paise / 100
@@ -0,0 +1,265 @@
+# backend/normalizer/categorizer.py
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from .amounts import parse_paise, to_rupees
+from .keyword_automaton import CATEGORY_KEYWORDS, OTHER_CATEGORY, KeywordAutomaton
+from .merchants import MERCHANTS, MerchantCanonicalizer, skeleton
+
+# Merchant -> category overrides, hand-written for the kinds of row the
+# keyword table gets wrong (UPI payees, POS terminals, MEDR billers, "TRF
+# TO ..." narrations): a leading "UPI"/"NEFT" makes every merchant a
+# Transfer, POS merchants without a keyword fall to Other, and "gas" in
+# "megastore" reads as Utilities. Categories are the CATEGORY_KEYWORDS set
+# only. Mirrored by MERCHANT_CATEGORIES in
+# frontend/supabase/functions/process-statement/index.ts
+MERCHANT_CATEGORIES: Dict[str, str] = {
+    # Food & Dining
+    "barbeque nation": "Food & Dining",
+    "cafe coffee day": "Food & Dining",
+    "dominos": "Food & Dining",
+    "dhaba": "Food & Dining",
+    "haldiram": "Food & Dining",
+    "kfc": "Food & Dining",
+    "mcdonald": "Food & Dining",
+    "pizza hut": "Food & Dining",
+    "starbucks": "Food & Dining",
+    "subway": "Food & Dining",
+    "swiggy": "Food & Dining",
+    "zomato": "Food & Dining",
+    # Travel, fuel included
+    "bharat petroleum": "Travel",
+    "bmrc": "Travel",
+    "bpcl": "Travel",
+    "dmrc": "Travel",
+    "fastag": "Travel",
+    "goibibo": "Travel",
+    "hp petrol": "Travel",
+    "hpcl": "Travel",
+    "indian oil": "Travel",
+    "indianoil": "Travel",
+    "irctc": "Travel",
+    "makemytrip": "Travel",
+    "meru cabs": "Travel",
+    "metro card": "Travel",
+    "metro rch": "Travel",
+    "ola cabs": "Travel",
+    "railway ticket": "Travel",
+    "rapido": "Travel",
+    "uber": "Travel",
+    # Rent
+    "house rent": "Rent",
+    "monthly rent": "Rent",
+    "rent payment": "Rent",
+    # Utilities
+    "act fiber": "Utilities",
+    "airtel": "Utilities",
+    "bescom": "Utilities",
+    "bsnl": "Utilities",
+    "gas cylinder": "Utilities",
+    "hathway": "Utilities",
+    "jio fiber": "Utilities",
+    "jio recharge": "Utilities",
+    "msedcl": "Utilities",
+    "reliancejio": "Utilities",
+    "tata sky": "Utilities",
+    "tpddl": "Utilities",
+    "vi recharge": "Utilities",
+    "vodafone": "Utilities",
+    # Shopping
+    "ajio": "Shopping",
+    "amazon": "Shopping",
+    "big bazaar": "Shopping",
+    "bigbasket": "Shopping",
+    "decathlon": "Shopping",
+    "dmart": "Shopping",
+    "flipkart": "Shopping",
+    "grofers": "Shopping",
+    "kirana": "Shopping",
+    "lifestyle": "Shopping",
+    "meesho": "Shopping",
+    "more megastore": "Shopping",
+    "more stores": "Shopping",
+    "more supermarket": "Shopping",
+    "myntra": "Shopping",
+    "nature s basket": "Shopping",
+    "pantaloons": "Shopping",
+    "reliance": "Shopping",
+    "shopper s stop": "Shopping",
+    "shoppers stop": "Shopping",
+    "spencer": "Shopping",
+    "westside": "Shopping",
+    # Entertainment
+    "amazon prime": "Entertainment",
+    "amazonprime": "Entertainment",
+    "book my show": "Entertainment",
+    "bookmyshow": "Entertainment",
+    "cinepolis": "Entertainment",
+    "google play": "Entertainment",
+    "hotstar": "Entertainment",
+    "inox": "Entertainment",
+    "netflix": "Entertainment",
+    "pvr": "Entertainment",
+    "sonyliv": "Entertainment",
+    "spotify": "Entertainment",
+    "youtube premium": "Entertainment",
+    "zee5": "Entertainment",
+    # Healthcare
+    "apollo": "Healthcare",
+    "max health": "Healthcare",
+    "medplus": "Healthcare",
+    "netmeds": "Healthcare",
+    "practo": "Healthcare",
+    # Transfers
+    "paytm": "Transfers",
+    "phonepe": "Transfers",
+    # ATM
+    "atm cash": "ATM",
+    "atm wdl": "ATM",
+    "cash dep": "ATM",
+    "cwdr/": "ATM",
+    # Salary
+    "sal credit": "Salary",
+    "salary credit": "Salary",
+    # Insurance
+    "hdfc life": "Insurance",
+    "icici pru": "Insurance",
+    "lic prem": "Insurance",
+    # EMI
+    "homecrindfin": "EMI",
+}
+
+
+class TransactionCategorizer:
+    """
+    Deterministic category for each transaction, no external service
+    One automaton scan of the description finds both merchants and
+    category keywords:
+    - the longest merchant found wins ("amazon prime" over "amazon")
+    - else the first category, in CATEGORY_KEYWORDS order, with a keyword in
+      the description, as the edge function's categorizeTransaction() does
+    - else "Other"
+    Descriptions are matched lower-cased with whitespace runs collapsed, so
+    names wrapped across lines still match. Results are memoized per
+    description skeleton (reference numbers masked, which no keyword
+    contains) in a bounded LRU, and categorize_transactions() also tags each
+    row with its canonical merchant.
+    """
+
+    def __init__(self, merchant_categories: Dict[str, str] = None,
+                 category_keywords: Dict[str, List[str]] = None,
+                 merchants: MerchantCanonicalizer = None, cache_size: int = 4096):
+        merchant_categories = MERCHANT_CATEGORIES if merchant_categories is None else merchant_categories
+        category_keywords = CATEGORY_KEYWORDS if category_keywords is None else category_keywords
+        self.categories = list(category_keywords)
+
+        pairs: List[Tuple[str, tuple]] = [
+            (merchant.lower(), ('merchant', len(merchant), category))
+            for merchant, category in merchant_categories.items()
+        ]
+        for category, keywords in category_keywords.items():
+            pairs += [(keyword, ('category', category)) for keyword in keywords]
+        self.automaton = KeywordAutomaton(pairs)
+        self.merchants = MERCHANTS if merchants is None else merchants
+        self._categorize_skeleton = lru_cache(maxsize=cache_size)(self._scan)
+
+    def categorize(self, description: str) -> str:
+        if not description:
+            return OTHER_CATEGORY
+        return self._categorize_skeleton(skeleton(description))
+
+    def _scan(self, description: str) -> str:
+        found = self.automaton.scan(" ".join(description.lower().split()))
+
+        merchants = [label for label in found if label[0] == 'merchant']
+        if merchants:
+            # Longest name first; ties broken by category name to stay deterministic
+            return max(merchants, key=lambda label: (label[1], label[2]))[2]
+        for category in self.categories:
+            if ('category', category) in found:
+                return category
+        return OTHER_CATEGORY
+
+    def categorize_transactions(self, transactions: Iterable[Dict]) -> List[Dict]:
+        """
+        Copies of the transactions with "category" and "merchant" keys added
+        Posted rows may carry a description or bank_name that isn't a string
+        (a number, null); those are matched as their text
+        """
+        categorized = []
+        for transaction in transactions:
+            description = str(transaction.get("description") or "")
+            categorized.append({
+                **transaction,
+                "category": self.categorize(description),
+                "merchant": self.merchants.canonicalize(description, str(transaction.get("bank_name") or ""))
+            })
+        return categorized
+
+    AMOUNT_FIELDS = ("debit", "credit", "amount")
+
+    @classmethod
+    def has_valid_amounts(cls, transaction: Dict) -> bool:
+        """
+        True when every amount field is absent, null, a string or a finite
+        number; booleans, lists, objects, NaN and Infinity (which Flask's
+        JSON parser accepts) are not amounts, nor are integers too large to
+        write back as a rupee float
+        """
+        for field in cls.AMOUNT_FIELDS:
+            value = transaction.get(field)
+            if value is None or isinstance(value, str):
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+            try:
+                if not math.isfinite(value * 100):
+                    return False
+            except OverflowError:
+                return False
+        return True
+
+    @staticmethod
+    def debit_paise(transaction: Dict) -> int:
+        """
+        Money out in paise: the raw "debit" field, or "amount" on a normalized DEBIT row
+        Posted rows may carry amounts as strings ("12.50", "1,250.00"); those
+        read as the extractors read them, and anything unreadable as 0
+        """
+        if "debit" in transaction:
+            return parse_paise(transaction.get("debit"))
+        if transaction.get("transaction_type") == "DEBIT":
+            return parse_paise(transaction.get("amount"))
+        return 0
+
+    @classmethod
+    def categories_summary(cls, transactions: Iterable[Dict]) -> Dict[str, Dict]:
+        """
+        {category: {"count", "total"}} in the edge function's shape: count is
+        every transaction in the category, total is the debits only, summed
+        exactly in paise
+        """
+        counts: Dict[str, int] = {}
+        totals: Dict[str, int] = {}
+        for transaction in transactions:
+            category = transaction.get("category", OTHER_CATEGORY)
+            counts[category] = counts.get(category, 0) + 1
+            totals[category] = totals.get(category, 0) + cls.debit_paise(transaction)
+        return {category: {"count": count, "total": to_rupees(totals[category])}
+                for category, count in counts.items()}
+
+    @classmethod
+    def merchants_summary(cls, transactions: Iterable[Dict]) -> Dict[str, Dict]:
+        """{merchant: {"count", "total"}} over categorize_transactions() rows, same totals as categories_summary"""
+        counts: Dict[str, int] = {}
+        totals: Dict[str, int] = {}
+        for transaction in transactions:
+            merchant = transaction.get("merchant", '')
+            counts[merchant] = counts.get(merchant, 0) + 1
+            totals[merchant] = totals.get(merchant, 0) + cls.debit_paise(transaction)
+        return {merchant: {"count": count, "total": to_rupees(totals[merchant])}
+                for merchant, count in counts.items()}
+
+
+CATEGORIZER = TransactionCategorizer()
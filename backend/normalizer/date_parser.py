@@ -0,0 +1,113 @@
+# backend/normalizer/date_parser.py
+import re
+from datetime import date
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+MONTHS = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+
+_DAY = r'(\d{1,2})'
+_MONTH = r'(\d{1,2})'
+_MON = r'([A-Za-z]{3})'
+_YY = r'(\d{2})'
+_YYYY = r'(\d{4})'
+
+# (name, pattern, group order): the pattern must match the whole stripped
+# string; group order says which captured group is day, month and year
+DATE_FORMATS: List[Tuple[str, str, str]] = [
+    ('%d/%m/%y', rf'{_DAY}/{_MONTH}/{_YY}', 'dmy'),
+    ('%d/%m/%Y', rf'{_DAY}/{_MONTH}/{_YYYY}', 'dmy'),
+    ('%d-%m-%y', rf'{_DAY}-{_MONTH}-{_YY}', 'dmy'),
+    ('%d-%m-%Y', rf'{_DAY}-{_MONTH}-{_YYYY}', 'dmy'),
+    ('%Y-%m-%d', rf'{_YYYY}-{_MONTH}-{_DAY}', 'ymd'),
+    ('%Y/%m/%d', rf'{_YYYY}/{_MONTH}/{_DAY}', 'ymd'),
+    ('%d-%b-%y', rf'{_DAY}-{_MON}-{_YY}', 'dmy'),
+    ('%d-%b-%Y', rf'{_DAY}-{_MON}-{_YYYY}', 'dmy'),
+    ('%d %b %Y', rf'{_DAY}\s+{_MON}\s+{_YYYY}', 'dmy'),
+    ('%d %b %y', rf'{_DAY}\s+{_MON}\s+{_YY}', 'dmy'),
+    # SBI value/post date cell: "24-Nov-25\n(24-Nov-2025)", the bracketed
+    # four-digit date wins
+    ('sbi_dual', rf'\d{{1,2}}-[A-Za-z]{{3}}-\d{{2}}\s*\({_DAY}-{_MON}-{_YYYY}\)', 'dmy'),
+]
+
+
+class DateFormat:
+    """One compiled date format; parse() returns ISO yyyy-mm-dd or None"""
+    __slots__ = ('name', 'regex', 'day', 'month', 'year')
+
+    def __init__(self, name: str, pattern: str, order: str):
+        self.name = name
+        self.regex = re.compile(pattern)
+        self.day = order.index('d') + 1
+        self.month = order.index('m') + 1
+        self.year = order.index('y') + 1
+
+    def parse(self, text: str) -> Optional[str]:
+        match = self.regex.fullmatch(text)
+        if not match:
+            return None
+
+        month = match.group(self.month)
+        month = int(month) if month.isdigit() else MONTHS.get(month.lower())
+        year = match.group(self.year)
+        if len(year) == 2:
+            # strptime's %y pivot: 69-99 are 19xx, 00-68 are 20xx
+            year = int(year)
+            year += 1900 if year >= 69 else 2000
+        else:
+            year = int(year)
+            # strptime rejects year 0; "0024" style years were read as 20xx
+            if year == 0:
+                return None
+            if year < 100:
+                year += 2000
+        if not month:
+            return None
+
+        try:
+            return date(year, month, int(match.group(self.day))).isoformat()
+        except ValueError:
+            return None
+
+
+class DateParser:
+    """
+    Date normalizer for one statement
+    infer() tries every format on a sample of the statement's dates and puts
+    the one that fits most of them first, so the rest of the statement is
+    parsed by a single precompiled regex. Dates it doesn't fit still try the
+    other formats; a date no format fits is returned unchanged.
+    """
+    SAMPLE_SIZE = 20
+
+    def __init__(self, formats: List[DateFormat] = None):
+        self.formats = formats if formats is not None else [DateFormat(*spec) for spec in DATE_FORMATS]
+
+    @classmethod
+    def infer(cls, date_strings: Iterable[str]) -> 'DateParser':
+        parser = cls()
+        sample = list(islice((text.strip() for text in date_strings if isinstance(text, str) and text.strip()),
+                             cls.SAMPLE_SIZE))
+        if not sample:
+            return parser
+
+        scores = [sum(1 for text in sample if date_format.parse(text)) for date_format in parser.formats]
+        best = max(range(len(scores)), key=lambda index: scores[index])
+        if scores[best]:
+            parser.formats.insert(0, parser.formats.pop(best))
+        return parser
+
+    @property
+    def inferred_format(self) -> str:
+        return self.formats[0].name
+
+    def parse(self, date_str: str) -> str:
+        if not isinstance(date_str, str):
+            return date_str
+        text = date_str.strip()
+        for date_format in self.formats:
+            parsed = date_format.parse(text)
+            if parsed:
+                return parsed
+        return date_str
@@ -0,0 +1,142 @@
+# backend/normalizer/keyword_automaton.py
+from collections import deque
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# Category keyword table, in precedence order; mirrors CATEGORY_KEYWORDS in
+# frontend/supabase/functions/process-statement/index.ts
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "Food & Dining": ["swiggy", "zomato", "restaurant", "food", "cafe", "pizza", "burger", "hotel", "dining", "kitchen", "eatery", "bakery"],
+    "Travel": ["uber", "ola", "flight", "train", "irctc", "makemytrip", "goibibo", "travel", "airlines", "cab", "taxi", "metro", "bus"],
+    "Rent": ["rent", "lease", "landlord", "housing", "apartment", "flat", "pg accommodation"],
+    "Utilities": ["electricity", "water", "gas", "internet", "broadband", "wifi", "phone", "mobile", "recharge", "dth", "postpaid", "prepaid", "bill payment"],
+    "Shopping": ["amazon", "flipkart", "myntra", "ajio", "shopping", "mall", "store", "retail", "mart", "bazaar", "purchase"],
+    "Entertainment": ["netflix", "spotify", "prime", "hotstar", "movie", "cinema", "theatre", "game", "music", "subscription"],
+    "Healthcare": ["hospital", "medical", "pharmacy", "doctor", "clinic", "health", "medicine", "diagnostic", "lab"],
+    "Transfers": ["upi", "imps", "neft", "rtgs", "transfer", "sent to", "received from", "p2p"],
+    "ATM": ["atm", "cash withdrawal", "cash deposit"],
+    "Salary": ["salary", "payroll", "wages", "income"],
+    "Investment": ["mutual fund", "sip", "stock", "share", "trading", "investment", "zerodha", "groww", "upstox"],
+    "Insurance": ["insurance", "lic", "policy", "premium"],
+    "EMI": ["emi", "loan", "instalment", "installment"],
+}
+OTHER_CATEGORY = "Other"
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of (keyword, label) pairs
+    scan() walks the text once and returns the labels of every keyword that
+    occurs in it as a substring, overlapping occurrences included: the same
+    answer as "keyword in text" for each keyword, in one pass. Failure
+    links are folded into a full transition table at build time, so each
+    char is a single dict lookup.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Hashable]]):
+        goto: List[Dict[str, int]] = [{}]
+        labels: List[set] = [set()]
+
+        for keyword, label in keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    goto.append({})
+                    labels.append(set())
+                    next_state = len(goto) - 1
+                    goto[state][char] = next_state
+                state = next_state
+            labels[state].add(label)
+
+        # Breadth-first, so a state's failure target is always complete first
+        fail = [0] * len(goto)
+        delta = [dict(edges) for edges in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, target in delta[fail[state]].items():
+                delta[state].setdefault(char, target)
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                labels[child] |= labels[fail[child]]
+                queue.append(child)
+
+        self._delta = delta
+        self._labels: List[Optional[FrozenSet]] = [frozenset(found) if found else None for found in labels]
+
+    def scan(self, text: str) -> set:
+        delta = self._delta
+        labels = self._labels
+        found = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if labels[state] is not None:
+                found |= labels[state]
+        return found
+
+    def matches(self, text: str) -> bool:
+        """Whether any keyword occurs in text; stops at the first one"""
+        delta = self._delta
+        labels = self._labels
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if labels[state] is not None:
+                return True
+        return False
+
+
+class KeywordTagger:
+    """
+    Transaction type and category from one automaton scan per string
+    Precedence is the same as the keyword loops it replaces:
+    - type: CREDIT if any credit keyword is in the type or the description,
+      else DEBIT if any debit keyword is, else DEBIT
+    - category: the first category, in table order, with a keyword in the
+      description, else "Other"
+    Strings are matched lower-cased.
+    """
+
+    def __init__(self, credit_keywords: Sequence[str], debit_keywords: Sequence[str],
+                 category_keywords: Dict[str, Sequence[str]] = None):
+        category_keywords = CATEGORY_KEYWORDS if category_keywords is None else category_keywords
+        self.categories = list(category_keywords)
+
+        pairs = [(keyword, ('type', 'CREDIT')) for keyword in credit_keywords]
+        pairs += [(keyword, ('type', 'DEBIT')) for keyword in debit_keywords]
+        for category, keywords in category_keywords.items():
+            pairs += [(keyword, ('category', category)) for keyword in keywords]
+        self.automaton = KeywordAutomaton(pairs)
+        # Only a credit keyword changes the type, so type-only callers scan
+        # for those alone and stop at the first
+        self.credit_automaton = KeywordAutomaton((keyword, 'CREDIT') for keyword in credit_keywords)
+
+    def scan(self, text: str) -> set:
+        return self.automaton.scan(text.lower()) if text else set()
+
+    def keyword_type(self, found: set) -> str:
+        if ('type', 'CREDIT') in found:
+            return "CREDIT"
+        return "DEBIT"
+
+    def category(self, found: set) -> str:
+        for category in self.categories:
+            if ('category', category) in found:
+                return category
+        return OTHER_CATEGORY
+
+    def transaction_type(self, transaction_type: str, description: str) -> str:
+        """The type tag() returns, without working out the category"""
+        for text in (description, transaction_type):
+            if text and self.credit_automaton.matches(text.lower()):
+                return "CREDIT"
+        return "DEBIT"
+
+    def tag(self, transaction_type: str, description: str) -> Tuple[str, str]:
+        """(type by keywords, category) with a single scan of the description"""
+        found = self.scan(description)
+        category = self.category(found)
+        if ('type', 'CREDIT') not in found:
+            found |= self.scan(transaction_type)
+        return self.keyword_type(found), category
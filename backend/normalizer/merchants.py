@@ -0,0 +1,124 @@
+# backend/normalizer/merchants.py
+import re
+from functools import lru_cache
+from typing import Dict, List, Pattern, Tuple
+
+# Runs of 2+ digits are references, card numbers, terminal ids, dates and
+# times: "UPI-4102-SWIGGY-UPI-9921-OK" and "UPI-7730-SWIGGY-UPI-1180-OK"
+# share the skeleton "UPI-#-SWIGGY-UPI-#-OK". Single digits stay, so names
+# like ZEE5 and 1MG survive, and no category keyword contains such a run
+_DIGIT_RUN = re.compile(r'\d{2,}')
+# Token separators in a skeleton
+_TOKEN_SPLIT = re.compile(r"[\s\-/:.,;_*+#()\[\]]+")
+
+# Per-bank token rules, keyed by normalized bank name:
+# - "strip": patterns removed from the skeleton first (layout debris)
+# - "merchant": (pattern, template) pairs tried in order on the
+#   whitespace-collapsed skeleton; the first match is replaced by
+#   match.expand(template), which keeps only the merchant part
+# Patterns see "#" where the description had a reference number
+_TRANSFER_NARRATION = (r'UPI RRN #\W*(?:TRF (?:TO|FROM) )?(.+)', r'\1')
+BANK_TOKEN_RULES: Dict[str, Dict[str, List]] = {
+    "HDFC": {
+        # Single letter from the previous column wrapped onto its own line
+        "strip": [r'^[A-Z]\n'],
+        "merchant": [
+            (r'^UPI-#-(.+?)(?:@|-UPI-)', r'\1'),
+            (r'^POS #X+# (.+?) POS DEBIT', r'\1'),
+            (r'^NHDF#/(?:BILLDK)?(.+)', r'\1'),
+            # Terminal ids are random letters as well as digits
+            (r'^ATW-#X+#-\S+?-(.+)', r'ATW \1'),
+            (r'^IMPS-#-(.+?)-(?:CORP|[A-Z]{4}-X+#)-', r'\1'),
+            (r'^NEFT (?:CR|DR)-[A-Z]+#-(.+?)-', r'\1'),
+        ],
+    },
+    "SBI": {
+        "merchant": [
+            (r'^UPI-(.+?)-#?$', r'\1'),
+            (r'^POS PURCHASE-(.+?)-?#?$', r'\1'),
+        ],
+    },
+    "AXIS": {
+        "merchant": [_TRANSFER_NARRATION],
+    },
+    "CENTRAL": {
+        # Page footer run into the last row of a page
+        "strip": [r'\.?\s*CARRIED FORWARD.*$'],
+        "merchant": [_TRANSFER_NARRATION],
+    },
+    "BOI": {
+        "merchant": [
+            (r'^MEDR/(.+?)/', r'\1'),
+            (r'^NACH DR INW - (.+?) /', r'NACH \1'),
+            (r'^(CWDR|CWRR|BUPI)/', r'\1'),
+            (r'^SMSChargesQtr', 'SMS CHARGES'),
+        ],
+    },
+    "UNION": {
+        "merchant": [
+            # UPIAR/<ref>/DR/<payee name>/<payee code>/<bank>/<handle>
+            (r'^UPIA[RB]/#/(?:DR|CR)/([^/]+)/', r'\1'),
+            (r'^NEFT:(.+?) FDRLM#', r'NEFT \1'),
+        ],
+    },
+}
+
+
+def skeleton(description: str) -> str:
+    """The description with every reference-number run replaced by "#" """
+    return _DIGIT_RUN.sub('#', description)
+
+
+def _compile_rules(rules: Dict) -> Tuple[List[Pattern], List[Tuple[Pattern, str]]]:
+    strip = [re.compile(pattern) for pattern in rules.get("strip", [])]
+    merchant = [(re.compile(pattern), template) for pattern, template in rules.get("merchant", [])]
+    return strip, merchant
+
+
+class MerchantCanonicalizer:
+    """
+    Canonical merchant name for a transaction description
+    "UPI-#-SWIGGY-UPI-#-OK" (HDFC), "UPI-SWIGGY-#" (SBI) and
+    "UPIAR/#/DR/Swiggy/SWIGGY/SBIN/swiggy@sbi" (Union) are all "SWIGGY":
+    the bank's rules cut the description down to its merchant part, then
+    references (the "#"s), card masks and UPI handles are dropped and the
+    remaining tokens upper-cased. Descriptions no rule matches keep
+    every other token, so they still group by template.
+    Lookups are memoized per (bank, skeleton) in a bounded LRU; skeletons
+    repeat across rows where the raw descriptions never do.
+    """
+
+    def __init__(self, bank_rules: Dict[str, Dict] = None, cache_size: int = 4096):
+        bank_rules = BANK_TOKEN_RULES if bank_rules is None else bank_rules
+        self.rules = {bank: _compile_rules(rules) for bank, rules in bank_rules.items()}
+        self._lookup = lru_cache(maxsize=cache_size)(self._canonicalize)
+
+    def canonicalize(self, description: str, bank_name: str = '') -> str:
+        if not description:
+            return ''
+        return self._lookup(skeleton(description), (bank_name or '').upper())
+
+    def cache_info(self):
+        return self._lookup.cache_info()
+
+    def _canonicalize(self, text: str, bank_name: str) -> str:
+        strip, merchant = self.rules.get(bank_name, ((), ()))
+        for pattern in strip:
+            text = pattern.sub('', text)
+        text = ' '.join(text.split())
+        for pattern, template in merchant:
+            match = pattern.search(text)
+            if match:
+                text = match.expand(template)
+                break
+        return ' '.join(token for token in _TOKEN_SPLIT.split(text.upper()) if self._is_name_token(token))
+
+    @staticmethod
+    def _is_name_token(token: str) -> bool:
+        if not token or '@' in token:
+            return False
+        # Card masks: XXXXXX
+        return not (len(token) >= 4 and token.strip('X') == '')
+
+
+MERCHANTS = MerchantCanonicalizer()
@@ -0,0 +1,253 @@
+# backend/normalizer/normalized_format.py
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+from .amounts import to_paise, to_rupees
+from .records import NormalizedTransaction, record_default
+
+# v1: {header fields, "transactions": [row dicts]}, written with indent=2
+# v2: header fields once, then one array per row field; a field with the
+#     same value on every row (bank_name, account_number) is stored once,
+#     and amount/balance columns are stored as integer paise
+FORMAT_VERSION = 2
+# Versions write_normalized_version() can produce
+FORMAT_VERSIONS = (1, FORMAT_VERSION)
+STATEMENT_FIELDS = ("bank_name", "account_number", "account_holder", "statement_period")
+ROW_FIELDS = ("transaction_date", "description", "amount", "transaction_type",
+              "bank_name", "account_number", "balance")
+# Row fields holding rupee amounts
+AMOUNT_FIELDS = ("amount", "balance")
+# Streamed layouts written by NormalizedWriter:
+# - "json": the v1 document, byte for byte what json.dump(indent=2) writes
+# - "ndjson": the header fields on the first line, then one row per line
+STREAM_FORMATS = ("json", "ndjson")
+
+
+def _paise_column(field: str, transactions: List, values: List):
+    """The column as integer paise, or None if a value wouldn't read back as the same float"""
+    if transactions and all(isinstance(transaction, NormalizedTransaction) for transaction in transactions):
+        # Records already hold the paise their rupee values are made from
+        return [getattr(transaction, f'{field}_paise') for transaction in transactions]
+    paise = []
+    for value in values:
+        if not isinstance(value, float):
+            return None
+        amount = to_paise(value)
+        if to_rupees(amount) != value:
+            return None
+        paise.append(amount)
+    return paise
+
+
+def to_compact(statement_data: Dict, normalized_transactions: List[Dict]) -> Dict:
+    """v2 document for a statement and its normalize_statement() rows"""
+    document = {"format_version": FORMAT_VERSION}
+    for field in STATEMENT_FIELDS:
+        document[field] = statement_data.get(field, '')
+
+    fields = list(normalized_transactions[0]) if normalized_transactions else list(ROW_FIELDS)
+    constants = {}
+    columns = {}
+    paise_columns = []
+    for field in fields:
+        values = [transaction.get(field) for transaction in normalized_transactions]
+        if values and all(value == values[0] for value in values):
+            constants[field] = values[0]
+            continue
+        paise = _paise_column(field, normalized_transactions, values) if field in AMOUNT_FIELDS else None
+        if paise is not None:
+            columns[field] = paise
+            paise_columns.append(field)
+        else:
+            columns[field] = values
+
+    document["row_count"] = len(normalized_transactions)
+    document["fields"] = fields
+    document["row_constants"] = constants
+    document["paise_columns"] = paise_columns
+    document["columns"] = columns
+    return document
+
+
+def write_normalized(path, statement_data: Dict, normalized_transactions: List[Dict]):
+    """Write the v2 document compactly; the temp file + rename keeps readers off half-written files"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per process, as in NormalizedWriter: pool workers may write the same output name
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(to_compact(statement_data, normalized_transactions), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class NormalizedWriter:
+    """
+    Write a normalized statement row by row, e.g. from normalize_iter()
+    Only the row being written is held in memory, so a statement of any
+    length is written in constant space; the columnar v2 layout needs every
+    row up front and isn't streamable. The file appears, via a temp file and
+    rename, only when the writer is closed without an error.
+    """
+
+    def __init__(self, path, statement_data: Dict, fmt: str = "json"):
+        if fmt not in STREAM_FORMATS:
+            raise ValueError(f"Unknown stream format: {fmt}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Per process: pool workers may be writing the same output name
+        self._tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        self._file = open(self._tmp_path, 'w')
+
+        header = {field: statement_data.get(field, '') for field in STATEMENT_FIELDS}
+        if fmt == "ndjson":
+            self._file.write(json.dumps(header, separators=(',', ':')) + "\n")
+        else:
+            self._file.write(json.dumps(header, indent=2)[:-2] + ',\n  "transactions": [')
+
+    def write(self, transaction):
+        if self.fmt == "ndjson":
+            self._file.write(json.dumps(transaction, separators=(',', ':'), default=record_default) + "\n")
+        else:
+            row = json.dumps(transaction, indent=2, default=record_default).replace('\n', '\n    ')
+            self._file.write((',\n    ' if self.count else '\n    ') + row)
+        self.count += 1
+
+    def write_all(self, transactions: Iterable) -> int:
+        for transaction in transactions:
+            self.write(transaction)
+        return self.count
+
+    def close(self):
+        if self.fmt == "json":
+            self._file.write('\n  ]\n}' if self.count else ']\n}')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Drop the partial file"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> 'NormalizedWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_normalized_stream(path, statement_data: Dict, normalized_transactions: Iterable,
+                            fmt: str = "json") -> int:
+    """Write rows as they come from an iterator; returns the row count"""
+    with NormalizedWriter(path, statement_data, fmt) as writer:
+        return writer.write_all(normalized_transactions)
+
+
+def write_normalized_version(path, statement_data: Dict, normalized_transactions: List,
+                             format_version: int = FORMAT_VERSION):
+    """Write the statement as a v1 (indent=2) or v2 (compact columns) document"""
+    if format_version not in FORMAT_VERSIONS:
+        raise ValueError(f"Unknown normalized format version: {format_version}")
+    if format_version == 1:
+        write_normalized_stream(path, statement_data, normalized_transactions, "json")
+    else:
+        write_normalized(path, statement_data, normalized_transactions)
+
+
+def iter_ndjson(path) -> Iterator[Dict]:
+    """Rows of an NDJSON normalized file, one line at a time (the header line is skipped)"""
+    with open(path, 'r') as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class NormalizedStatement:
+    """
+    A loaded normalized statement, v1, v2 or NDJSON
+    Transactions stay as columns until asked for: rows() builds today's row
+    dicts one at a time, transactions builds them all, and column() reads a
+    single field without building any row. Amount columns stored as paise
+    read back as rupee floats; column_paise() gives the integers.
+    """
+
+    def __init__(self, document: Dict):
+        self.header = {field: document.get(field, '') for field in STATEMENT_FIELDS}
+        if document.get("format_version", 1) >= 2:
+            self.fields = document["fields"]
+            self.row_constants = document["row_constants"]
+            self.row_count = document["row_count"]
+            self.columns = dict(document["columns"])
+            # Converted to rupees the first time column() is asked for them
+            self.paise = {field: self.columns.pop(field) for field in document.get("paise_columns", [])}
+        else:
+            transactions = document.get("transactions", [])
+            self.fields = list(transactions[0]) if transactions else list(ROW_FIELDS)
+            self.row_constants = {}
+            self.columns = {field: [transaction.get(field) for transaction in transactions]
+                            for field in self.fields}
+            self.row_count = len(transactions)
+            self.paise = {}
+
+    @classmethod
+    def load(cls, path) -> 'NormalizedStatement':
+        with open(path, 'r') as f:
+            if Path(path).suffix == '.ndjson':
+                header = json.loads(f.readline())
+                return cls({**header, "transactions": [json.loads(line) for line in f if line.strip()]})
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def column(self, field: str) -> List:
+        if field not in self.columns and field in self.paise:
+            self.columns[field] = [to_rupees(amount) for amount in self.paise[field]]
+        if field in self.columns:
+            return self.columns[field]
+        return [self.row_constants[field]] * self.row_count
+
+    def column_paise(self, field: str) -> List[int]:
+        """An amount column as integer paise, for exact sums and balance checks"""
+        if field in self.paise:
+            return self.paise[field]
+        return [to_paise(amount) for amount in self.column(field)]
+
+    def row(self, index: int) -> Dict:
+        return {
+            field: self.column(field)[index] if field not in self.row_constants else self.row_constants[field]
+            for field in self.fields
+        }
+
+    def rows(self) -> Iterator[Dict]:
+        columns = [(field, self.column(field) if field not in self.row_constants else None)
+                   for field in self.fields]
+        for index in range(self.row_count):
+            yield {
+                field: values[index] if values is not None else self.row_constants[field]
+                for field, values in columns
+            }
+
+    @property
+    def transactions(self) -> List[Dict]:
+        return list(self.rows())
+
+    def to_v1(self) -> Dict:
+        """The v1 document: header fields plus row dicts"""
+        return {**self.header, "transactions": self.transactions}
+
+
+def read_normalized(path) -> Dict:
+    """Load a v1, v2 or NDJSON normalized file as the v1 document shape"""
+    return NormalizedStatement.load(path).to_v1()
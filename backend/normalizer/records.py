@@ -0,0 +1,167 @@
+# backend/normalizer/records.py
+from typing import Any, Dict, Iterator, Tuple
+
+from .amounts import to_paise, to_rupees
+
+
+class _Record:
+    """
+    Base for the slotted transaction records
+    One object with a fixed slot per field instead of a dict per row. The
+    records still read like the dicts they replace (get(), [], "in", keys()),
+    and to_dict() / record_default() turn them back into the same dict, in
+    the same key order, for JSON.
+    Amounts are held as integer paise in *_paise slots; the dict-style
+    access is the JSON boundary and reads and writes them as rupee floats
+    under their JSON names (debit, amount, ...). Code inside the pipeline
+    uses the *_paise attributes and never converts.
+    """
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def values(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self.FIELDS, self.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_Record':
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data})
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _Record):
+            return self.FIELDS == other.FIELDS and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{field}={value!r}' for field, value in self.items())})"
+
+
+def _rupees(slot: str) -> property:
+    """Rupee view of a paise slot, for the dict-style access under the JSON field name"""
+    def get(record) -> float:
+        return to_rupees(getattr(record, slot))
+
+    def set(record, value):
+        setattr(record, slot, to_paise(value))
+
+    return property(get, set)
+
+
+class Transaction(_Record):
+    """One extracted row, as every extractor appends to self.transactions"""
+    FIELDS = ('date', 'description', 'debit', 'credit', 'balance', 'transaction_type')
+    __slots__ = ('date', 'description', 'debit_paise', 'credit_paise', 'balance_paise', 'transaction_type')
+
+    def __init__(self, date: str = '', description: str = '', debit_paise: int = 0, credit_paise: int = 0,
+                 balance_paise: int = 0, transaction_type: str = ''):
+        self.date = date
+        self.description = description
+        self.debit_paise = debit_paise
+        self.credit_paise = credit_paise
+        self.balance_paise = balance_paise
+        self.transaction_type = transaction_type
+
+    debit = _rupees('debit_paise')
+    credit = _rupees('credit_paise')
+    balance = _rupees('balance_paise')
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Transaction':
+        """From a JSON row, amounts in rupees"""
+        return cls(data.get('date', ''), data.get('description', ''), to_paise(data.get('debit', 0.0)),
+                   to_paise(data.get('credit', 0.0)), to_paise(data.get('balance', 0.0)),
+                   data.get('transaction_type', ''))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "date": self.date,
+            "description": self.description,
+            "debit": to_rupees(self.debit_paise),
+            "credit": to_rupees(self.credit_paise),
+            "balance": to_rupees(self.balance_paise),
+            "transaction_type": self.transaction_type
+        }
+
+
+class NormalizedTransaction(_Record):
+    """One normalized row, as TransactionNormalizer returns them"""
+    FIELDS = ('transaction_date', 'description', 'amount', 'transaction_type',
+              'bank_name', 'account_number', 'balance')
+    __slots__ = ('transaction_date', 'description', 'amount_paise', 'transaction_type',
+                 'bank_name', 'account_number', 'balance_paise')
+
+    def __init__(self, transaction_date: str = '', description: str = '', amount_paise: int = 0,
+                 transaction_type: str = '', bank_name: str = '', account_number: str = '',
+                 balance_paise: int = 0):
+        self.transaction_date = transaction_date
+        self.description = description
+        self.amount_paise = amount_paise
+        self.transaction_type = transaction_type
+        self.bank_name = bank_name
+        self.account_number = account_number
+        self.balance_paise = balance_paise
+
+    amount = _rupees('amount_paise')
+    balance = _rupees('balance_paise')
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'NormalizedTransaction':
+        """From a JSON row, amounts in rupees"""
+        return cls(data.get('transaction_date', ''), data.get('description', ''),
+                   to_paise(data.get('amount', 0.0)), data.get('transaction_type', ''),
+                   data.get('bank_name', ''), data.get('account_number', ''),
+                   to_paise(data.get('balance', 0.0)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "transaction_date": self.transaction_date,
+            "description": self.description,
+            "amount": to_rupees(self.amount_paise),
+            "transaction_type": self.transaction_type,
+            "bank_name": self.bank_name,
+            "account_number": self.account_number,
+            "balance": to_rupees(self.balance_paise)
+        }
+
+
+def record_default(obj):
+    """json.dump(..., default=record_default) writes records as their dicts"""
+    if isinstance(obj, _Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
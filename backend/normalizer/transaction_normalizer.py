@@ -1,31 +1,36 @@
 # backend/normalizer/transaction_normalizer.py
 import re
-from datetime import datetime
-from typing import Dict, List
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List
+
+from .amounts import to_paise
+from .date_parser import DateParser
+from .keyword_automaton import KeywordTagger
+from .records import NormalizedTransaction, Transaction
+
+try:
+    import numpy as np
+except ImportError:  # optional: the batch path falls back to pure Python
+    np = None
+
+# Used when no statement is available to infer the date format from
+_DEFAULT_DATE_PARSER = DateParser()
 
 
 class TransactionNormalizer:
+    # Bump whenever normalized output changes; part of the extraction cache key
+    VERSION = "3"
     DEBIT_KEYWORDS = ['debit', 'withdraw', 'withdrawal', 'dr', 'pos', 'atm', 'payment']
     CREDIT_KEYWORDS = ['credit', 'deposit', 'cr', 'neft in', 'imps in', 'salary', 'transfer in']
 
     @staticmethod
-    def normalize_date(date_str: str) -> str:
-        date_formats = [
-            '%d/%m/%y', '%d/%m/%Y',
-            '%d-%m-%y', '%d-%m-%Y',
-            '%Y-%m-%d', '%Y/%m/%d'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                if dt.year < 100:
-                    dt = dt.replace(year=dt.year + 2000)
-                return dt.strftime('%Y-%m-%d')
-            except:
-                continue
-        
-        return date_str
+    def normalize_date(date_str: str, date_parser: DateParser = None) -> str:
+        """
+        Return the date as YYYY-MM-DD, or unchanged if no known format fits
+        Pass the statement's DateParser.infer() result to parse with the
+        statement's own format first
+        """
+        return (date_parser or _DEFAULT_DATE_PARSER).parse(date_str)
 
     @staticmethod
     def normalize_transaction_type(transaction_type: str, description: str, debit: float, credit: float) -> str:
@@ -33,19 +38,9 @@ class TransactionNormalizer:
             return "CREDIT"
         if debit > 0:
             return "DEBIT"
-        
-        transaction_type_lower = transaction_type.lower()
-        description_lower = description.lower()
-        
-        for keyword in TransactionNormalizer.CREDIT_KEYWORDS:
-            if keyword in transaction_type_lower or keyword in description_lower:
-                return "CREDIT"
-        
-        for keyword in TransactionNormalizer.DEBIT_KEYWORDS:
-            if keyword in transaction_type_lower or keyword in description_lower:
-                return "DEBIT"
-        
-        return "DEBIT"
+
+        # Keyword rules: a credit keyword in either string, else DEBIT
+        return TAGGER.transaction_type(transaction_type, description)
 
     @staticmethod
     def normalize_bank_name(bank_name: str) -> str:
@@ -61,9 +56,18 @@ class TransactionNormalizer:
         return bank_mapping.get(bank_name.lower(), bank_name.upper())
 
     @staticmethod
-    def normalize_transaction(transaction: Dict, bank_name: str, account_number: str) -> Dict:
-        debit = transaction.get('debit', 0.0)
-        credit = transaction.get('credit', 0.0)
+    def normalize_transaction(transaction: Dict, bank_name: str, account_number: str,
+                              date_parser: DateParser = None) -> NormalizedTransaction:
+        # Amounts are compared and chosen in integer paise; records carry
+        # them, JSON dicts hold rupees
+        if isinstance(transaction, Transaction):
+            debit = transaction.debit_paise
+            credit = transaction.credit_paise
+            balance = transaction.balance_paise
+        else:
+            debit = to_paise(transaction.get('debit', 0.0))
+            credit = to_paise(transaction.get('credit', 0.0))
+            balance = to_paise(transaction.get('balance', 0.0))
         
         amount = credit if credit > 0 else debit
         
@@ -74,32 +78,136 @@ class TransactionNormalizer:
             credit
         )
         
-        normalized = {
-            "transaction_date": TransactionNormalizer.normalize_date(transaction.get('date', '')),
-            "description": transaction.get('description', '').strip(),
-            "amount": amount,
-            "transaction_type": transaction_type,
-            "bank_name": TransactionNormalizer.normalize_bank_name(bank_name),
-            "account_number": account_number,
-            "balance": transaction.get('balance', 0.0)
-        }
-        
-        return normalized
+        return NormalizedTransaction(
+            TransactionNormalizer.normalize_date(transaction.get('date', ''), date_parser),
+            transaction.get('description', '').strip(),
+            amount,
+            transaction_type,
+            TransactionNormalizer.normalize_bank_name(bank_name),
+            account_number,
+            balance
+        )
 
     @staticmethod
-    def normalize_statement(statement_data: Dict) -> List[Dict]:
-        normalized_transactions = []
-        
-        bank_name = statement_data.get('bank_name', '')
+    def normalize_statement(statement_data: Dict) -> List[NormalizedTransaction]:
+        bank_name = TransactionNormalizer.normalize_bank_name(statement_data.get('bank_name', ''))
         account_number = statement_data.get('account_number', '')
-        transactions = statement_data.get('transactions', [])
-        
-        for transaction in transactions:
-            normalized = TransactionNormalizer.normalize_transaction(
+        columns = TransactionNormalizer.to_columns(statement_data.get('transactions', []))
+        normalized = TransactionNormalizer.normalize_columns(columns)
+
+        # Same records as normalize_transaction
+        return [
+            NormalizedTransaction(transaction_date, description, amount, transaction_type,
+                                  bank_name, account_number, balance)
+            for transaction_date, description, amount, transaction_type, balance in zip(
+                normalized['transaction_date'],
+                normalized['description'],
+                normalized['amount_paise'],
+                normalized['transaction_type'],
+                normalized['balance_paise']
+            )
+        ]
+
+    @staticmethod
+    def to_columns(transactions: List) -> Dict[str, List]:
+        """
+        Extracted transactions (Transaction records or dicts) as one list per field
+        Amount columns are integer paise: read from the records as they are,
+        converted from the rupees of JSON dicts
+        """
+        if all(isinstance(transaction, Transaction) for transaction in transactions):
+            return {
+                'date': [transaction.date for transaction in transactions],
+                'description': [transaction.description for transaction in transactions],
+                'debit_paise': [transaction.debit_paise for transaction in transactions],
+                'credit_paise': [transaction.credit_paise for transaction in transactions],
+                'balance_paise': [transaction.balance_paise for transaction in transactions],
+                'transaction_type': [transaction.transaction_type for transaction in transactions]
+            }
+        return {
+            'date': [transaction.get('date', '') for transaction in transactions],
+            'description': [transaction.get('description', '') for transaction in transactions],
+            'debit_paise': [to_paise(transaction.get('debit', 0.0)) for transaction in transactions],
+            'credit_paise': [to_paise(transaction.get('credit', 0.0)) for transaction in transactions],
+            'balance_paise': [to_paise(transaction.get('balance', 0.0)) for transaction in transactions],
+            'transaction_type': [transaction.get('transaction_type', '') for transaction in transactions]
+        }
+
+    @staticmethod
+    def normalize_columns(columns: Dict[str, List], date_parser: DateParser = None) -> Dict[str, List]:
+        """
+        Batch version of normalize_transaction over a whole statement
+        Takes to_columns() output and returns the per-row normalized fields
+        as columns: transaction_date, description, amount_paise,
+        transaction_type and balance_paise. bank_name and account_number are
+        the same for every row, so callers resolve them once instead of per
+        transaction.
+        Amounts stay integer paise throughout and are chosen with NumPy when
+        it is installed.
+        """
+        dates = columns['date']
+        descriptions = columns['description']
+        debit_paise = columns['debit_paise']
+        credit_paise = columns['credit_paise']
+        balance_paise = columns['balance_paise']
+
+        # Dates repeat within a statement: parse each distinct value once
+        date_parser = date_parser or DateParser.infer(dates)
+        parsed_dates = {}
+        for date_str in dates:
+            if date_str not in parsed_dates:
+                parsed_dates[date_str] = date_parser.parse(date_str)
+
+        if np is not None and dates:
+            debit_array = np.asarray(debit_paise, dtype=np.int64)
+            credit_array = np.asarray(credit_paise, dtype=np.int64)
+            is_credit = credit_array > 0
+            amount_array = np.where(is_credit, credit_array, debit_array)
+            amount_paise = amount_array.tolist()
+            transaction_types = np.where(is_credit, "CREDIT", "DEBIT").tolist()
+            undecided = np.flatnonzero(~is_credit & ~(debit_array > 0)).tolist()
+        else:
+            amount_paise = [credit if credit > 0 else debit for debit, credit in zip(debit_paise, credit_paise)]
+            transaction_types = ["CREDIT" if credit > 0 else "DEBIT" for credit in credit_paise]
+            undecided = [index for index, (debit, credit) in enumerate(zip(debit_paise, credit_paise))
+                         if not credit > 0 and not debit > 0]
+
+        # Rows with neither amount (0 paise both) fall back to the keyword rules
+        for index in undecided:
+            transaction_types[index] = TransactionNormalizer.normalize_transaction_type(
+                columns['transaction_type'][index],
+                descriptions[index],
+                0,
+                0
+            )
+
+        return {
+            'transaction_date': [parsed_dates[date_str] for date_str in dates],
+            'description': [description.strip() for description in descriptions],
+            'amount_paise': amount_paise,
+            'transaction_type': transaction_types,
+            'balance_paise': balance_paise
+        }
+
+    @staticmethod
+    def normalize_iter(transactions: Iterable[Dict], bank_name: str,
+                       account_number: str) -> Iterator[NormalizedTransaction]:
+        """
+        Lazily normalize a transaction stream, e.g. BasePDFExtractor.extract_iter()
+        The first DateParser.SAMPLE_SIZE rows are buffered to infer the date format
+        """
+        transactions = iter(transactions)
+        sample = list(islice(transactions, DateParser.SAMPLE_SIZE))
+        date_parser = DateParser.infer(transaction.get('date', '') for transaction in sample)
+
+        for transaction in chain(sample, transactions):
+            yield TransactionNormalizer.normalize_transaction(
                 transaction,
                 bank_name,
-                account_number
+                account_number,
+                date_parser
             )
-            normalized_transactions.append(normalized)
-        
-        return normalized_transactions
\ No newline at end of file
+
+
+# Shared keyword automaton for the type keywords above and the category table
+TAGGER = KeywordTagger(TransactionNormalizer.CREDIT_KEYWORDS, TransactionNormalizer.DEBIT_KEYWORDS)
\ No newline at end of file
@@ -6,6 +6,9 @@ from .sbi_extractor import SBIExtractor
 from .union_extractor import UnionExtractor
 from .boi_extractor import BOIExtractor
 from .central_extractor import CentralExtractor
+from .metadata_scanner import MetadataScanner
+from .column_parser import ColumnParser
+from .reconcile import BalanceReconciler
 
 __all__ = [
     'BasePDFExtractor',
@@ -14,5 +17,8 @@ __all__ = [
     'SBIExtractor',
     'UnionExtractor',
     'BOIExtractor',
-    'CentralExtractor'
+    'CentralExtractor',
+    'MetadataScanner',
+    'ColumnParser',
+    'BalanceReconciler'
 ]
\ No newline at end of file
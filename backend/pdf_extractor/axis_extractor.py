@@ -1,25 +1,93 @@
 # backend/pdf_extractor/axis_extractor.py
 import re
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_COLUMNS
+from .column_parser import ColumnParser
+
+
+# Metadata patterns, compiled once
+AXIS_ACCOUNT_NUMBER = re.compile(r'Account\s+No\.\s*:\s*(\d+)', re.IGNORECASE)
+AXIS_ACCOUNT_HOLDER = re.compile(r'(Ms\.|Mr\.|Mrs\.)\s+([A-Z\s]+)\s+Account')
+
+# Column bands (x0, x1 in points) of the A4 transaction grid
+AXIS_COLUMNS = ColumnParser([
+    ('value_date', 0, 110),
+    ('post_date', 110, 175),
+    ('details', 175, 360),
+    ('cheque', 360, 405),
+    ('debit', 405, 462),
+    ('credit', 462, 525),
+    ('balance', 525, 620),
+], start_band='value_date', continuation_bands=('details', 'cheque'))
 
 
 class AxisExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTOR_VERSION = "4"
+    EXTRACTION_PLAN = PLAN_COLUMNS
+    COLUMN_PARSER = AXIS_COLUMNS
+    # Name and account number sit above the "Value Post Details" header
+    METADATA_REGION = (0, 0, 1, 0.2)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "AXIS"
 
     def extract_metadata(self, text: str):
-        account_match = re.search(r'Account\s+No\.\s*:\s*(\d+)', text, re.IGNORECASE)
+        account_match = AXIS_ACCOUNT_NUMBER.search(text)
         if account_match:
             self.account_number = account_match.group(1)
 
-        name_match = re.search(r'(Ms\.|Mr\.|Mrs\.)\s+([A-Z\s]+)\s+Account', text)
+        name_match = AXIS_ACCOUNT_HOLDER.search(text)
         if name_match:
             self.account_holder = name_match.group(0).replace('Account', '').strip()
 
         self.statement_period = "Available in Statement"
 
     def extract_transactions(self, tables, text: str):
+        """
+        AXIS rows come from the column parser; the text parser is kept for
+        documents whose layout doesn't match the column bands
+        """
+        if tables:
+            self._extract_from_tables(tables)
+        else:
+            self._extract_from_text(text)
+
+    def _extract_from_tables(self, tables):
+        """
+        Rows rebuilt from word positions:
+        [value_date, post_date, details, chq, debit, credit, balance]
+        """
+        for table in tables:
+            for row in table:
+                if not row or len(row) < 7:
+                    continue
+
+                date_str = str(row[0]).strip() if row[0] else ""
+                if not self._is_valid_date(date_str):
+                    continue
+
+                description = str(row[2]).strip() if row[2] else ""
+                if not description:
+                    continue
+
+                debit = self.parse_paise(row[4])
+                credit = self.parse_paise(row[5])
+                balance = self.parse_paise(row[6])
+
+                if debit == 0 and credit == 0:
+                    continue
+
+                self.transactions.append(Transaction(
+                    date=date_str,
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type="Credit" if credit > 0 else "Debit"
+                ))
+
+    def _extract_from_text(self, text: str):
         """
         Extract AXIS transactions from text
         Format: DD/MM/YY DD/MM/YY Description - Debit Credit Balance
@@ -68,45 +136,34 @@ class AxisExtractor(BasePDFExtractor):
             description = re.sub(r'[\d,]+\.\d{2}Cr?', '', full_text).strip()
             description = re.sub(r'\s+', ' ', description)
             
-            # Determine debit/credit
-            # Axis shows "Cr" suffix for balance and uses "TO TRF" for debit, "BY TRF" for credit
-            is_credit = 'BY TRF' in description or 'SALARY' in description.upper() or 'REFUND' in description.upper()
-            
+            # Amounts are recorded as debits; the balance reconciliation pass
+            # turns them into credits where the balance went up
             if len(amounts) == 1:
                 # Only balance present
-                balance = self.parse_amount(amounts[0])
-                debit = 0.0
-                credit = 0.0
+                balance = self.parse_paise(amounts[0])
+                debit = 0
+                credit = 0
             elif len(amounts) == 2:
                 # Amount + Balance
-                amount = self.parse_amount(amounts[0])
-                balance = self.parse_amount(amounts[1])
-                if is_credit:
-                    debit = 0.0
-                    credit = amount
-                else:
-                    debit = amount
-                    credit = 0.0
+                debit = self.parse_paise(amounts[0])
+                balance = self.parse_paise(amounts[1])
+                credit = 0
             else:
                 # Debit + Credit + Balance or other format
-                balance = self.parse_amount(amounts[-1])
-                if is_credit:
-                    debit = 0.0
-                    credit = self.parse_amount(amounts[0])
-                else:
-                    debit = self.parse_amount(amounts[0])
-                    credit = 0.0
+                balance = self.parse_paise(amounts[-1])
+                debit = self.parse_paise(amounts[0])
+                credit = 0
             
-            transaction_type = "Credit" if is_credit or credit > 0 else "Debit"
+            transaction_type = "Credit" if credit > 0 else "Debit"
             
-            self.transactions.append({
-                "date": value_date,
-                "description": description,
-                "debit": debit,
-                "credit": credit,
-                "balance": balance,
-                "transaction_type": transaction_type
-            })
+            self.transactions.append(Transaction(
+                date=value_date,
+                description=description,
+                debit_paise=debit,
+                credit_paise=credit,
+                balance_paise=balance,
+                transaction_type=transaction_type
+            ))
 
     def _is_valid_date(self, date_str: str) -> bool:
         date_patterns = [
@@ -1,37 +1,337 @@
 # backend/pdf_extractor/base_extractor.py
+import io
 import pdfplumber
-import re
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import json
 
+from .budget import ExtractionBudget, REASON_TIME
+from .memory import PeakRSS, release_page
+from .reconcile import BalanceReconciler
+from .text_backends import get_text_backend
+from normalizer.amounts import parse_paise, to_rupees
+from normalizer.records import Transaction, record_default
+
+# Extraction plans: which pdfplumber layers an extractor needs
+# - PLAN_TEXT: extract_text only
+# - PLAN_TABLES: tables only
+# - PLAN_TEXT_TABLE_FALLBACK: text first, tables computed only if iterated
+# - PLAN_TEXT_AND_TABLES: both layers, eagerly
+# - PLAN_COLUMNS: rows rebuilt from word positions by COLUMN_PARSER, passed
+#   as one table per page; text is only read if no transaction comes out
+PLAN_TEXT = "text"
+PLAN_TABLES = "tables"
+PLAN_TEXT_TABLE_FALLBACK = "text+table_fallback"
+PLAN_TEXT_AND_TABLES = "text+tables"
+PLAN_COLUMNS = "columns+text_fallback"
+
+
+def _read_page(page, plan: str = PLAN_TEXT_AND_TABLES, column_parser=None, release: bool = False,
+               text_backend: str = "pdfplumber") -> Tuple[str, List]:
+    """
+    Extract the layers of a single page required by the extraction plan
+    Text comes from the named text backend; with release, the page's
+    cached layout objects are dropped once read
+    """
+    text = ""
+    tables = []
+    if plan == PLAN_COLUMNS:
+        tables = [column_parser.parse_page(page)]
+    else:
+        if plan != PLAN_TABLES:
+            text = get_text_backend(text_backend).extract_text(page)
+        if plan in (PLAN_TABLES, PLAN_TEXT_AND_TABLES):
+            tables = page.extract_tables() or []
+
+    if release:
+        release_page(page)
+    return text, tables
+
+
+def _read_page_range(pdf_path: str, start: int, stop: int, plan: str, column_parser=None,
+                     release: bool = False, text_backend: str = "pdfplumber") -> List[Tuple[str, List]]:
+    """
+    Worker entry point for page-parallel extraction
+    Each worker opens its own handle and reads pages [start, stop)
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_read_page(page, plan, column_parser, release, text_backend) for page in pdf.pages[start:stop]]
+
+
+class LazyTables:
+    """
+    Table layer computed page by page on first iteration
+    Used by text-first extractors that only fall back to tables when the
+    text parser finds nothing; the PDF must still be open while iterating.
+    should_stop is checked before each page and ends the pass early
+    """
+
+    def __init__(self, pages, release: bool = False, should_stop=None):
+        self._pages = pages
+        self._release = release
+        self._should_stop = should_stop
+        self._tables = None
+
+    def __iter__(self):
+        if self._tables is not None:
+            yield from self._tables
+            return
+        tables = []
+        for page in self._pages:
+            if self._should_stop and self._should_stop():
+                break
+            page_tables = page.extract_tables() or []
+            if self._release:
+                release_page(page)
+            tables.extend(page_tables)
+            yield from page_tables
+        self._tables = tables
+
+    def __len__(self):
+        if self._tables is None:
+            for _ in self:
+                pass
+        return len(self._tables)
+
 
 class BasePDFExtractor:
-    def __init__(self, pdf_path: str):
+    # Bump whenever extraction output changes; part of the extraction cache key
+    EXTRACTOR_VERSION = "3"
+    # Layers read from each page; subclasses narrow this to what they parse
+    EXTRACTION_PLAN = PLAN_TEXT_AND_TABLES
+    # Metadata is read from this crop of page 1: (x0, top, x1, bottom) as page fractions
+    METADATA_REGION = (0, 0, 1, 0.35)
+    # Full pages scanned, one at a time, while a metadata field is still missing
+    METADATA_FALLBACK_PAGES = 2
+    METADATA_FIELDS = ('account_number', 'account_holder', 'statement_period')
+    # ColumnParser with the bank's column bands, used by PLAN_COLUMNS
+    COLUMN_PARSER = None
+    # Where page text comes from; see text_backends.TEXT_BACKENDS
+    TEXT_BACKEND = "pdfplumber"
+
+    def __init__(self, pdf_path: str, workers: int = 1, low_memory: bool = False,
+                 budget: ExtractionBudget = None, text_backend: str = None, pdf_bytes: bytes = None):
         self.pdf_path = Path(pdf_path)
+        # The file's contents when the caller already read them; parsed from
+        # memory instead of reopening pdf_path (page workers still use the path)
+        self.pdf_bytes = pdf_bytes
         self.bank_name = ""
         self.account_holder = ""
         self.account_number = ""
         self.statement_period = ""
-        self.transactions = []
+        # Transaction records; to_dict() keeps them as records, save() and
+        # the extraction cache serialize them with record_default
+        self.transactions: List[Transaction] = []
+        # Number of processes used to read pages; 1 keeps extraction serial
+        self.workers = workers
+        # Release each page's cached layout once it has been read, so memory
+        # stays flat instead of growing with page count
+        self.low_memory = low_memory
+        # Peak RSS in bytes of the last extract()/extract_iter() run
+        self.peak_rss = 0
+        self._rss = PeakRSS()
+        # Time/page limits; when spent, extraction stops and the partial
+        # result is flagged with the reason
+        self.budget = budget or ExtractionBudget()
+        self.truncated_reason = None
+        self.pages_read = 0
+        # BalanceReconciler.report() of the last run: direction fixes and
+        # balance chain breaks, the statement's integrity check
+        self.reconciliation = None
+        # Backend name rather than object so it can be sent to page workers;
+        # looked up here so an unknown name fails before any page is read
+        self.text_backend = text_backend or self.TEXT_BACKEND
+        get_text_backend(self.text_backend)
 
     def extract(self) -> Dict:
-        with pdfplumber.open(self.pdf_path) as pdf:
+        self._start_run()
+        with self._open() as pdf:
             full_text = ""
             all_tables = []
             
-            for page in pdf.pages:
-                full_text += page.extract_text() + "\n"
-                tables = page.extract_tables()
-                if tables:
-                    all_tables.extend(tables)
+            for text, tables in self._iter_pages(pdf):
+                full_text += text + "\n"
+                all_tables.extend(tables)
+
+            if self.EXTRACTION_PLAN == PLAN_TEXT_TABLE_FALLBACK:
+                all_tables = self._lazy_tables(pdf)
             
-            self.extract_metadata(full_text)
+            self._extract_header_metadata(pdf)
             self.extract_transactions(all_tables, full_text)
-        
+
+            if self.EXTRACTION_PLAN == PLAN_COLUMNS and not self.transactions:
+                self.extract_transactions([], self._full_text(pdf))
+
+        reconciler = BalanceReconciler()
+        self.transactions = reconciler.reconcile(self.transactions)
+        self.reconciliation = reconciler.report()
+        self.peak_rss = self._rss.sample()
         return self.to_dict()
 
+    def extract_iter(self) -> Iterator[Transaction]:
+        """
+        Stream Transaction records page by page instead of building the whole document
+        Metadata is read from the page 1 header before this returns, so the
+        metadata attributes are already populated; the PDF stays open until
+        the returned iterator is exhausted or closed
+        """
+        self._start_run()
+        pdf = self._open()
+        try:
+            self._extract_header_metadata(pdf)
+        except Exception:
+            pdf.close()
+            raise
+        return self._iter_transactions(pdf)
+
+    def _open(self):
+        return pdfplumber.open(io.BytesIO(self.pdf_bytes) if self.pdf_bytes is not None else self.pdf_path)
+
+    def _iter_transactions(self, pdf) -> Iterator[Transaction]:
+        # Rows are held back only until their balance predecessor is known:
+        # the order sample at the start, one row on newest-first statements
+        reconciler = BalanceReconciler()
+        with pdf:
+            extracted = 0
+            text_rows = False
+            for index, (text, tables) in enumerate(self._iter_pages(pdf)):
+                self.extract_transactions(tables, text)
+                text_rows = text_rows or bool(self.transactions)
+                if self.EXTRACTION_PLAN == PLAN_TEXT_TABLE_FALLBACK and not text_rows:
+                    # No text rows in the document so far: read this page's
+                    # tables now and release it, instead of one pass over
+                    # every page after the loop
+                    self.extract_transactions(
+                        LazyTables([pdf.pages[index]], release=True, should_stop=self._budget_spent), "")
+                    self.peak_rss = self._rss.sample()
+                extracted += len(self.transactions)
+                yield from reconciler.feed(self.transactions)
+                self.transactions = []
+
+            if not extracted and self.EXTRACTION_PLAN == PLAN_COLUMNS:
+                # The text fallback runs once over the whole document, like extract()
+                self.extract_transactions([], self._full_text(pdf))
+                self.peak_rss = self._rss.sample()
+                yield from reconciler.feed(self.transactions)
+                self.transactions = []
+
+            yield from reconciler.finish()
+            self.reconciliation = reconciler.report()
+
+    def _start_run(self):
+        self.transactions = []
+        self.truncated_reason = None
+        self.pages_read = 0
+        self.reconciliation = None
+        self.budget.start()
+        self._rss.start()
+
+    def _budget_spent(self, pages_read: Optional[int] = None) -> bool:
+        """Check the budget between pages and stages, recording why it stopped"""
+        reason = self.budget.exceeded(pages_read)
+        if reason:
+            self.truncated_reason = reason
+        return reason is not None
+
+    def _lazy_tables(self, pdf) -> LazyTables:
+        # Fallback passes cover the pages the main pass got to
+        return LazyTables(pdf.pages[:self.pages_read], release=self.low_memory, should_stop=self._budget_spent)
+
+    def _full_text(self, pdf) -> str:
+        texts = []
+        for page in pdf.pages[:self.pages_read]:
+            if self._budget_spent():
+                break
+            texts.append(get_text_backend(self.text_backend).extract_text(page) + "\n")
+            if self.low_memory:
+                release_page(page)
+        return "".join(texts)
+
+    def _extract_header_metadata(self, pdf):
+        """
+        Run extract_metadata on the METADATA_REGION crop of page 1 only
+        While a field is still missing, retry on the full text of the first
+        METADATA_FALLBACK_PAGES pages, keeping the fields already found, so
+        metadata cost does not grow with statement length
+        """
+        if not pdf.pages:
+            return
+
+        first_page = pdf.pages[0]
+        x0, top, x1, bottom = self.METADATA_REGION
+        header = first_page.crop((
+            x0 * first_page.width, top * first_page.height,
+            x1 * first_page.width, bottom * first_page.height
+        ))
+        self.extract_metadata(header.extract_text())
+        if self.low_memory:
+            release_page(first_page)
+
+        page_texts = []
+        for page in pdf.pages[:self.METADATA_FALLBACK_PAGES]:
+            found = {field: getattr(self, field) for field in self.METADATA_FIELDS}
+            if all(found.values()) or self._budget_spent():
+                break
+            page_texts.append(get_text_backend(self.text_backend).extract_text(page))
+            if self.low_memory:
+                release_page(page)
+            self.extract_metadata("\n".join(page_texts) + "\n")
+            for field, value in found.items():
+                if value:
+                    setattr(self, field, value)
+
+    def _iter_pages(self, pdf) -> Iterator[Tuple[str, List]]:
+        """
+        Yield (text, tables) for every page, in page order, until the budget
+        is spent
+        Only the layers named by EXTRACTION_PLAN are computed
+        With workers > 1 the pages are split into contiguous ranges and
+        read in a process pool, then merged back in page order
+        """
+        page_count = len(pdf.pages)
+        workers = min(self.workers or 1, page_count)
+        if workers <= 1:
+            for index, page in enumerate(pdf.pages):
+                if self._budget_spent(index):
+                    return
+                page_layers = _read_page(page, self.EXTRACTION_PLAN, self.COLUMN_PARSER, self.low_memory, self.text_backend)
+                self.pages_read = index + 1
+                self.peak_rss = self._rss.sample()
+                yield page_layers
+            return
+
+        if self.budget.max_pages is not None and page_count > self.budget.max_pages:
+            self._budget_spent(page_count)
+            page_count = self.budget.max_pages
+        chunk = -(-page_count // workers)
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+
+        pool = ProcessPoolExecutor(max_workers=len(ranges))
+        try:
+            futures = [pool.submit(_read_page_range, str(self.pdf_path), start, stop, self.EXTRACTION_PLAN,
+                                   self.COLUMN_PARSER, self.low_memory, self.text_backend)
+                       for start, stop in ranges]
+            for future, (start, stop) in zip(futures, ranges):
+                if self._budget_spent():
+                    return
+                # Wait no longer than the time left; a stuck range ends the run
+                timeout = None
+                if self.budget.max_seconds is not None:
+                    timeout = max(self.budget.max_seconds - self.budget.elapsed, 0)
+                try:
+                    page_layers = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    self.truncated_reason = REASON_TIME
+                    return
+                self.pages_read = stop
+                self.peak_rss = self._rss.sample()
+                yield from page_layers
+        finally:
+            # Don't wait for ranges that are no longer needed
+            pool.shutdown(wait=self.truncated_reason is None, cancel_futures=True)
+
     def extract_metadata(self, text: str):
         raise NotImplementedError
 
@@ -39,30 +339,30 @@ class BasePDFExtractor:
         raise NotImplementedError
 
     def parse_amount(self, value) -> float:
-        if not value or value is None:
-            return 0.0
-        if isinstance(value, (int, float)):
-            return float(value)
-        value = str(value).strip()
-        value = re.sub(r'[^\d.,\-]', '', value)
-        value = value.replace(',', '')
-        if not value or value == '-':
-            return 0.0
-        try:
-            return float(value)
-        except:
-            return 0.0
+        """Rupee float for JSON, rounded to the paise parse_paise() reads"""
+        return to_rupees(parse_paise(value))
+
+    def parse_paise(self, value) -> int:
+        """Amount string or number as integer paise, as the Transaction records hold it; 0 when it isn't one"""
+        return parse_paise(value)
 
     def to_dict(self) -> Dict:
-        return {
+        result = {
             "bank_name": self.bank_name,
             "account_holder": self.account_holder,
             "account_number": self.account_number,
             "statement_period": self.statement_period,
             "transactions": self.transactions
         }
+        if self.reconciliation is not None:
+            result["reconciliation"] = self.reconciliation
+        if self.truncated_reason:
+            result["truncated"] = True
+            result["truncated_reason"] = self.truncated_reason
+            result["pages_read"] = self.pages_read
+        return result
 
     def save(self, output_path: Path):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
\ No newline at end of file
+            json.dump(self.to_dict(), f, indent=2, default=record_default)
\ No newline at end of file
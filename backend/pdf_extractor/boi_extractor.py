@@ -1,27 +1,38 @@
 # backend/pdf_extractor/boi_extractor.py
 import re
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_TABLES
+
+
+# Metadata patterns, compiled once
+BOI_ACCOUNT_NUMBER = re.compile(r'Account\s+No\s*:\s*(\d+)', re.IGNORECASE)
+BOI_ACCOUNT_HOLDER = re.compile(r'Name\s*:\s*(.+)', re.IGNORECASE)
+BOI_STATEMENT_PERIOD = re.compile(r'period\s+(.+?\d{4}\s+to\s+.+?\d{4})', re.IGNORECASE)
 
 
 class BOIExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTION_PLAN = PLAN_TABLES
+    # Customer block down to the "For the period" line
+    METADATA_REGION = (0, 0, 1, 0.26)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "BOI"
 
     def extract_metadata(self, text: str):
         # Account Number
-        account_match = re.search(r'Account\s+No\s*:\s*(\d+)', text, re.IGNORECASE)
+        account_match = BOI_ACCOUNT_NUMBER.search(text)
         if account_match:
             self.account_number = account_match.group(1)
 
         # Account Holder Name
-        name_match = re.search(r'Name\s*:\s*(.+)', text, re.IGNORECASE)
+        name_match = BOI_ACCOUNT_HOLDER.search(text)
         if name_match:
             name_line = name_match.group(1).strip()
             self.account_holder = name_line.split('\n')[0].strip()
 
         # Statement Period
-        period_match = re.search(r'period\s+(.+?\d{4}\s+to\s+.+?\d{4})', text, re.IGNORECASE)
+        period_match = BOI_STATEMENT_PERIOD.search(text)
         if period_match:
             self.statement_period = period_match.group(1).strip()
 
@@ -74,38 +85,38 @@ class BOIExtractor(BasePDFExtractor):
                 
                 # Get withdrawal amount (column 4)
                 withdrawal_val = row[4] if len(row) > 4 and row[4] else ""
-                withdrawal = self.parse_amount(withdrawal_val)
+                withdrawal = self.parse_paise(withdrawal_val)
                 
                 # Get deposit amount (column 5)
                 deposit_val = row[5] if len(row) > 5 and row[5] else ""
-                deposit = self.parse_amount(deposit_val)
+                deposit = self.parse_paise(deposit_val)
                 
                 # Get balance (column 6)
                 balance_val = row[6] if len(row) > 6 and row[6] else ""
-                balance = self.parse_amount(balance_val)
+                balance = self.parse_paise(balance_val)
                 
                 # Skip if no transaction (both withdrawal and deposit are 0)
-                if withdrawal == 0.0 and deposit == 0.0:
+                if withdrawal == 0 and deposit == 0:
                     continue
                 
                 # Determine transaction type
                 if deposit > 0:
                     transaction_type = "Credit"
-                    debit = 0.0
+                    debit = 0
                     credit = deposit
                 else:
                     transaction_type = "Debit"
                     debit = withdrawal
-                    credit = 0.0
+                    credit = 0
                 
-                self.transactions.append({
-                    "date": date_str,
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                self.transactions.append(Transaction(
+                    date=date_str,
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
                 
                 transaction_count += 1
         
@@ -0,0 +1,46 @@
+# backend/pdf_extractor/budget.py
+import time
+from typing import Optional
+
+# Reasons reported when a budget stops extraction
+REASON_CANCELLED = "cancelled"
+REASON_TIME = "time_budget"
+REASON_PAGES = "page_budget"
+
+
+class ExtractionBudget:
+    """
+    Per-document wall-clock and page limits, checked cooperatively
+    The extractor calls exceeded() between pages and before each extra
+    stage; work already running (one page, one regex pass) is never
+    interrupted, so a budget bounds a document to roughly max_seconds plus
+    the cost of one page. cancel() may be called from another thread.
+    None means unlimited.
+    """
+
+    def __init__(self, max_seconds: Optional[float] = None, max_pages: Optional[int] = None):
+        self.max_seconds = max_seconds
+        self.max_pages = max_pages
+        self.started = None
+        self.cancelled = False
+
+    def start(self):
+        self.started = time.monotonic()
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def exceeded(self, pages_read: Optional[int] = None) -> Optional[str]:
+        """Reason the budget is spent, or None while work may continue"""
+        if self.cancelled:
+            return REASON_CANCELLED
+        if self.max_seconds is not None and self.elapsed >= self.max_seconds:
+            return REASON_TIME
+        if self.max_pages is not None and pages_read is not None and pages_read >= self.max_pages:
+            return REASON_PAGES
+        return None
@@ -1,19 +1,43 @@
 # backend/pdf_extractor/central_extractor.py
 import re
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_COLUMNS
+from .column_parser import ColumnParser
+
+
+# Metadata patterns, compiled once
+CENTRAL_ACCOUNT_NUMBER = re.compile(r'Account\s+No\.\s*:\s*(\d+)', re.IGNORECASE)
+CENTRAL_ACCOUNT_HOLDER = re.compile(r'(Mr\.|Ms\.|Mrs\.)\s+([A-Z\s]+)\s+Account')
+
+# Column bands (x0, x1 in points) of the A4 transaction grid
+CENTRAL_COLUMNS = ColumnParser([
+    ('value_date', 0, 110),
+    ('post_date', 110, 175),
+    ('details', 175, 360),
+    ('cheque', 360, 405),
+    ('debit', 405, 462),
+    ('credit', 462, 525),
+    ('balance', 525, 620),
+], start_band='value_date', continuation_bands=('details', 'cheque'))
 
 
 class CentralExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTOR_VERSION = "4"
+    EXTRACTION_PLAN = PLAN_COLUMNS
+    COLUMN_PARSER = CENTRAL_COLUMNS
+    # Name and account number sit above the "Value Post Details" header
+    METADATA_REGION = (0, 0, 1, 0.2)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "CENTRAL"
 
     def extract_metadata(self, text: str):
-        account_match = re.search(r'Account\s+No\.\s*:\s*(\d+)', text, re.IGNORECASE)
+        account_match = CENTRAL_ACCOUNT_NUMBER.search(text)
         if account_match:
             self.account_number = account_match.group(1)
 
-        name_match = re.search(r'(Mr\.|Ms\.|Mrs\.)\s+([A-Z\s]+)\s+Account', text)
+        name_match = CENTRAL_ACCOUNT_HOLDER.search(text)
         if name_match:
             self.account_holder = f"{name_match.group(1)} {name_match.group(2).strip()}"
 
@@ -24,20 +48,22 @@ class CentralExtractor(BasePDFExtractor):
         Central Bank transactions are text-based, not in clean tables.
         Format: DD/MM/YY DD/MM/YY Description - Amount Amount BalanceCr
         Example: 25/10/25 25/10/25 TO TRF. - 1,813.63 335,281.72Cr
+        Rows come from the column parser; the text parser is the fallback.
         """
-        # First try table extraction
-        table_count = self._extract_from_tables(tables)
-        
-        # If no transactions found from tables, use text extraction
-        if table_count == 0:
-            print(f"      WARNING: No tables found, using text extraction...")
+        if tables:
+            self._extract_from_tables(tables)
+        else:
+            print("      WARNING: No transactions in columns, using text extraction...")
             self._extract_from_text(text)
 
     def _extract_from_tables(self, tables):
-        """Try to extract from tables first"""
+        """
+        Rows rebuilt from word positions:
+        [value_date, post_date, details, chq, debit, credit, balance]
+        """
         count = 0
         for table in tables:
-            if not table or len(table) < 2:
+            if not table:
                 continue
 
             for row in table:
@@ -55,23 +81,24 @@ class CentralExtractor(BasePDFExtractor):
                 if not description or 'details' in description.lower():
                     continue
                 
-                debit = self.parse_amount(row[4]) if len(row) > 4 else 0.0
-                credit = self.parse_amount(row[5]) if len(row) > 5 else 0.0
-                balance = self.parse_amount(row[6]) if len(row) > 6 else 0.0
+                debit = self.parse_paise(row[4]) if len(row) > 4 else 0
+                credit = self.parse_paise(row[5]) if len(row) > 5 else 0
+                balance = self.parse_paise(row[6]) if len(row) > 6 else 0
                 
-                if debit == 0.0 and credit == 0.0:
+                if debit == 0 and credit == 0:
                     continue
                 
-                transaction_type = "Credit" if credit > 0 or 'BY TRF' in description or 'SALARY' in description.upper() else "Debit"
+                # Debit and credit are separate columns, so position decides
+                transaction_type = "Credit" if credit > 0 else "Debit"
                 
-                self.transactions.append({
-                    "date": date_str,
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                self.transactions.append(Transaction(
+                    date=date_str,
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
                 count += 1
         
         return count
@@ -154,42 +181,34 @@ class CentralExtractor(BasePDFExtractor):
             description = re.sub(r'\s*\.\s*', '.', description)
             
             # Last amount is always balance
-            balance = self.parse_amount(amounts[-1])
+            balance = self.parse_paise(amounts[-1])
             
-            # Determine debit/credit
-            debit = 0.0
-            credit = 0.0
+            # Amounts are recorded as debits; the balance reconciliation pass
+            # turns them into credits where the balance went up
+            debit = 0
+            credit = 0
             
             if len(amounts) == 2:
                 # Format: Amount Balance
-                amount = self.parse_amount(amounts[0])
-                # Check if credit transaction
-                if 'BY TRF' in description or 'SALARY' in description.upper() or 'REFUND' in description.upper() or 'TRF FROM' in description:
-                    credit = amount
-                else:
-                    debit = amount
+                debit = self.parse_paise(amounts[0])
             elif len(amounts) >= 3:
                 # Format: Debit Credit Balance or multiple amounts
                 # Second-to-last is typically the transaction amount
-                amount = self.parse_amount(amounts[-2])
-                if 'BY TRF' in description or 'SALARY' in description.upper() or 'REFUND' in description.upper():
-                    credit = amount
-                else:
-                    debit = amount
+                debit = self.parse_paise(amounts[-2])
             
-            if debit == 0.0 and credit == 0.0:
+            if debit == 0 and credit == 0:
                 continue
             
             transaction_type = "Credit" if credit > 0 else "Debit"
             
-            self.transactions.append({
-                "date": value_date,
-                "description": description,
-                "debit": debit,
-                "credit": credit,
-                "balance": balance,
-                "transaction_type": transaction_type
-            })
+            self.transactions.append(Transaction(
+                date=value_date,
+                description=description,
+                debit_paise=debit,
+                credit_paise=credit,
+                balance_paise=balance,
+                transaction_type=transaction_type
+            ))
 
     def _is_valid_date(self, date_str: str) -> bool:
         return bool(re.match(r'\d{2}/\d{2}/\d{2}', date_str.strip()))
\ No newline at end of file
@@ -0,0 +1,73 @@
+# backend/pdf_extractor/column_parser.py
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class ColumnParser:
+    """
+    Rebuilds statement rows from word positions instead of table detection
+    Words from page.extract_words() are grouped into lines by their top
+    coordinate and binned into the bank's column bands by their horizontal
+    centre. A line with text in start_band (the date column) opens a new row;
+    a line with text only in continuation_bands (wrapped narration) is merged
+    into the open row. Any other line closes the open row and becomes a row
+    of its own, so headers, BROUGHT/CARRIED FORWARD and page summaries never
+    bleed into a transaction.
+    Rows come back as lists of cells in band order, None for empty cells,
+    the same shape as a pdfplumber table.
+    """
+
+    def __init__(self, bands: Sequence[Tuple[str, float, float]], start_band: str,
+                 continuation_bands: Sequence[str], y_tolerance: float = 1):
+        # bands: (name, x0, x1) in PDF points, left to right
+        self.bands = list(bands)
+        self.names = [name for name, _, _ in self.bands]
+        self.start_index = self.names.index(start_band)
+        self.continuation = {self.names.index(name) for name in continuation_bands}
+        self.y_tolerance = y_tolerance
+
+    def parse_page(self, page) -> List[List[Optional[str]]]:
+        return self.parse_words(page.extract_words(y_tolerance=self.y_tolerance))
+
+    def parse_words(self, words: List[Dict]) -> List[List[Optional[str]]]:
+        rows = []
+        current = None
+
+        for line in self._lines(words):
+            cells = self._bin(line)
+            filled = {index for index, parts in enumerate(cells) if parts}
+
+            if self.start_index not in filled and current is not None and filled <= self.continuation:
+                for index in filled:
+                    current[index].extend(cells[index])
+                continue
+
+            current = cells
+            rows.append(current)
+
+        return [[' '.join(parts) if parts else None for parts in row] for row in rows]
+
+    def _lines(self, words: List[Dict]) -> List[List[Dict]]:
+        lines = []
+        for word in sorted(words, key=lambda w: (w['top'], w['x0'])):
+            if lines and abs(word['top'] - lines[-1][0]['top']) <= self.y_tolerance:
+                lines[-1].append(word)
+            else:
+                lines.append([word])
+        return [sorted(line, key=lambda w: w['x0']) for line in lines]
+
+    def _bin(self, line: List[Dict]) -> List[List[str]]:
+        cells = [[] for _ in self.bands]
+        for word in line:
+            cells[self._band_index((word['x0'] + word['x1']) / 2)].append(word['text'])
+        return cells
+
+    def _band_index(self, x: float) -> int:
+        nearest = 0
+        nearest_distance = None
+        for index, (_, x0, x1) in enumerate(self.bands):
+            if x0 <= x < x1:
+                return index
+            distance = min(abs(x - x0), abs(x - x1))
+            if nearest_distance is None or distance < nearest_distance:
+                nearest, nearest_distance = index, distance
+        return nearest
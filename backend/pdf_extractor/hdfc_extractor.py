@@ -1,103 +1,122 @@
 # backend/pdf_extractor/hdfc_extractor.py
 import re
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_TABLES
+from .metadata_scanner import MetadataScanner
+
+
+HDFC_METADATA = MetadataScanner({
+    # Account number - try multiple patterns
+    'account_number': [
+        r'Account\s+Number[:\s]+(\d+)',
+        r'Account\s+No\.?[:\s]+(\d+)',
+        r'A/c\s+No\.?[:\s]+(\d+)',
+        r'Account[:\s]+(\d{10,})',
+        r'Savings\s+Account[:\s]+(\d+)',
+        r'(?:Account|A/C)\s*[:.]?\s*(\d{10,})',
+    ],
+    # Account holder name - HDFC specific patterns
+    # Try to find name near account number or in common HDFC locations
+    'account_holder': [
+        # Pattern 1: Name after "Customer Name", "Account Holder", etc
+        r'(?:Customer\s+Name|Account\s+Holder|Name\s+of\s+Account\s+Holder|Account\s+Name)[:\s]+([A-Z][A-Z\s\.&]{2,50})(?:\s+Account|\s+Address|\s+Branch|\s+IFSC|\s*\n|$)',
+        
+        # Pattern 2: Name at the start of address block
+        r'^([A-Z][A-Z\s\.&]{2,50})\s+(?:Address|Home|Office|Branch)',
+        
+        # Pattern 3: Name before Account Number
+        r'([A-Z][A-Z\s\.&]{2,50})\s+Account\s+(?:Number|No)',
+        
+        # Pattern 4: "Dear" salutation
+        r'Dear\s+(?:Mr\.|Ms\.|Mrs\.|Dr\.)\s+([A-Z][A-Z\s\.&]{2,50})',
+        r'Dear\s+([A-Z][A-Z\s\.&]{2,50})',
+        
+        # Pattern 5: Name on separate line before account details
+        r'\n([A-Z][A-Z\s\.&]{2,50})\s*\n.*?(?:Account|Statement|Branch)',
+        
+        # Pattern 6: Name in standard HDFC header format
+        r'(?:Statement\s+for|Statement\s+of)[:\s]+([A-Z][A-Z\s\.&]{2,50})',
+        
+        # Pattern 7: Simple capitalized name near start (last resort)
+        r'^.*?\b([A-Z][A-Z\s\.]{10,50})\b',
+    ],
+    # Statement period - try multiple patterns
+    'statement_period': [
+        r'Statement\s+Period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
+        r'Statement\s+from[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
+        r'Period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
+        r'From[:\s]+([0-9/\-]+)[:\s]+To[:\s]+([0-9/\-]+)',
+        r'Statement\s+for\s+the\s+period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
+    ],
+}, flags={
+    'account_number': re.IGNORECASE,
+    'account_holder': re.IGNORECASE | re.MULTILINE,
+    'statement_period': re.IGNORECASE,
+})
 
 
 class HDFCExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTION_PLAN = PLAN_TABLES
+    # Customer block ends above the transaction table header
+    METADATA_REGION = (0, 0, 1, 0.21)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "HDFC"
 
     def extract_metadata(self, text: str):
         """
         Extract account metadata from HDFC statement
-        HDFC statements have various formats, so we try multiple patterns
+        HDFC statements have various formats, so we try multiple patterns,
+        in HDFC_METADATA's priority order
         """
-        # Extract account number - try multiple patterns
-        account_patterns = [
-            r'Account\s+Number[:\s]+(\d+)',
-            r'Account\s+No\.?[:\s]+(\d+)',
-            r'A/c\s+No\.?[:\s]+(\d+)',
-            r'Account[:\s]+(\d{10,})',
-            r'Savings\s+Account[:\s]+(\d+)',
-            r'(?:Account|A/C)\s*[:.]?\s*(\d{10,})',
-        ]
-        
-        for pattern in account_patterns:
-            account_match = re.search(pattern, text, re.IGNORECASE)
-            if account_match:
-                self.account_number = account_match.group(1).strip()
-                break
+        account_match = HDFC_METADATA.search('account_number', text)
+        if account_match:
+            self.account_number = account_match.group(1).strip()
         
-        # Extract account holder name - HDFC specific patterns
-        # Try to find name near account number or in common HDFC locations
-        name_patterns = [
-            # Pattern 1: Name after "Customer Name", "Account Holder", etc
-            r'(?:Customer\s+Name|Account\s+Holder|Name\s+of\s+Account\s+Holder|Account\s+Name)[:\s]+([A-Z][A-Z\s\.&]{2,50})(?:\s+Account|\s+Address|\s+Branch|\s+IFSC|\s*\n|$)',
-            
-            # Pattern 2: Name at the start of address block
-            r'^([A-Z][A-Z\s\.&]{2,50})\s+(?:Address|Home|Office|Branch)',
-            
-            # Pattern 3: Name before Account Number
-            r'([A-Z][A-Z\s\.&]{2,50})\s+Account\s+(?:Number|No)',
+        # Name candidates in pattern priority order; the next pattern is
+        # only searched if this one's name is rejected
+        for name_match in HDFC_METADATA.candidates('account_holder', text):
+            name = name_match.group(1).strip()
             
-            # Pattern 4: "Dear" salutation
-            r'Dear\s+(?:Mr\.|Ms\.|Mrs\.|Dr\.)\s+([A-Z][A-Z\s\.&]{2,50})',
-            r'Dear\s+([A-Z][A-Z\s\.&]{2,50})',
+            # Clean up the name
+            name = re.sub(r'\s+', ' ', name)  # Multiple spaces to single
+            name = name.strip()
             
-            # Pattern 5: Name on separate line before account details
-            r'\n([A-Z][A-Z\s\.&]{2,50})\s*\n.*?(?:Account|Statement|Branch)',
+            # Filter out common non-name text
+            excluded_words = [
+                'STATEMENT', 'ACCOUNT', 'BANK', 'BRANCH', 'ADDRESS', 'SAVINGS',
+                'CURRENT', 'DEPOSIT', 'INDIA', 'LIMITED', 'DETAILS', 'PERIOD',
+                'BALANCE', 'CREDIT', 'DEBIT', 'TRANSACTION', 'DATE', 'DESCRIPTION',
+                'AMOUNT', 'IFSC', 'MICR', 'CODE', 'CUSTOMER', 'HOLDER', 'NUMBER',
+                'MOBILE', 'EMAIL', 'PHONE', 'CITY', 'STATE', 'PINCODE', 'COUNTRY'
+            ]
             
-            # Pattern 6: Name in standard HDFC header format
-            r'(?:Statement\s+for|Statement\s+of)[:\s]+([A-Z][A-Z\s\.&]{2,50})',
+            name_upper = name.upper()
+            is_valid_name = True
             
-            # Pattern 7: Simple capitalized name near start (last resort)
-            r'^.*?\b([A-Z][A-Z\s\.]{10,50})\b',
-        ]
-        
-        for pattern in name_patterns:
-            name_match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if name_match:
-                name = name_match.group(1).strip()
-                
-                # Clean up the name
-                name = re.sub(r'\s+', ' ', name)  # Multiple spaces to single
-                name = name.strip()
-                
-                # Filter out common non-name text
-                excluded_words = [
-                    'STATEMENT', 'ACCOUNT', 'BANK', 'BRANCH', 'ADDRESS', 'SAVINGS',
-                    'CURRENT', 'DEPOSIT', 'INDIA', 'LIMITED', 'DETAILS', 'PERIOD',
-                    'BALANCE', 'CREDIT', 'DEBIT', 'TRANSACTION', 'DATE', 'DESCRIPTION',
-                    'AMOUNT', 'IFSC', 'MICR', 'CODE', 'CUSTOMER', 'HOLDER', 'NUMBER',
-                    'MOBILE', 'EMAIL', 'PHONE', 'CITY', 'STATE', 'PINCODE', 'COUNTRY'
-                ]
-                
-                name_upper = name.upper()
-                is_valid_name = True
-                
-                # Check if name contains excluded words
-                for excluded in excluded_words:
-                    if excluded in name_upper:
-                        is_valid_name = False
-                        break
-                
-                # Additional validation: name should have at least 2 parts
-                name_parts = name.split()
-                if len(name_parts) < 2:
+            # Check if name contains excluded words
+            for excluded in excluded_words:
+                if excluded in name_upper:
                     is_valid_name = False
-                
-                # Additional validation: name should not be too long
-                if len(name) > 50:
-                    is_valid_name = False
-                
-                # Additional validation: name should not contain numbers
-                if re.search(r'\d', name):
-                    is_valid_name = False
-                
-                if is_valid_name and len(name) > 3:
-                    self.account_holder = name
                     break
+            
+            # Additional validation: name should have at least 2 parts
+            name_parts = name.split()
+            if len(name_parts) < 2:
+                is_valid_name = False
+            
+            # Additional validation: name should not be too long
+            if len(name) > 50:
+                is_valid_name = False
+            
+            # Additional validation: name should not contain numbers
+            if re.search(r'\d', name):
+                is_valid_name = False
+            
+            if is_valid_name and len(name) > 3:
+                self.account_holder = name
+                break
         
         # If still no name found, try extracting from first 500 chars more aggressively
         if not self.account_holder:
@@ -113,24 +132,14 @@ class HDFCExtractor(BasePDFExtractor):
                         self.account_holder = name
                         break
         
-        # Extract statement period - try multiple patterns
-        period_patterns = [
-            r'Statement\s+Period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
-            r'Statement\s+from[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
-            r'Period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
-            r'From[:\s]+([0-9/\-]+)[:\s]+To[:\s]+([0-9/\-]+)',
-            r'Statement\s+for\s+the\s+period[:\s]+([0-9/\-\s]+(?:to|To|TO)[0-9/\-\s]+)',
-        ]
-        
-        for pattern in period_patterns:
-            period_match = re.search(pattern, text, re.IGNORECASE)
-            if period_match:
-                if period_match.lastindex == 2:
-                    # Pattern with separate From and To
-                    self.statement_period = f"From {period_match.group(1)} To {period_match.group(2)}"
-                else:
-                    self.statement_period = period_match.group(1).strip()
-                break
+        # Extract statement period
+        period_match = HDFC_METADATA.search('statement_period', text)
+        if period_match:
+            if period_match.lastindex == 2:
+                # Pattern with separate From and To
+                self.statement_period = f"From {period_match.group(1)} To {period_match.group(2)}"
+            else:
+                self.statement_period = period_match.group(1).strip()
         
         # If still empty, try to extract from date range in transactions
         if not self.statement_period and self.transactions:
@@ -169,20 +178,20 @@ class HDFCExtractor(BasePDFExtractor):
                 if not description or description.lower() in ['', 'none', 'nan']:
                     continue
 
-                debit = self.parse_amount(row[debit_idx]) if debit_idx >= 0 and debit_idx < len(row) else 0.0
-                credit = self.parse_amount(row[credit_idx]) if credit_idx >= 0 and credit_idx < len(row) else 0.0
-                balance = self.parse_amount(row[balance_idx]) if balance_idx >= 0 and balance_idx < len(row) else 0.0
+                debit = self.parse_paise(row[debit_idx]) if debit_idx >= 0 and debit_idx < len(row) else 0
+                credit = self.parse_paise(row[credit_idx]) if credit_idx >= 0 and credit_idx < len(row) else 0
+                balance = self.parse_paise(row[balance_idx]) if balance_idx >= 0 and balance_idx < len(row) else 0
 
                 transaction_type = "Credit" if credit > 0 else "Debit"
 
-                self.transactions.append({
-                    "date": str(date_val).strip(),
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                self.transactions.append(Transaction(
+                    date=str(date_val).strip(),
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
 
     def _find_column(self, header, keywords):
         """Find column index by matching keywords"""
@@ -0,0 +1,52 @@
+# backend/pdf_extractor/memory.py
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def release_page(page):
+    """
+    Drop everything pdfplumber cached on a page: the pdfminer layout, the
+    parsed objects and edges, and the memoized textmap. The page can still
+    be read again later, it is just re-parsed.
+    """
+    page.flush_cache()
+    page.get_textmap.cache_clear()
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes, 0 if it can't be read"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    # No /proc: fall back to the process-wide high-water mark
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux and the BSDs report KiB
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return 0
+
+
+class PeakRSS:
+    """
+    Highest RSS seen between start() and the last sample()
+    Sampled once per page, which is where extraction memory peaks.
+    Only this process is measured, not page-parallel workers.
+    """
+
+    def __init__(self):
+        self.peak = 0
+
+    def start(self):
+        self.peak = current_rss()
+
+    def sample(self) -> int:
+        self.peak = max(self.peak, current_rss())
+        return self.peak
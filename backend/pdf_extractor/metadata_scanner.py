@@ -0,0 +1,35 @@
+# backend/pdf_extractor/metadata_scanner.py
+import re
+from typing import Dict, Iterator, List, Match, Optional
+
+
+class MetadataScanner:
+    """
+    Metadata fields that each have several patterns, in priority order
+    The patterns are compiled once, at import, instead of on every
+    extract_metadata() call. Each field's patterns are searched one at a
+    time and only as far as the caller asks: search() stops at the first
+    pattern that matches, like the old "for pattern in patterns:
+    re.search(...)" loop, and candidates() goes on to the next pattern only
+    when the caller rejects the current match.
+    Banks with one pattern per field don't need this; a module-level
+    re.compile() is enough there.
+    """
+
+    def __init__(self, fields: Dict[str, List[str]], flags: Dict[str, int] = None):
+        flags = flags or {}
+        self.patterns = {
+            field: [re.compile(pattern, flags.get(field, 0)) for pattern in patterns]
+            for field, patterns in fields.items()
+        }
+
+    def search(self, field: str, text: str) -> Optional[Match]:
+        """Match of the field's highest-priority pattern that matches, else None"""
+        return next(self.candidates(field, text), None)
+
+    def candidates(self, field: str, text: str) -> Iterator[Match]:
+        """First match of each of the field's patterns that matches, in priority order"""
+        for regex in self.patterns[field]:
+            match = regex.search(text)
+            if match:
+                yield match
@@ -0,0 +1,197 @@
+# backend/pdf_extractor/reconcile.py
+from typing import Dict, List, Optional
+
+from normalizer.records import Transaction
+
+try:
+    import numpy as np
+except ImportError:  # optional: chunks are checked in pure Python instead
+    np = None
+
+ORDER_ASCENDING = "ascending"
+ORDER_DESCENDING = "descending"
+
+
+class BalanceReconciler:
+    """
+    Debit/credit from the running balance instead of description keywords
+    Each row's balance minus its predecessor's is the row's signed amount.
+    A row whose debit/credit already agree with that delta is left alone;
+    a row whose amount matches the delta's size but sits in the wrong
+    column (or whose one amount was recorded as a debit by default) is
+    moved to the column the delta's sign says; any other row breaks the
+    chain and is reported, untouched.
+    Statements are printed oldest-first or newest-first; the order whose
+    deltas agree with more of the first SAMPLE_SIZE rows wins, so the
+    predecessor is the row above or the row below. The first row in chain
+    order has no predecessor and is never checked. If even the better order
+    would move more of the sample's amounts than it confirms, the printed
+    balances are not trusted to decide direction: nothing is moved and every
+    disagreeing row is reported as a break.
+    feed() takes rows as they are extracted (a page at a time from
+    extract_iter, the whole document from extract) and returns the rows
+    that are settled; finish() returns the rest. Each chunk is diffed as
+    the records' integer paise, with NumPy when it is installed.
+    """
+    SAMPLE_SIZE = 20
+    # Break indices kept for the report; the rest are only counted
+    BREAK_SAMPLE_SIZE = 20
+
+    def __init__(self):
+        self.order: Optional[str] = None
+        # False when the balance chain contradicts most extracted directions
+        self.correcting = True
+        self.checked = 0
+        self.matched = 0
+        self.corrected = 0
+        self.break_count = 0
+        # Indices of the first BREAK_SAMPLE_SIZE breaks
+        self.break_sample: List[int] = []
+        self._pending: List[Transaction] = []
+        # Global index of the first pending row
+        self._offset = 0
+        # Balance (paise) of the last settled row, the next row's predecessor
+        self._previous: Optional[int] = None
+
+    def feed(self, transactions: List[Transaction]) -> List[Transaction]:
+        self._pending.extend(transactions)
+        if self.order is None:
+            if len(self._pending) <= self.SAMPLE_SIZE:
+                return []
+            self._infer_order(self._pending[:self.SAMPLE_SIZE + 1])
+
+        if self.order == ORDER_DESCENDING:
+            # The last row's predecessor is the next row, not seen yet
+            ready, self._pending = self._pending[:-1], self._pending[-1:]
+            if ready:
+                self._check(ready, self._pending[0])
+        else:
+            ready, self._pending = self._pending, []
+            if ready:
+                self._check(ready)
+        return ready
+
+    def finish(self) -> List[Transaction]:
+        if self.order is None:
+            self._infer_order(self._pending)
+        ready, self._pending = self._pending, []
+        if ready:
+            self._check(ready)
+        return ready
+
+    def reconcile(self, transactions: List[Transaction]) -> List[Transaction]:
+        """The whole document in one batch"""
+        return self.feed(transactions) + self.finish()
+
+    def report(self) -> Dict:
+        return {
+            "order": self.order,
+            "correcting": self.correcting,
+            "checked": self.checked,
+            "matched": self.matched,
+            "corrected": self.corrected,
+            "break_count": self.break_count,
+            "break_sample": self.break_sample,
+            # Share of checked rows that fit the balance chain, 1.0 for a clean statement
+            "integrity": round(self.matched / self.checked, 4) if self.checked else None
+        }
+
+    def _infer_order(self, sample: List[Transaction]):
+        """Set order and correcting from (rows confirmed, rows that would move) in each order"""
+        balances = [transaction.balance_paise for transaction in sample]
+        debits = [transaction.debit_paise for transaction in sample]
+        credits = [transaction.credit_paise for transaction in sample]
+        ascending = [0, 0]
+        descending = [0, 0]
+        for index in range(1, len(sample)):
+            delta = balances[index] - balances[index - 1]
+            _score(ascending, delta, debits[index], credits[index])
+            _score(descending, -delta, debits[index - 1], credits[index - 1])
+        # Descending only on strictly better evidence: confirmed rows first
+        scores = ascending
+        self.order = ORDER_ASCENDING
+        if descending > ascending:
+            scores = descending
+            self.order = ORDER_DESCENDING
+        self.correcting = scores[1] <= scores[0]
+
+    def _check(self, rows: List[Transaction], successor: Optional[Transaction] = None):
+        """Check rows against their predecessors and fix misplaced amounts"""
+        balances = [transaction.balance_paise for transaction in rows]
+        debits = [transaction.debit_paise for transaction in rows]
+        credits = [transaction.credit_paise for transaction in rows]
+
+        # Predecessor balance of each row; None for the chain's first row,
+        # which can only be the chunk's first (ascending) or last (descending)
+        if self.order == ORDER_DESCENDING:
+            predecessors = balances[1:] + [successor.balance_paise if successor is not None else None]
+        else:
+            predecessors = [self._previous] + balances[:-1]
+            self._previous = balances[-1]
+        first_checked = 1 if predecessors[0] is None else 0
+        last_checked = max(len(rows) - (1 if predecessors[-1] is None else 0), first_checked)
+
+        if np is not None and last_checked - first_checked > 1:
+            delta = (np.asarray(balances[first_checked:last_checked], dtype=np.int64)
+                     - np.asarray(predecessors[first_checked:last_checked], dtype=np.int64))
+            debit = np.asarray(debits[first_checked:last_checked], dtype=np.int64)
+            credit = np.asarray(credits[first_checked:last_checked], dtype=np.int64)
+            consistent = credit - debit == delta
+            as_credit = ~consistent & (delta > 0) & ((credit == delta) | (debit == delta))
+            as_debit = ~consistent & (delta < 0) & ((debit == -delta) | (credit == -delta))
+            if not self.correcting:
+                as_credit[:] = False
+                as_debit[:] = False
+            matched = int(np.count_nonzero(consistent))
+            moved = (np.flatnonzero(as_credit | as_debit) + first_checked).tolist()
+            broken = (np.flatnonzero(~(consistent | as_credit | as_debit)) + first_checked).tolist()
+            deltas = dict(zip(moved, (delta[np.asarray(moved, dtype=np.int64) - first_checked]).tolist()))
+        else:
+            matched = 0
+            moved = []
+            broken = []
+            deltas = {}
+            for index in range(first_checked, last_checked):
+                delta = balances[index] - predecessors[index]
+                if credits[index] - debits[index] == delta:
+                    matched += 1
+                elif self.correcting and _fits(delta, debits[index], credits[index]):
+                    moved.append(index)
+                    deltas[index] = delta
+                else:
+                    broken.append(index)
+
+        for index in moved:
+            delta = deltas[index]
+            transaction = rows[index]
+            transaction.credit_paise = delta if delta > 0 else 0
+            transaction.debit_paise = -delta if delta < 0 else 0
+            transaction.transaction_type = "Credit" if delta > 0 else "Debit"
+
+        self.checked += last_checked - first_checked
+        self.matched += matched + len(moved)
+        self.corrected += len(moved)
+        self.break_count += len(broken)
+        room = self.BREAK_SAMPLE_SIZE - len(self.break_sample)
+        if room > 0:
+            self.break_sample.extend(self._offset + index for index in broken[:room])
+        self._offset += len(rows)
+
+
+def _score(scores: List[int], delta: int, debit: int, credit: int):
+    """Count a sample row as confirmed by the delta, or as one the delta would move"""
+    if credit - debit == delta:
+        scores[0] += 1
+    elif _fits(delta, debit, credit):
+        scores[1] += 1
+
+
+def _fits(delta: int, debit: int, credit: int) -> bool:
+    """Whether the row's amounts explain the balance delta, in either column"""
+    if credit - debit == delta:
+        return True
+    if delta > 0:
+        return credit == delta or debit == delta
+    if delta < 0:
+        return debit == -delta or credit == -delta
+    return False
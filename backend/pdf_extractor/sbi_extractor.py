@@ -1,25 +1,36 @@
 # backend/pdf_extractor/sbi_extractor.py
 import re
 from datetime import datetime
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_TEXT_TABLE_FALLBACK
+
+
+# Metadata patterns, compiled once
+SBI_ACCOUNT_NUMBER = re.compile(r'Account\s+Number\s+(\d+)', re.IGNORECASE)
+SBI_ACCOUNT_HOLDER = re.compile(r'Account\s+Name\s+(.+)', re.IGNORECASE)
+SBI_STATEMENT_PERIOD = re.compile(r'Account\s+Statement\s+for\s+the\s+period\s+(.+)', re.IGNORECASE)
 
 
 class SBIExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTION_PLAN = PLAN_TEXT_TABLE_FALLBACK
+    # Account details and the statement period line
+    METADATA_REGION = (0, 0, 1, 0.33)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "SBI"
 
     def extract_metadata(self, text: str):
-        account_match = re.search(r'Account\s+Number\s+(\d+)', text, re.IGNORECASE)
+        account_match = SBI_ACCOUNT_NUMBER.search(text)
         if account_match:
             self.account_number = account_match.group(1)
 
-        name_match = re.search(r'Account\s+Name\s+(.+)', text, re.IGNORECASE)
+        name_match = SBI_ACCOUNT_HOLDER.search(text)
         if name_match:
             name_line = name_match.group(1).strip()
             self.account_holder = name_line.split('\n')[0].strip()
 
-        period_match = re.search(r'Account\s+Statement\s+for\s+the\s+period\s+(.+)', text, re.IGNORECASE)
+        period_match = SBI_STATEMENT_PERIOD.search(text)
         if period_match:
             self.statement_period = period_match.group(1).strip()
 
@@ -49,21 +60,21 @@ class SBIExtractor(BasePDFExtractor):
                 if 'Narration' in description or 'Date' in description:
                     continue
                 
-                debit = self.parse_amount(debit_str)
-                credit = self.parse_amount(credit_str)
-                balance = self.parse_amount(balance_str)
+                debit = self.parse_paise(debit_str)
+                credit = self.parse_paise(credit_str)
+                balance = self.parse_paise(balance_str)
                 
                 # Determine transaction type
                 transaction_type = "Credit" if credit > 0 else "Debit"
                 
-                self.transactions.append({
-                    "date": date_str,
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                self.transactions.append(Transaction(
+                    date=date_str,
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
 
         # Fallback to table extraction if text parsing fails
         if len(self.transactions) == 0:
@@ -91,10 +102,13 @@ class SBIExtractor(BasePDFExtractor):
                 if 'Narration' in description or 'Date' in date_val:
                     continue
                 
-                # Find numeric columns (debit, credit, balance)
+                # Find numeric columns (debit, credit, balance); amounts are
+                # printed with paise, Ref/Cheque numbers never are
                 numeric_values = []
                 for cell in row[2:]:
-                    val = self.parse_amount(cell)
+                    if not cell or '.' not in str(cell):
+                        continue
+                    val = self.parse_paise(cell)
                     if val > 0:
                         numeric_values.append(val)
                 
@@ -106,30 +120,25 @@ class SBIExtractor(BasePDFExtractor):
                 
                 # Determine debit/credit
                 if len(numeric_values) == 2:
-                    # Only one amount + balance
-                    amount = numeric_values[0]
-                    # Check description for credit indicators
-                    if any(word in description.upper() for word in ['SALARY', 'CREDIT', 'NEFT CR', 'IMPS CR', 'RTGS']):
-                        debit = 0.0
-                        credit = amount
-                    else:
-                        debit = amount
-                        credit = 0.0
+                    # Only one amount + balance; recorded as a debit, the
+                    # balance reconciliation pass moves it if the balance rose
+                    debit = numeric_values[0]
+                    credit = 0
                 else:
                     # Both debit and credit present
-                    debit = numeric_values[0] if numeric_values[0] != balance else 0.0
-                    credit = numeric_values[1] if len(numeric_values) > 2 and numeric_values[1] != balance else 0.0
+                    debit = numeric_values[0] if numeric_values[0] != balance else 0
+                    credit = numeric_values[1] if len(numeric_values) > 2 and numeric_values[1] != balance else 0
                 
                 transaction_type = "Credit" if credit > 0 else "Debit"
                 
-                self.transactions.append({
-                    "date": date_val,
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                self.transactions.append(Transaction(
+                    date=date_val,
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
 
     def _is_valid_date(self, date_str: str) -> bool:
         date_patterns = [
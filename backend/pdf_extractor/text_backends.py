@@ -0,0 +1,180 @@
+# backend/pdf_extractor/text_backends.py
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.utils import apply_matrix_pt
+from pdfplumber.utils.text import DEFAULT_X_TOLERANCE, DEFAULT_Y_TOLERANCE, LIGATURES
+
+# Char tuple fields used by the pdfminer backend
+_TOP, _BOTTOM, _X0, _X1, _TEXT, _UPRIGHT, _DOCTOP = range(7)
+
+
+class PdfplumberTextBackend:
+    """Page text through pdfplumber: every char becomes a dict, then a textmap"""
+    name = "pdfplumber"
+
+    def extract_text(self, page) -> str:
+        return page.extract_text()
+
+
+class _CharTupleDevice(PDFTextDevice):
+    """
+    pdfminer device that keeps only what line text needs from each glyph
+    Same bbox math as pdfminer's LTChar, but no layout objects, no
+    LAParams analysis (pdfplumber runs with laparams=None too) and no
+    per-char dict; chars are kept as plain tuples in render order
+    """
+
+    def __init__(self, rsrcmgr, page_height: float, initial_doctop: float = 0):
+        super().__init__(rsrcmgr)
+        self.page_height = page_height
+        self.initial_doctop = initial_doctop
+        self.chars: List[Tuple] = []
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate):
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = "(cid:%d)" % cid
+        adv = font.char_width(cid) * fontsize * scaling
+
+        if font.is_vertical():
+            vx, vy = font.char_disp(cid)
+            vx = fontsize * 0.5 if vx is None else vx * fontsize * 0.001
+            vy = (1000 - vy) * fontsize * 0.001
+            lower_left = (-vx, vy + rise + adv)
+            upper_right = (-vx + fontsize, vy + rise)
+        else:
+            descent = font.get_descent() * fontsize
+            lower_left = (0, descent + rise)
+            upper_right = (adv, descent + rise + fontsize)
+
+        a, b, c, d, _, _ = matrix
+        upright = 0 < a * d * scaling and b * c <= 0
+        x0, y0 = apply_matrix_pt(matrix, lower_left)
+        x1, y1 = apply_matrix_pt(matrix, upper_right)
+        if x1 < x0:
+            x0, x1 = x1, x0
+        if y1 < y0:
+            y0, y1 = y1, y0
+
+        top = self.page_height - y1
+        self.chars.append((top, self.page_height - y0, x0, x1, text, upright, self.initial_doctop + top))
+        return adv
+
+
+class PdfminerTextBackend:
+    """
+    Page text straight from pdfminer.six
+    Interprets the pdfplumber page's own PDFPage with a tuple-collecting
+    device, then groups chars into words and lines exactly as pdfplumber's
+    extract_text() does with its defaults, so the text is the same string
+    """
+    name = "pdfminer"
+
+    def __init__(self, x_tolerance: float = DEFAULT_X_TOLERANCE, y_tolerance: float = DEFAULT_Y_TOLERANCE):
+        self.x_tolerance = x_tolerance
+        self.y_tolerance = y_tolerance
+
+    def extract_text(self, page) -> str:
+        device = _CharTupleDevice(page.pdf.rsrcmgr, page.height, page.initial_doctop)
+        PDFPageInterpreter(page.pdf.rsrcmgr, device).process_page(page.page_obj)
+        return self.chars_to_text(device.chars)
+
+    def chars_to_text(self, chars: List[Tuple]) -> str:
+        words = []
+        for upright, group in groupby(self._sorted_chars(chars), key=lambda char: char[_UPRIGHT]):
+            words.extend(self._words(group, upright))
+        if not words:
+            return ""
+
+        # Lines are consecutive words whose doctops fall in the same cluster
+        line_of = self._cluster_ids([doctop for doctop, _ in words], self.y_tolerance)
+        return "\n".join(
+            " ".join(text for _, text in line)
+            for _, line in groupby(words, key=lambda word: line_of[word[0]])
+        )
+
+    def _sorted_chars(self, chars: List[Tuple]):
+        """Upright chars first, clustered into lines by doctop and read left to right"""
+        for upright in (True, False):
+            subset = [char for char in chars if bool(char[_UPRIGHT]) == upright]
+            if not subset:
+                continue
+            line_key, order_key = (_DOCTOP, _X0) if upright else (_X0, _DOCTOP)
+            cluster_of = self._cluster_ids([char[line_key] for char in subset], self.y_tolerance)
+            subset.sort(key=lambda char: cluster_of[char[line_key]])
+            for _, line in groupby(subset, key=lambda char: cluster_of[char[line_key]]):
+                yield from sorted(line, key=lambda char: char[order_key])
+
+    def _words(self, chars, upright: bool) -> List[Tuple[float, str]]:
+        """(doctop, text) per word, split on blanks and on gaps/jumps beyond tolerance"""
+        if upright:
+            along, along_end, across = _X0, _X1, _TOP
+            gap, jump = self.x_tolerance, self.y_tolerance
+        else:
+            along, along_end, across = _TOP, _BOTTOM, _X0
+            gap, jump = self.y_tolerance, self.x_tolerance
+
+        words = []
+        current = []
+        for char in chars:
+            text = char[_TEXT]
+            if text.isspace():
+                if current:
+                    words.append(current)
+                current = []
+            elif text == "":
+                # pdfplumber splits at "punctuation" from an empty set, which
+                # an empty string still matches: it becomes a word of its own
+                if current:
+                    words.append(current)
+                words.append([char])
+                current = []
+            elif current and (
+                char[along] < current[-1][along]
+                or char[along] > current[-1][along_end] + gap
+                or char[across] > current[-1][across] + jump
+            ):
+                words.append(current)
+                current = [char]
+            else:
+                current.append(char)
+        if current:
+            words.append(current)
+
+        # A word's doctop is its top shifted by its first char's page offset
+        return [
+            (min(char[_TOP] for char in word) + (word[0][_DOCTOP] - word[0][_TOP]),
+             "".join(LIGATURES.get(char[_TEXT], char[_TEXT]) for char in word))
+            for word in words
+        ]
+
+    @staticmethod
+    def _cluster_ids(values: List[float], tolerance: float) -> Dict[float, int]:
+        """Same chaining as pdfplumber's cluster_list: sorted values within tolerance of the previous one"""
+        cluster_of = {}
+        cluster = -1
+        last = None
+        for value in sorted(set(values)):
+            if last is None or value > last + tolerance:
+                cluster += 1
+            cluster_of[value] = cluster
+            last = value
+        return cluster_of
+
+
+TEXT_BACKENDS = {
+    PdfplumberTextBackend.name: PdfplumberTextBackend(),
+    PdfminerTextBackend.name: PdfminerTextBackend(),
+}
+
+
+def get_text_backend(name: str):
+    try:
+        return TEXT_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown text backend: {name} (expected one of {', '.join(TEXT_BACKENDS)})")
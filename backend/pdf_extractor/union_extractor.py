@@ -1,23 +1,34 @@
 # backend/pdf_extractor/union_extractor.py
 import re
-from .base_extractor import BasePDFExtractor
+from normalizer.records import Transaction
+from .base_extractor import BasePDFExtractor, PLAN_TABLES
+
+
+# Metadata patterns, compiled once
+UNION_ACCOUNT_NUMBER = re.compile(r'Account\s+(?:No|Number)[:\s]+(\d+)', re.IGNORECASE)
+UNION_ACCOUNT_HOLDER = re.compile(r'(?:Name|Account\s+Holder)[:\s]+([A-Z\s]+)', re.IGNORECASE)
+UNION_STATEMENT_PERIOD = re.compile(r'Statement\s+Period[:\s]+(.+)', re.IGNORECASE)
 
 
 class UnionExtractor(BasePDFExtractor):
-    def __init__(self, pdf_path: str):
-        super().__init__(pdf_path)
+    EXTRACTION_PLAN = PLAN_TABLES
+    # DETAILS OF STATEMENT block down to the Statement Period line
+    METADATA_REGION = (0, 0, 1, 0.37)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
         self.bank_name = "UNION"
 
     def extract_metadata(self, text: str):
-        account_match = re.search(r'Account\s+(?:No|Number)[:\s]+(\d+)', text, re.IGNORECASE)
+        account_match = UNION_ACCOUNT_NUMBER.search(text)
         if account_match:
             self.account_number = account_match.group(1)
 
-        name_match = re.search(r'(?:Name|Account\s+Holder)[:\s]+([A-Z\s]+)', text, re.IGNORECASE)
+        name_match = UNION_ACCOUNT_HOLDER.search(text)
         if name_match:
             self.account_holder = name_match.group(1).strip()
 
-        period_match = re.search(r'Statement\s+Period[:\s]+(.+)', text, re.IGNORECASE)
+        period_match = UNION_STATEMENT_PERIOD.search(text)
         if period_match:
             self.statement_period = period_match.group(1).strip()
 
@@ -59,43 +70,43 @@ class UnionExtractor(BasePDFExtractor):
                     continue
 
                 # Extract amount and determine debit/credit
-                debit = 0.0
-                credit = 0.0
+                debit = 0
+                credit = 0
                 
                 if amount_idx >= 0 and amount_idx < len(row) and row[amount_idx]:
                     amount_str = str(row[amount_idx]).strip()
                     
                     # Check if it's debit or credit based on (Dr) or (Cr) suffix
                     if '(Dr)' in amount_str or '(dr)' in amount_str:
-                        debit = self.parse_amount(amount_str.replace('(Dr)', '').replace('(dr)', ''))
+                        debit = self.parse_paise(amount_str.replace('(Dr)', '').replace('(dr)', ''))
                     elif '(Cr)' in amount_str or '(cr)' in amount_str:
-                        credit = self.parse_amount(amount_str.replace('(Cr)', '').replace('(cr)', ''))
+                        credit = self.parse_paise(amount_str.replace('(Cr)', '').replace('(cr)', ''))
                     else:
                         # If no suffix, try to determine from balance change or assume debit
-                        amount = self.parse_amount(amount_str)
+                        amount = self.parse_paise(amount_str)
                         # Default to debit if we can't determine
                         debit = amount
 
                 # Extract balance
-                balance = 0.0
+                balance = 0
                 if balance_idx >= 0 and balance_idx < len(row) and row[balance_idx]:
                     balance_str = str(row[balance_idx]).strip()
                     # Remove any (Cr) or (Dr) suffix from balance
                     balance_str = balance_str.replace('(Cr)', '').replace('(cr)', '').replace('(Dr)', '').replace('(dr)', '')
-                    balance = self.parse_amount(balance_str)
+                    balance = self.parse_paise(balance_str)
 
                 # Determine transaction type
                 transaction_type = "Credit" if credit > 0 else "Debit"
 
-                self.transactions.append({
+                self.transactions.append(Transaction(
                     # "transaction_id": transaction_id,
-                    "date": str(date_val).strip(),
-                    "description": description,
-                    "debit": debit,
-                    "credit": credit,
-                    "balance": balance,
-                    "transaction_type": transaction_type
-                })
+                    date=str(date_val).strip(),
+                    description=description,
+                    debit_paise=debit,
+                    credit_paise=credit,
+                    balance_paise=balance,
+                    transaction_type=transaction_type
+                ))
 
     def _find_column(self, header, keywords):
         """Find column index by matching keywords"""
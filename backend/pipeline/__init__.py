@@ -0,0 +1,8 @@
+# backend/pipeline/__init__.py
+from .extraction_cache import ExtractionCache
+from .manifest import BatchManifest
+from .scheduler import BatchJob, longest_first, makespan_report, page_count
+from .stages import Stage, StagedPipeline
+
+__all__ = ['ExtractionCache', 'BatchManifest', 'BatchJob', 'longest_first', 'makespan_report', 'page_count',
+           'Stage', 'StagedPipeline']
\ No newline at end of file
@@ -0,0 +1,107 @@
+# backend/pipeline/extraction_cache.py
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from normalizer.records import record_default
+
+
+class ExtractionCache:
+    """
+    Content-addressed on-disk cache of extraction results
+    Entries are keyed by the SHA-256 of the PDF bytes plus the extractor
+    class and version (and the normalizer version), and hold the extracted statement (to_dict output)
+    together with its normalized transactions.
+    File mtimes record recency: hits touch the entry, and once the cache
+    grows past max_bytes the least recently used entries are evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir, max_bytes: int = DEFAULT_MAX_BYTES, normalizer_version: str = '0'):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.normalizer_version = normalizer_version
+
+    @staticmethod
+    def hash_file(path, chunk_size: int = 1024 * 1024) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """hash_file() of a file already read into memory"""
+        return hashlib.sha256(data).hexdigest()
+
+    def key_for(self, pdf_path, extractor_class, pdf_hash: Optional[str] = None) -> str:
+        """Cache key: PDF content hash + extractor name and version + normalizer version"""
+        pdf_hash = pdf_hash or self.hash_file(pdf_path)
+        version = getattr(extractor_class, 'EXTRACTOR_VERSION', '0')
+        return f"{pdf_hash}-{extractor_class.__name__}-v{version}-n{self.normalizer_version}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (ValueError, OSError):
+            # Corrupt or half-written entry, drop it and re-extract
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, statement_data: Dict, normalized_transactions: List[Dict]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                "statement": statement_data,
+                "normalized": normalized_transactions
+            }, f, separators=(',', ':'), default=record_default)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        # Oldest access first
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
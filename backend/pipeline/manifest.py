@@ -0,0 +1,112 @@
+# backend/pipeline/manifest.py
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .extraction_cache import ExtractionCache
+
+
+class BatchManifest:
+    """
+    What the last process_all runs did with each source PDF
+    Entries are keyed by the PDF's path relative to the raw PDF directory
+    and record its size, mtime and SHA-256, the extractor and normalizer
+    versions and output format it was processed with, the output files it
+    produced and its summary row.
+    A PDF is unchanged when size and mtime match (no read at all) or, if
+    only the mtime moved, when the hash still matches; a different version
+    or output format makes it changed, and so does a recorded output that
+    is no longer on disk. Failed and truncated runs are never recorded, so
+    they are retried.
+    """
+
+    def __init__(self, path, source_root):
+        self.path = Path(path)
+        self.source_root = Path(source_root)
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError):
+            # Unreadable manifest: start over, every file counts as new
+            self.entries = {}
+
+    def key_for(self, pdf_file: Path) -> str:
+        return Path(pdf_file).relative_to(self.source_root).as_posix()
+
+    def unchanged(self, pdf_file: Path, fingerprint: Dict) -> Optional[Dict]:
+        """
+        The entry if pdf_file was already processed with the same
+        fingerprint (versions and output format), else None
+        Fills in fingerprint's size and mtime, and its sha256 when the hash
+        had to decide; the caller can reuse it instead of hashing again
+        """
+        entry = self.entries.get(self.key_for(pdf_file))
+        stat = os.stat(pdf_file)
+        fingerprint["size"] = stat.st_size
+        fingerprint["mtime"] = stat.st_mtime
+        if entry is None or entry["size"] != stat.st_size or any(
+                entry.get(field) != value for field, value in fingerprint.items()
+                if field not in ("size", "mtime", "sha256")):
+            return None
+        if not all(Path(output).exists() for output in entry.get("outputs", [])):
+            # Deleted or moved since: write it again
+            return None
+        if entry["mtime"] == stat.st_mtime:
+            return entry
+
+        # Touched but maybe not modified
+        fingerprint["sha256"] = ExtractionCache.hash_file(pdf_file)
+        if entry.get("sha256") != fingerprint["sha256"]:
+            return None
+        entry["mtime"] = stat.st_mtime
+        return entry
+
+    def record(self, pdf_file: Path, fingerprint: Dict, outputs: Iterable, summary: Dict):
+        if "sha256" not in fingerprint:
+            fingerprint["sha256"] = ExtractionCache.hash_file(pdf_file)
+        key = self.key_for(pdf_file)
+        previous = self.entries.get(key, {}).get("outputs", [])
+        self.entries[key] = {
+            **fingerprint,
+            "outputs": [str(output) for output in outputs if output],
+            "summary": summary
+        }
+        for output in previous:
+            # Re-processed into a different format: the old output is stale
+            self._remove_output(output)
+
+    def forget(self, pdf_file: Path):
+        """Drop pdf_file's entry (its outputs stay), so the next run processes it again"""
+        self.entries.pop(self.key_for(pdf_file), None)
+
+    def prune(self, present: Iterable[Path]) -> List[str]:
+        """Drop the entries, and delete the outputs, of sources no longer present"""
+        present_keys = {self.key_for(pdf_file) for pdf_file in present}
+        removed = []
+        for key in sorted(set(self.entries) - present_keys):
+            for output in self.entries.pop(key).get("outputs", []):
+                self._remove_output(output)
+            removed.append(key)
+        return removed
+
+    def _remove_output(self, output: str):
+        # Two sources can share an output name (same file name in two bank folders)
+        if any(output in entry.get("outputs", []) for entry in self.entries.values()):
+            return
+        try:
+            Path(output).unlink()
+        except OSError:
+            pass
+
+    def save(self):
+        """Written to a temp file and renamed, so a crashed run leaves the old manifest"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({"entries": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
@@ -0,0 +1,144 @@
+# backend/pipeline/stages.py
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Sent down a queue once per worker of the stage reading it, after the last item
+_DONE = object()
+
+
+class Stage:
+    """
+    One step of a StagedPipeline: fn(item) -> item, run by `workers` threads
+    The stage reads from a queue of at most queue_size items. When it is
+    full, the stage before it blocks on put() instead of running ahead, so
+    a slow stage holds back everything upstream of it (backpressure) and at
+    most queue_size items wait in front of each stage.
+    """
+
+    def __init__(self, name: str, fn: Callable, workers: int = 1, queue_size: int = 2):
+        self.name = name
+        self.fn = fn
+        self.workers = max(workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.items = 0
+        self.failed = 0
+        # Time in fn, and time the stage's workers waited on a full next queue
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_depth = 0
+        self._lock = threading.Lock()
+
+    def report(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "items": self.items,
+            "failed": self.failed,
+            "busy_s": round(self.busy_seconds, 2),
+            "blocked_s": round(self.blocked_seconds, 2),
+            # Most items seen waiting in this stage's queue
+            "max_depth": self.max_depth
+        }
+
+
+class StagedPipeline:
+    """
+    Items flow source -> stage 1 -> ... -> stage n, each stage on its own threads
+    Every stage works on a different item at once: while one PDF is being
+    extracted the next is being read and the previous one written. An item
+    whose fn raises is passed on untouched with the exception and skipped
+    by the later stages, so one bad file doesn't stop the batch.
+    Threads suit the I/O stages; a CPU-bound stage gets parallelism by
+    having its fn hand the work to a process pool and wait for it.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = stages
+        # The source (the items run() is given) reported like a stage
+        self.source = Stage("discover", None)
+
+    def run(self, items: Iterable) -> Iterator[Tuple[object, Exception, Dict[str, float]]]:
+        """
+        (item, exception or None, {stage name: seconds spent in it}) per item, in completion order
+        Yielded as items leave the last stage, so the caller can drop each one
+        before the next arrives; the iterator must be run to the end
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        finished = queue.Queue()
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]), daemon=True)]
+        for position, stage in enumerate(self.stages):
+            if position + 1 < len(self.stages):
+                next_stage, outbox = self.stages[position + 1], queues[position + 1]
+            else:
+                next_stage, outbox = None, finished
+            remaining = [stage.workers]
+            threads.extend(
+                threading.Thread(target=self._work, name=f"{stage.name}-{worker}", daemon=True,
+                                 args=(stage, queues[position], next_stage, outbox, remaining))
+                for worker in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+
+        while True:
+            envelope = finished.get()
+            if envelope is _DONE:
+                break
+            yield tuple(envelope)
+        for thread in threads:
+            thread.join()
+
+    def report(self) -> Dict[str, Dict]:
+        return {stage.name: stage.report() for stage in [self.source] + self.stages}
+
+    def _feed(self, items: Iterable, outbox: queue.Queue):
+        try:
+            for item in items:
+                self.source.items += 1
+                _put(self.source, self.stages[0], outbox, [item, None, {}])
+        finally:
+            for _ in range(self.stages[0].workers):
+                outbox.put(_DONE)
+
+    @staticmethod
+    def _work(stage: Stage, inbox: queue.Queue, next_stage: Stage, outbox: queue.Queue, remaining: List[int]):
+        while True:
+            envelope = inbox.get()
+            if envelope is _DONE:
+                break
+            if envelope[1] is None:
+                started = time.perf_counter()
+                try:
+                    envelope[0] = stage.fn(envelope[0])
+                except Exception as e:
+                    envelope[1] = e
+                    with stage._lock:
+                        stage.failed += 1
+                elapsed = time.perf_counter() - started
+                envelope[2][stage.name] = elapsed
+                with stage._lock:
+                    stage.items += 1
+                    stage.busy_seconds += elapsed
+            _put(stage, next_stage, outbox, envelope)
+
+        # The stage's last worker to finish tells the next stage's workers
+        with stage._lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(next_stage.workers if next_stage else 1):
+                outbox.put(_DONE)
+
+
+def _put(stage: Stage, next_stage: Stage, outbox: queue.Queue, envelope: list):
+    """Hand an item on, counting the time a full queue held the stage up"""
+    started = time.perf_counter()
+    outbox.put(envelope)
+    depth = outbox.qsize()
+    with stage._lock:
+        stage.blocked_seconds += time.perf_counter() - started
+    if next_stage is not None:
+        with next_stage._lock:
+            next_stage.max_depth = max(next_stage.max_depth, depth)
@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+# The backend modules import each other as top-level packages (normalizer,
+# pdf_extractor, pipeline), as they do when app.py is run from backend/
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
@@ -0,0 +1,105 @@
+# backend/tests/synthetic_pdf.py
+# Hand-written PDFs for the extraction tests (no PDF writer is a
+# dependency): Helvetica text at given positions, one content stream per
+# page, and a line-per-row extractor that reads them
+import re
+from typing import List, Sequence, Tuple
+
+from pdf_extractor.base_extractor import PLAN_TEXT, BasePDFExtractor
+from normalizer.records import Transaction
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+FONT_SIZE = 9
+ACCOUNT_NUMBER = "50100123456789"
+
+
+def build_pdf(pages: Sequence[Sequence[Tuple[float, float, str]]]) -> bytes:
+    """
+    PDF bytes with one page per entry of pages, each a list of (x, top, text)
+    top is measured down from the page's top edge, as pdfplumber reports it
+    """
+    page_ids = [4 + 2 * index for index in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(pages)),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    for page_id, words in zip(page_ids, pages):
+        content = b"".join(
+            b"BT /F1 %d Tf %.2f %.2f Td (%s) Tj ET\n" % (FONT_SIZE, x, PAGE_HEIGHT - top - FONT_SIZE, _escape(text))
+            for x, top, text in words
+        )
+        objects[page_id] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                            % (PAGE_WIDTH, PAGE_HEIGHT, page_id + 1))
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[object_id] for object_id in sorted(objects))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _escape(text: str) -> bytes:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("cp1252")
+
+
+def statement_pages(page_count: int, rows_per_page: int = 20, seed: int = 0) -> List[List[Tuple[float, float, str]]]:
+    """
+    A statement LineExtractor reads: an account header on page 1, then rows
+    "DD/MM/YY DESCRIPTION AMOUNT BALANCE" whose balances chain, negative
+    amounts being debits
+    """
+    pages = []
+    balance = 100_000_00
+    for page_index in range(page_count):
+        words = [(40, 30, f"Account No: {ACCOUNT_NUMBER}")] if page_index == 0 else []
+        for row in range(rows_per_page):
+            number = page_index * rows_per_page + row
+            amount = (number * 7919 + seed * 104729) % 500_00 + 1
+            amount = amount if number % 3 == 0 else -amount
+            balance += amount
+            top = 60 + row * 36
+            words += [
+                (40, top, f"{number % 28 + 1:02d}/04/24"),
+                (110, top, f"UPI-MERCHANT {number}"),
+                (330, top, f"{amount / 100:.2f}"),
+                (450, top, f"{balance / 100:.2f}"),
+            ]
+        pages.append(words)
+    return pages
+
+
+class LineExtractor(BasePDFExtractor):
+    """Extractor for statement_pages() PDFs: one transaction per text line"""
+    EXTRACTOR_VERSION = "test"
+    EXTRACTION_PLAN = PLAN_TEXT
+    ROW = re.compile(r'^(\d{2}/\d{2}/\d{2}) (.+) (-?\d+\.\d{2}) (-?\d+\.\d{2})$')
+
+    def extract_metadata(self, text: str):
+        self.bank_name = "HDFC"
+        match = re.search(r'Account No: (\d+)', text)
+        if match:
+            self.account_number = match.group(1)
+
+    def extract_transactions(self, tables: List, text: str):
+        for line in text.splitlines():
+            match = self.ROW.match(line.strip())
+            if not match:
+                continue
+            date, description, amount, balance = match.groups()
+            paise = self.parse_paise(amount)
+            self.transactions.append(Transaction(
+                date, description,
+                debit_paise=-paise if paise < 0 else 0,
+                credit_paise=paise if paise > 0 else 0,
+                balance_paise=self.parse_paise(balance),
+                transaction_type="Debit" if paise < 0 else "Credit"
+            ))
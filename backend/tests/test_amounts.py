@@ -0,0 +1,155 @@
+# backend/tests/test_amounts.py
+# parse_paise replaced the regex + float() parse_amount; amounts then stay
+# integer paise in the records and become rupee floats only in JSON
+import json
+import random
+import re
+
+import pytest
+
+import normalizer.transaction_normalizer as transaction_normalizer
+from normalizer.amounts import parse_paise, to_paise, to_rupees
+from normalizer.categorizer import TransactionCategorizer
+from normalizer.records import NormalizedTransaction, Transaction, record_default
+from normalizer.transaction_normalizer import TransactionNormalizer
+
+
+def legacy_parse_amount(value):
+    """BasePDFExtractor.parse_amount before parse_paise"""
+    if not value:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    value = re.sub(r'[^\d.,\-]', '', str(value).strip()).replace(',', '')
+    if not value or value == '-':
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def random_amount_strings(count, seed=16):
+    """Amounts as statements print them, with markers, noise and malformed ones"""
+    rng = random.Random(seed)
+    pieces = ['', 'Cr', 'Dr', ' (Dr)', '(Cr)', 'Rs. ', '-', '--', '.', ',', ' ', 'INR', '₹', 'x', '1.2.3']
+    for _ in range(count):
+        rupees = rng.randint(0, 10 ** rng.randint(0, 9))
+        grouped = f"{rupees:,}" if rng.random() < 0.5 else str(rupees)
+        decimals = rng.choice(['', '.', f".{rng.randint(0, 9)}", f".{rng.randint(0, 99):02d}",
+                               f".{rng.randint(0, 999):03d}"])
+        yield rng.choice(pieces) + rng.choice(['', '-']) + grouped + decimals + rng.choice(pieces)
+
+
+def decimals_in(value):
+    cleaned = re.sub(r'[^\d.,\-]', '', value).replace(',', '')
+    return len(cleaned.rpartition('.')[2]) if '.' in cleaned else 0
+
+
+def test_fuzz_matches_legacy_parse_amount():
+    checked = 0
+    for value in random_amount_strings(50000):
+        if decimals_in(value) > 2:
+            continue
+        assert parse_paise(value) == to_paise(legacy_parse_amount(value)), value
+        checked += 1
+    assert checked > 20000
+
+
+@pytest.mark.parametrize("value, paise", [
+    ("1,813.63", 181363),
+    ("62,541.51Cr", 6254151),
+    ("500.00 (Dr)", 50000),
+    ("INR 1,250", 125000),
+    ("-12.5", -1250),
+    (".5", 50),
+    ("7.", 700),
+    (12.345, 1234),
+    (0.1 + 0.2, 30),
+    (None, 0),
+    ("", 0),
+    ("-", 0),
+    ("1.2.3", 0),
+    ("abc", 0),
+])
+def test_parse_paise_values(value, paise):
+    assert parse_paise(value) == paise
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf"), 1e308])
+def test_non_finite_numbers_are_zero(value):
+    assert to_paise(value) == 0
+    assert parse_paise(value) == 0
+    assert TransactionCategorizer.debit_paise({"debit": value}) == 0
+
+
+def test_third_decimal_rounds_half_up():
+    assert parse_paise("1.004") == 100
+    assert parse_paise("1.005") == 101
+    assert parse_paise("1.0049") == 100
+    assert parse_paise("-1.005") == -101
+    assert parse_paise("0.995") == 100
+
+
+def test_paise_rupee_round_trip():
+    for paise in list(range(-1000, 1000)) + [123456789, 99999999999]:
+        assert to_paise(to_rupees(paise)) == paise
+
+
+def test_records_hold_paise_and_serialize_rupees():
+    transaction = Transaction('01/04/24', 'UPI-SWIGGY', debit_paise=181363, balance_paise=6254151)
+    assert transaction.debit_paise == 181363
+    assert transaction['debit'] == 1813.63
+    assert transaction.get('balance') == 62541.51
+    assert json.loads(json.dumps(transaction, default=record_default))['debit'] == 1813.63
+
+    transaction['credit'] = 12.5
+    assert transaction.credit_paise == 1250
+    assert Transaction.from_dict(transaction.to_dict()) == transaction
+
+    normalized = NormalizedTransaction('2024-04-01', 'UPI-SWIGGY', 181363, 'DEBIT', 'HDFC', '1', 6254151)
+    assert normalized.to_dict()['amount'] == 1813.63
+    assert NormalizedTransaction.from_dict(normalized.to_dict()).amount_paise == 181363
+
+
+def statement_rows(count=200, seed=16):
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        paise = rng.randint(0, 10 ** 7)
+        column = rng.choice(['debit', 'credit', 'none'])
+        rows.append(Transaction(
+            f"{index % 28 + 1:02d}/04/24", rng.choice(['UPI-SWIGGY', 'SALARY APR', 'NEFT IN', 'ATM WDL', '']),
+            debit_paise=paise if column == 'debit' else 0,
+            credit_paise=paise if column == 'credit' else 0,
+            balance_paise=rng.randint(0, 10 ** 9),
+            transaction_type=rng.choice(['', 'Debit', 'Credit'])
+        ))
+    return rows
+
+
+def test_records_and_dicts_normalize_alike():
+    rows = statement_rows()
+    statement = {'bank_name': 'hdfc', 'account_number': '1', 'transactions': rows}
+    from_records = TransactionNormalizer.normalize_statement(statement)
+    from_dicts = TransactionNormalizer.normalize_statement(
+        {**statement, 'transactions': [row.to_dict() for row in rows]})
+    one_by_one = [TransactionNormalizer.normalize_transaction(row, 'hdfc', '1', None) for row in rows]
+    assert from_records == from_dicts
+    assert [row.amount_paise for row in from_records] == [row.amount_paise for row in one_by_one]
+    assert [row.transaction_type for row in from_records] == [row.transaction_type for row in one_by_one]
+
+
+def test_numpy_and_pure_python_columns_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    columns = TransactionNormalizer.to_columns(statement_rows())
+    with_numpy = TransactionNormalizer.normalize_columns(columns)
+    monkeypatch.setattr(transaction_normalizer, "np", None)
+    assert TransactionNormalizer.normalize_columns(columns) == with_numpy
+
+
+def test_categorizer_reads_string_amounts():
+    assert TransactionCategorizer.debit_paise({"debit": "12.50"}) == 1250
+    assert TransactionCategorizer.debit_paise({"debit": "1,250.00"}) == 125000
+    assert TransactionCategorizer.debit_paise({"amount": "3.10", "transaction_type": "DEBIT"}) == 310
+    assert TransactionCategorizer.debit_paise({"debit": None}) == 0
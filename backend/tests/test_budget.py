@@ -0,0 +1,87 @@
+# backend/tests/test_budget.py
+# ExtractionBudget stops extraction between pages; the partial result is
+# flagged truncated with the reason and the pages it got to
+import threading
+
+import pytest
+
+from pdf_extractor.budget import REASON_CANCELLED, REASON_PAGES, REASON_TIME, ExtractionBudget
+from synthetic_pdf import LineExtractor, build_pdf, statement_pages
+
+ROWS_PER_PAGE = 20
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(build_pdf(statement_pages(3, ROWS_PER_PAGE)))
+    return path
+
+
+def extract(pdf_file, budget=None, workers=1):
+    extractor = LineExtractor(str(pdf_file), budget=budget, workers=workers)
+    return extractor, extractor.extract()
+
+
+def test_unlimited_budget_reads_everything(pdf_file):
+    _, statement = extract(pdf_file, ExtractionBudget(max_seconds=60, max_pages=3))
+    assert len(statement["transactions"]) == 3 * ROWS_PER_PAGE
+    assert "truncated" not in statement
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("max_pages", [1, 2])
+def test_page_budget_truncates(pdf_file, workers, max_pages):
+    _, statement = extract(pdf_file, ExtractionBudget(max_pages=max_pages), workers)
+    assert statement["truncated"] is True
+    assert statement["truncated_reason"] == REASON_PAGES
+    assert statement["pages_read"] == max_pages
+    assert len(statement["transactions"]) == max_pages * ROWS_PER_PAGE
+    # Metadata is still read from the page 1 header
+    assert statement["account_number"]
+
+
+def test_page_budget_in_stream_mode(pdf_file):
+    extractor = LineExtractor(str(pdf_file), budget=ExtractionBudget(max_pages=1))
+    assert len(list(extractor.extract_iter())) == ROWS_PER_PAGE
+    assert extractor.truncated_reason == REASON_PAGES
+    assert extractor.pages_read == 1
+
+
+def test_spent_time_budget_reads_no_page(pdf_file):
+    _, statement = extract(pdf_file, ExtractionBudget(max_seconds=0))
+    assert statement["truncated_reason"] == REASON_TIME
+    assert statement["transactions"] == []
+
+
+def test_budget_restarts_per_run(pdf_file):
+    budget = ExtractionBudget(max_pages=1)
+    extractor = LineExtractor(str(pdf_file), budget=budget)
+    extractor.extract()
+    budget.max_pages = None
+    assert "truncated" not in extractor.extract()
+
+
+def test_cancel_from_another_thread(pdf_file):
+    budget = ExtractionBudget()
+    extractor = LineExtractor(str(pdf_file), budget=budget)
+    rows = extractor.extract_iter()
+    next(rows)
+    canceller = threading.Thread(target=budget.cancel)
+    canceller.start()
+    canceller.join()
+    remaining = list(rows)
+    assert extractor.truncated_reason == REASON_CANCELLED
+    assert len(remaining) < 3 * ROWS_PER_PAGE - 1
+
+
+def test_exceeded_reasons():
+    budget = ExtractionBudget(max_seconds=None, max_pages=2)
+    budget.start()
+    assert budget.exceeded() is None
+    assert budget.exceeded(1) is None
+    assert budget.exceeded(2) == REASON_PAGES
+    budget.cancel()
+    assert budget.exceeded() == REASON_CANCELLED
+    budget.start()
+    assert budget.exceeded() is None
@@ -0,0 +1,45 @@
+# backend/tests/test_categorize_route.py
+# POST /categorize rejects rows it can't total instead of failing with a
+# 500 or counting a boolean or list as an amount
+import pytest
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def post(client, body):
+    return client.post("/categorize", data=body, content_type="application/json")
+
+
+def test_categorizes_and_totals(client):
+    response = post(client, '{"transactions": [{"description": "UPI-AMAZON", "debit": "1,250.50"},'
+                            ' {"description": "amazon", "debit": 10}, {"description": "SALARY", "credit": 5}]}')
+    assert response.status_code == 200
+    assert response.get_json()["categories_summary"] == {
+        "Shopping": {"count": 2, "total": 1260.5},
+        "Salary": {"count": 1, "total": 0.0},
+    }
+
+
+@pytest.mark.parametrize("amount", ["NaN", "Infinity", "-Infinity", "1e308", "1" + "0" * 400,
+                                    "true", "[1]", '{"v": 1}'])
+@pytest.mark.parametrize("field", ["debit", "credit", "amount"])
+def test_non_numeric_amounts_are_rejected(client, field, amount):
+    response = post(client, f'[{{"description": "amazon", "{field}": {amount}}}]')
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_null_amounts_are_allowed(client):
+    response = post(client, '[{"description": "amazon", "debit": null, "credit": null}]')
+    assert response.status_code == 200
+    assert response.get_json()["categories_summary"] == {"Shopping": {"count": 1, "total": 0.0}}
+
+
+def test_non_object_rows_are_rejected(client):
+    assert post(client, '[1, 2]').status_code == 400
+    assert post(client, '{"transactions": "x"}').status_code == 400
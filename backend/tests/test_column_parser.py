@@ -0,0 +1,91 @@
+# backend/tests/test_column_parser.py
+# ColumnParser bins words into column bands by their horizontal centre and
+# rebuilds rows line by line: date lines open rows, wrapped narration
+# joins the open row, anything else stands alone
+import io
+
+import pdfplumber
+import pytest
+
+from pdf_extractor.central_extractor import CENTRAL_COLUMNS
+from pdf_extractor.column_parser import ColumnParser
+from synthetic_pdf import build_pdf
+
+PARSER = ColumnParser([
+    ('date', 0, 100),
+    ('details', 100, 300),
+    ('debit', 300, 400),
+    ('balance', 400, 500),
+], start_band='date', continuation_bands=('details',))
+
+
+def word(text, x0, top):
+    return {'text': text, 'x0': x0, 'x1': x0 + 6 * len(text), 'top': top}
+
+
+@pytest.mark.parametrize("x0, x1, band", [
+    (10, 30, 'date'),
+    # The centre decides, not the left edge
+    (90, 130, 'details'),
+    (80, 110, 'date'),
+    # A centre on a band edge belongs to the band starting there
+    (297, 301, 'details'),
+    (299, 301, 'debit'),
+    # Outside every band: the nearest one
+    (-40, -20, 'date'),
+    (520, 560, 'balance'),
+])
+def test_words_bin_by_centre(x0, x1, band):
+    cells = PARSER._bin([{'text': 'w', 'x0': x0, 'x1': x1, 'top': 0}])
+    assert [PARSER.names[index] for index, parts in enumerate(cells) if parts] == [band]
+
+
+def test_rows_from_lines():
+    words = [
+        word("Date", 10, 10), word("Details", 110, 10), word("Balance", 410, 10),
+        word("01/04/24", 10, 30), word("UPI-SWIGGY", 110, 30), word("450.00", 310, 30), word("9,550.00", 410, 30),
+        # Wrapped narration, a little off the row's baseline
+        word("ORDER", 110, 42.5), word("1234", 160, 43),
+        word("02/04/24", 10, 60), word("ATM", 110, 60), word("1,000.00", 310, 60), word("8,550.00", 410, 60),
+        word("CARRIED", 110, 80), word("FORWARD", 170, 80), word("8,550.00", 410, 80),
+        word("stray", 110, 100),
+    ]
+    assert PARSER.parse_words(words) == [
+        ["Date", "Details", None, "Balance"],
+        ["01/04/24", "UPI-SWIGGY ORDER 1234", "450.00", "9,550.00"],
+        ["02/04/24", "ATM", "1,000.00", "8,550.00"],
+        # Not narration only, so a row of its own and the ATM row stays
+        # clean; the narration-only line after it joins it
+        [None, "CARRIED FORWARD stray", None, "8,550.00"],
+    ]
+
+
+def test_continuation_before_any_row_is_its_own_row():
+    assert PARSER.parse_words([word("ORDER", 110, 5), word("01/04/24", 10, 20)]) == [
+        [None, "ORDER", None, None],
+        ["01/04/24", None, None, None],
+    ]
+
+
+def test_y_tolerance_groups_lines():
+    words = [word("01/04/24", 10, 30), word("SWIGGY", 110, 30.8), word("450.00", 310, 31.5)]
+    assert PARSER.parse_words(words) == [["01/04/24", "SWIGGY", None, None], [None, None, "450.00", None]]
+    loose = ColumnParser(PARSER.bands, 'date', ('details',), y_tolerance=2)
+    assert loose.parse_words(words) == [["01/04/24", "SWIGGY", "450.00", None]]
+
+
+def test_central_bands_on_a_pdf_page():
+    pdf_bytes = build_pdf([[
+        (20, 100, "25/10/25"), (120, 100, "25/10/25"), (180, 100, "TO TRF. UPI RRN 471089785805"),
+        (420, 100, "1,813.63"), (540, 100, "335,281.72Cr"),
+        (180, 111, "TRF TO SWIGGY"),
+        (20, 130, "26/10/25"), (120, 130, "26/10/25"), (180, 130, "BY TRF."),
+        (470, 130, "5,000.00"), (540, 130, "340,281.72Cr"),
+    ]])
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        rows = CENTRAL_COLUMNS.parse_page(pdf.pages[0])
+    assert rows == [
+        ["25/10/25", "25/10/25", "TO TRF. UPI RRN 471089785805 TRF TO SWIGGY", None, "1,813.63", None,
+         "335,281.72Cr"],
+        ["26/10/25", "26/10/25", "BY TRF.", None, None, "5,000.00", "340,281.72Cr"],
+    ]
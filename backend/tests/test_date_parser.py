@@ -0,0 +1,79 @@
+# backend/tests/test_date_parser.py
+# DateParser replaced a strptime loop over six numeric formats; on those
+# formats it must give the loop's answers, whatever format it inferred
+import random
+from datetime import datetime
+
+from normalizer.date_parser import DateParser
+from normalizer.transaction_normalizer import TransactionNormalizer
+
+LEGACY_FORMATS = ['%d/%m/%y', '%d/%m/%Y', '%d-%m-%y', '%d-%m-%Y', '%Y-%m-%d', '%Y/%m/%d']
+
+
+def legacy_normalize_date(date_str):
+    """TransactionNormalizer.normalize_date before DateParser"""
+    for fmt in LEGACY_FORMATS:
+        try:
+            dt = datetime.strptime(date_str.strip(), fmt)
+            if dt.year < 100:
+                dt = dt.replace(year=dt.year + 2000)
+            return dt.strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return date_str
+
+
+def random_numeric_dates(count, seed=11):
+    """Valid, invalid and odd dates in the six legacy layouts"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        separator = rng.choice('/-')
+        day = str(rng.randint(0, 32)).zfill(rng.choice((1, 2)))
+        month = str(rng.randint(0, 13)).zfill(rng.choice((1, 2)))
+        # Years 100-999 are left out: strftime('%Y') printed them unpadded
+        year = rng.choice([str(rng.randint(0, 99)).zfill(2), str(rng.randint(0, 99)).zfill(4),
+                           str(rng.randint(1000, 2099))])
+        parts = [year, month, day] if rng.random() < 0.3 else [day, month, year]
+        yield separator.join(parts)
+
+
+def test_fuzz_matches_strptime_loop():
+    dates = list(random_numeric_dates(5000))
+    for parser in (DateParser(), DateParser.infer(dates), DateParser.infer(["2024-01-31"])):
+        for text in dates:
+            assert parser.parse(text) == legacy_normalize_date(text), (parser.inferred_format, text)
+
+
+def test_infer_puts_best_format_first():
+    assert DateParser.infer(["01/02/24", "15/03/24", "junk"]).inferred_format == '%d/%m/%y'
+    assert DateParser.infer(["24-Nov-25", "01-Dec-25"]).inferred_format == '%d-%b-%y'
+    assert DateParser.infer(["2024-03-15"] * 3).inferred_format == '%Y-%m-%d'
+
+
+def test_infer_without_usable_dates_keeps_default_order():
+    assert DateParser.infer([]).inferred_format == '%d/%m/%y'
+    assert DateParser.infer(["", None, "n/a"]).inferred_format == '%d/%m/%y'
+
+
+def test_inferred_format_still_falls_back():
+    parser = DateParser.infer(["01/02/2024"] * 5)
+    assert parser.parse("2024-02-29") == "2024-02-29"
+    assert parser.parse("31/02/2024") == "31/02/2024"
+
+
+def test_named_month_and_sbi_dual_date():
+    parser = DateParser()
+    assert parser.parse("24-Nov-25") == "2025-11-24"
+    assert parser.parse("1 Jan 2024") == "2024-01-01"
+    assert parser.parse("24-Nov-25\n(24-Nov-2025)") == "2025-11-24"
+    assert parser.parse("31-Feb-25") == "31-Feb-25"
+
+
+def test_unparsed_values_come_back_unchanged():
+    parser = DateParser()
+    assert parser.parse("not a date") == "not a date"
+    assert parser.parse(None) is None
+
+
+def test_normalize_date_without_parser():
+    assert TransactionNormalizer.normalize_date(" 05/06/23 ") == "2023-06-05"
@@ -0,0 +1,69 @@
+# backend/tests/test_extraction_cache.py
+# ExtractionCache keys on the PDF bytes, the extractor and its version and
+# the normalizer version, and evicts the least recently used entries
+import os
+
+import pytest
+
+from pipeline.extraction_cache import ExtractionCache
+
+
+class Extractor:
+    EXTRACTOR_VERSION = "3"
+
+
+class NewerExtractor(Extractor):
+    EXTRACTOR_VERSION = "4"
+
+
+STATEMENT = {"bank_name": "HDFC", "transactions": [{"date": "01/04/24", "debit": 12.5}]}
+NORMALIZED = [{"transaction_date": "2024-04-01", "amount": 12.5}]
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(b"%PDF-1.4 statement")
+    return path
+
+
+def test_key_follows_bytes_extractor_and_normalizer(tmp_path, pdf_file):
+    cache = ExtractionCache(tmp_path / "cache", normalizer_version="1")
+    key = cache.key_for(pdf_file, Extractor)
+    assert key == cache.key_for(pdf_file, Extractor, ExtractionCache.hash_bytes(pdf_file.read_bytes()))
+
+    assert cache.key_for(pdf_file, NewerExtractor) != key
+    assert ExtractionCache(tmp_path / "cache", normalizer_version="2").key_for(pdf_file, Extractor) != key
+    pdf_file.write_bytes(b"%PDF-1.4 statemenT")
+    assert cache.key_for(pdf_file, Extractor) != key
+
+
+def test_round_trip_and_corrupt_entry(tmp_path, pdf_file):
+    cache = ExtractionCache(tmp_path / "cache")
+    key = cache.key_for(pdf_file, Extractor)
+    assert cache.get(key) is None
+    cache.put(key, STATEMENT, NORMALIZED)
+    assert cache.get(key) == {"statement": STATEMENT, "normalized": NORMALIZED}
+
+    (tmp_path / "cache" / f"{key}.json").write_text('{"statement": ')
+    assert cache.get(key) is None
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_eviction_keeps_most_recently_used(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache")
+    cache.put("sizing", STATEMENT, NORMALIZED)
+    entry_size = (tmp_path / "cache" / "sizing.json").stat().st_size
+    (tmp_path / "cache" / "sizing.json").unlink()
+    cache.max_bytes = 3 * entry_size
+
+    for age, key in enumerate(["a", "b", "c"]):
+        cache.put(key, STATEMENT, NORMALIZED)
+        os.utime(tmp_path / "cache" / f"{key}.json", (1_000_000 + age, 1_000_000 + age))
+    # A hit makes the oldest entry the newest
+    assert cache.get("a") is not None
+
+    cache.put("d", STATEMENT, NORMALIZED)
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.json")) == ["a", "c", "d"]
+    cache.put("e", STATEMENT, NORMALIZED)
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.json")) == ["a", "d", "e"]
@@ -0,0 +1,93 @@
+# backend/tests/test_keyword_automaton.py
+# KeywordAutomaton must find exactly what "keyword in text" finds for each
+# keyword, overlaps included, and KeywordTagger must pick what the keyword
+# loops it replaced picked: the first category in table order
+import random
+
+import pytest
+
+from normalizer.keyword_automaton import CATEGORY_KEYWORDS, OTHER_CATEGORY, KeywordAutomaton, KeywordTagger
+from normalizer.transaction_normalizer import TransactionNormalizer
+
+# Keywords inside other words and inside each other, plus filler
+FRAGMENTS = [keyword for keywords in CATEGORY_KEYWORDS.values() for keyword in keywords] + [
+    "gossip", "cable", "label", "cola", "current", "megastore", "sharemarket", "premiumtrain", "uberola",
+    "neft in", "imps in", "credit", "cr", "dr", "atm", "pos", "transfer in", "salary",
+    "upi-", "-", "/", " ", "  ", "\n", "x", "12345", "ola ", "cafe", "café", "UPI", "SWIGGY",
+]
+
+
+def naive_scan(pairs, text):
+    """The loop the automaton replaced: every label whose keyword occurs in text"""
+    return {label for keyword, label in pairs if keyword in text}
+
+
+def naive_category(description):
+    """categorizeTransaction()'s loop: the first category with a keyword in the description"""
+    text = description.lower()
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in text:
+                return category
+    return OTHER_CATEGORY
+
+
+def naive_type(transaction_type, description):
+    """TransactionNormalizer's keyword loop before KeywordTagger"""
+    for text in (description, transaction_type):
+        if any(keyword in (text or "").lower() for keyword in TransactionNormalizer.CREDIT_KEYWORDS):
+            return "CREDIT"
+    return "DEBIT"
+
+
+def random_texts(count, seed=13):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 8)))
+
+
+def test_scan_matches_naive_substring_loop():
+    pairs = [(keyword, (category, keyword)) for category, keywords in CATEGORY_KEYWORDS.items()
+             for keyword in keywords]
+    automaton = KeywordAutomaton(pairs)
+    for text in random_texts(5000):
+        assert automaton.scan(text) == naive_scan(pairs, text), text
+        assert automaton.matches(text) == bool(naive_scan(pairs, text)), text
+
+
+def test_tagger_matches_naive_loops():
+    tagger = KeywordTagger(TransactionNormalizer.CREDIT_KEYWORDS, TransactionNormalizer.DEBIT_KEYWORDS)
+    texts = list(random_texts(3000, seed=14))
+    for description, transaction_type in zip(texts, reversed(texts)):
+        expected = (naive_type(transaction_type, description), naive_category(description))
+        assert tagger.tag(transaction_type, description) == expected, (transaction_type, description)
+        assert tagger.transaction_type(transaction_type, description) == expected[0]
+
+
+@pytest.mark.parametrize("text, found", [
+    # Keywords inside keywords: every one is reported
+    ("shers", {"she", "he", "hers"}),
+    ("ushers", {"she", "he", "hers"}),
+    ("his", {"his"}),
+    ("hxs", set()),
+    ("hehehe", {"he"}),
+    ("", set()),
+])
+def test_overlapping_keywords(text, found):
+    automaton = KeywordAutomaton((keyword, keyword) for keyword in ["he", "she", "his", "hers"])
+    assert automaton.scan(text) == found
+
+
+def test_first_category_wins():
+    # "UPI" is a Transfers keyword, but Food & Dining comes first in the table
+    assert naive_category("UPI-SWIGGY") == "Food & Dining"
+    tagger = KeywordTagger([], [])
+    for description, category in [("UPI-SWIGGY", "Food & Dining"), ("UPI-RAMESH", "Transfers"),
+                                   ("MEGASTORE", "Utilities"), ("AMAZON PRIME", "Shopping"),
+                                   ("NETFLIX", "Entertainment"), ("NOTHING", OTHER_CATEGORY)]:
+        assert tagger.tag("", description)[1] == category == naive_category(description)
+
+
+def test_shared_label_and_duplicate_keyword():
+    automaton = KeywordAutomaton([("cab", "Travel"), ("taxi", "Travel"), ("cab", "Other")])
+    assert automaton.scan("taxi cab") == {"Travel", "Other"}
@@ -0,0 +1,138 @@
+# backend/tests/test_manifest.py
+# BatchManifest lets process_all skip PDFs it already processed: unchanged
+# files are skipped, changed ones rerun, deleted ones pruned with their
+# outputs, and failed or partial runs are never recorded
+import os
+
+import pytest
+
+from app import BankStatementProcessor
+from pipeline.manifest import BatchManifest
+from synthetic_pdf import LineExtractor, build_pdf, statement_pages
+
+FINGERPRINT = {"extractor": "LineExtractor", "extractor_version": "1",
+               "normalizer_version": "1", "output_format": "v2"}
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "raw_pdfs"
+    (root / "hdfc").mkdir(parents=True)
+    return root
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+def recorded(manifest, pdf_file, outputs=()):
+    fingerprint = dict(FINGERPRINT)
+    manifest.unchanged(pdf_file, fingerprint)
+    manifest.record(pdf_file, fingerprint, outputs, {"file": pdf_file.name})
+    manifest.save()
+    return BatchManifest(manifest.path, manifest.source_root)
+
+
+def test_unchanged_file_is_skipped(tmp_path, source):
+    pdf_file = write(source / "hdfc" / "a.pdf", b"statement a")
+    manifest = recorded(BatchManifest(tmp_path / "manifest.json", source), pdf_file)
+    assert manifest.unchanged(pdf_file, dict(FINGERPRINT))["summary"] == {"file": "a.pdf"}
+
+    # Touched, same bytes: the hash decides, and the new mtime is kept
+    os.utime(pdf_file, (1_000_000, 1_000_000))
+    fingerprint = dict(FINGERPRINT)
+    assert manifest.unchanged(pdf_file, fingerprint) is not None
+    assert "sha256" in fingerprint
+    assert manifest.entries["hdfc/a.pdf"]["mtime"] == 1_000_000
+
+
+def test_changed_hash_is_rerun(tmp_path, source):
+    pdf_file = write(source / "hdfc" / "a.pdf", b"statement a")
+    manifest = recorded(BatchManifest(tmp_path / "manifest.json", source), pdf_file)
+    # Same size, different bytes and mtime
+    write(pdf_file, b"statement b")
+    os.utime(pdf_file, (1_000_000, 1_000_000))
+    assert manifest.unchanged(pdf_file, dict(FINGERPRINT)) is None
+
+
+@pytest.mark.parametrize("field", ["extractor_version", "normalizer_version", "output_format"])
+def test_changed_fingerprint_is_rerun(tmp_path, source, field):
+    pdf_file = write(source / "hdfc" / "a.pdf", b"statement a")
+    manifest = recorded(BatchManifest(tmp_path / "manifest.json", source), pdf_file)
+    assert manifest.unchanged(pdf_file, {**FINGERPRINT, field: "other"}) is None
+
+
+def test_missing_output_is_rerun(tmp_path, source):
+    pdf_file = write(source / "hdfc" / "a.pdf", b"statement a")
+    output = write(tmp_path / "a_normalized.json", b"{}")
+    manifest = recorded(BatchManifest(tmp_path / "manifest.json", source), pdf_file, [output])
+    assert manifest.unchanged(pdf_file, dict(FINGERPRINT)) is not None
+    output.unlink()
+    assert manifest.unchanged(pdf_file, dict(FINGERPRINT)) is None
+
+
+def test_deleted_input_is_pruned_with_its_outputs(tmp_path, source):
+    kept = write(source / "hdfc" / "kept.pdf", b"kept")
+    deleted = write(source / "hdfc" / "deleted.pdf", b"deleted")
+    kept_output = write(tmp_path / "kept.json", b"{}")
+    deleted_output = write(tmp_path / "deleted.json", b"{}")
+    manifest = BatchManifest(tmp_path / "manifest.json", source)
+    manifest = recorded(manifest, kept, [kept_output])
+    manifest = recorded(manifest, deleted, [deleted_output])
+
+    deleted.unlink()
+    assert manifest.prune([kept]) == ["hdfc/deleted.pdf"]
+    assert list(manifest.entries) == ["hdfc/kept.pdf"]
+    assert not deleted_output.exists()
+    assert kept_output.exists()
+
+
+def test_shared_output_survives_prune(tmp_path, source):
+    (source / "sbi").mkdir()
+    first = write(source / "hdfc" / "same.pdf", b"first")
+    second = write(source / "sbi" / "same.pdf", b"second")
+    output = write(tmp_path / "same_normalized.json", b"{}")
+    manifest = BatchManifest(tmp_path / "manifest.json", source)
+    manifest = recorded(manifest, first, [output])
+    manifest = recorded(manifest, second, [output])
+    assert manifest.prune([second]) == ["hdfc/same.pdf"]
+    assert output.exists()
+
+
+def test_unreadable_manifest_starts_over(tmp_path, source):
+    path = write(tmp_path / "manifest.json", b"{not json")
+    assert BatchManifest(path, source).entries == {}
+
+
+def processor(tmp_path, source, **options):
+    processor = BankStatementProcessor(use_cache=False, **options)
+    processor.EXTRACTORS = {"hdfc": LineExtractor}
+    processor.raw_pdf_dir = source
+    processor.extracted_json_dir = tmp_path / "extracted_json"
+    processor.normalized_json_dir = tmp_path / "normalized_json"
+    processor.manifest_path = tmp_path / "manifest.json"
+    return processor
+
+
+def test_failed_and_truncated_runs_are_never_recorded(tmp_path, source):
+    write(source / "hdfc" / "good.pdf", build_pdf(statement_pages(1)))
+    write(source / "hdfc" / "long.pdf", build_pdf(statement_pages(3)))
+    write(source / "hdfc" / "broken.pdf", b"%PDF-1.4 not really")
+
+    first = processor(tmp_path, source, max_pages=2).process_all()
+    by_file = {result["file"]: result for result in first}
+    assert "error" in by_file["broken.pdf"]
+    assert by_file["long.pdf"]["truncated"] is True
+    assert by_file["good.pdf"]["transactions"] == 20
+    assert set(BatchManifest(tmp_path / "manifest.json", source).entries) == {"hdfc/good.pdf"}
+
+    second = processor(tmp_path, source, max_pages=2)
+    results = second.process_all()
+    assert [result.get("unchanged", False) for result in results] == [False, True, False]
+    assert second.batch_summary["manifest"]["processed"] == 2
+
+    # A full run of the long PDF is recorded
+    third = processor(tmp_path, source)
+    third.process_all()
+    assert set(BatchManifest(tmp_path / "manifest.json", source).entries) == {"hdfc/good.pdf", "hdfc/long.pdf"}
@@ -0,0 +1,68 @@
+# backend/tests/test_merchants.py
+# MerchantCanonicalizer: description -> merchant for each bank's layout,
+# and the (bank, skeleton) LRU that makes repeated templates free
+import pytest
+
+from normalizer.merchants import MerchantCanonicalizer, skeleton
+
+# (bank, description, merchant), descriptions as the extractors return them
+CASES = [
+    # UPI prefixes and handles
+    ("HDFC", "UPI-949519244745-SWIGGY-UPI-853855761272-OK", "SWIGGY"),
+    ("HDFC", "UPI-395453056149-BOOKMYSHOW-UPI-815287555074-O\nK", "BOOKMYSHOW"),
+    ("HDFC", "UPI-498764559632-ASHOK\nDUBEY@UPI-893568559070-OK", "ASHOK DUBEY"),
+    ("SBI", "UPI-AMAZON PAY-8923", "AMAZON PAY"),
+    ("UNION", "UPIAR/389572515232/DR/Swiggy/SWIGGY/SBIN/swiggy@sbi", "SWIGGY"),
+    ("UNION", "UPIAR/433884730907/DR/Indian\nOil/INDIANOIL/YESB/indianoil@ybl", "INDIAN OIL"),
+    ("CENTRAL", "TO TRF.- UPI RRN 471089785805.TRF TO SWIGGY", "SWIGGY"),
+    ("CENTRAL", "BY TRF.- UPI RRN 465760720506.TRF FROM FRIEND", "FRIEND"),
+    ("AXIS", "UPI RRN 488415537787 TRF TO UBER", "UBER"),
+    # POS prefixes and card masks
+    ("HDFC", "POS 416021XXXXXX3443 MORE SUPERMARKET POS\nDEBIT", "MORE SUPERMARKET"),
+    ("SBI", "POS PURCHASE-SHOPPERS STOP-9198", "SHOPPERS STOP"),
+    ("HDFC", "ATW-416021XXXXXX2573-8ROJ8BB5-MUMBAI", "ATW MUMBAI"),
+    ("", "POS 416021XXXXXX3443 DMART", "POS DMART"),
+    # Reference numbers stripped, the rest kept
+    ("HDFC", "IMPS-866627062081-AMIT\nJOSHI-HDFC-XXXXXXXX4056-PERSONAL", "AMIT JOSHI"),
+    ("HDFC", "NEFT DR-PZYZ241682-PRIYA VERMA-NETBANK,\nMUM-N209818417555-PERSONA", "PRIYA VERMA"),
+    ("HDFC", "A\nNHDF6502569795/BILLDKHDFCCARDS", "HDFCCARDS"),
+    ("BOI", "MEDR/PVR CINEMA/901681/", "PVR CINEMA"),
+    ("BOI", "CWDR//616968/CSO9013", "CWDR"),
+    ("UNION", "ATM WDL 799703\nKASARAGOD", "ATM WDL KASARAGOD"),
+    ("SBI", "RTGS-MANOJ-8846", "RTGS MANOJ"),
+    ("CENTRAL", "TO TRF.- UPI RRN 477349947188.TRF TO BIG BAZAAR CARRIED FORWARD 12,345.00", "BIG BAZAAR"),
+    # Single digits are names, not references
+    ("SBI", "UPI-ZEE5-4776", "ZEE5"),
+    ("", "", ""),
+]
+
+
+@pytest.mark.parametrize("bank_name, description, merchant", CASES)
+def test_description_to_merchant(bank_name, description, merchant):
+    assert MerchantCanonicalizer().canonicalize(description, bank_name) == merchant
+
+
+def test_bank_name_is_case_insensitive():
+    canonicalizer = MerchantCanonicalizer()
+    assert canonicalizer.canonicalize("UPI-ZOMATO-4776", "sbi") == "ZOMATO"
+
+
+def test_skeleton_masks_digit_runs_only():
+    assert skeleton("UPI-4102-ZEE5-UPI-9921-OK") == "UPI-#-ZEE5-UPI-#-OK"
+
+
+def test_lru_shares_one_entry_per_skeleton():
+    canonicalizer = MerchantCanonicalizer(cache_size=2)
+    for reference in range(10):
+        assert canonicalizer.canonicalize(f"UPI-{4100 + reference}-SWIGGY-UPI-{9900 + reference}-OK", "HDFC") == \
+            "SWIGGY"
+    info = canonicalizer.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (9, 1, 1)
+
+    # Same skeleton, other bank: its own entry; the bound evicts the oldest
+    canonicalizer.canonicalize("UPI-4100-SWIGGY-UPI-9900-OK", "SBI")
+    canonicalizer.canonicalize("UPI-ZOMATO-4776", "SBI")
+    info = canonicalizer.cache_info()
+    assert (info.misses, info.currsize, info.maxsize) == (3, 2, 2)
+    canonicalizer.canonicalize("UPI-4100-SWIGGY-UPI-9900-OK", "HDFC")
+    assert canonicalizer.cache_info().misses == 4
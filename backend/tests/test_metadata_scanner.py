@@ -0,0 +1,70 @@
+# backend/tests/test_metadata_scanner.py
+# MetadataScanner must pick exactly what the sequential re.search loops it
+# replaced picked: the first pattern, in priority order, that matches
+import random
+import re
+
+from pdf_extractor.hdfc_extractor import HDFC_METADATA, HDFCExtractor
+from pdf_extractor.metadata_scanner import MetadataScanner
+
+# Pieces of HDFC header text, near misses included, shuffled into documents
+FRAGMENTS = [
+    "Account Number : 50100123456789", "Account No. 1234567890", "A/c No 98765432101",
+    "Account: 12345678901234", "Savings Account 55512345678", "A/C . 12345678901",
+    "Customer Name: RAHUL SHARMA", "Account Holder : PRIYA NAIR Address", "MR ANIL KUMAR Account Number",
+    "Dear Mr. VIKRAM SINGH", "Dear NEHA GUPTA", "STATEMENT OF ACCOUNT", "HDFC BANK LIMITED",
+    "Statement From : 01/04/2024 To : 30/04/2024", "From 01/01/2025 to 31/01/2025",
+    "period 01-Nov-2025 to 30-Nov-2025", "Branch : MUMBAI", "IFSC HDFC0000123",
+    "Account No.", "Name:", "Dear", "12345", "account number 12", "\n", "  ",
+]
+
+
+def sequential_search(patterns, text):
+    """The loop MetadataScanner replaced: re.search each (pattern, flags) in order"""
+    for pattern, flags in patterns:
+        match = re.search(pattern, text, flags)
+        if match:
+            return match
+    return None
+
+
+def random_documents(count, seed=6):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12)))
+
+
+def test_search_matches_sequential_loop():
+    for text in random_documents(2000):
+        for field, compiled in HDFC_METADATA.patterns.items():
+            expected = sequential_search([(regex.pattern, regex.flags) for regex in compiled], text)
+            found = HDFC_METADATA.search(field, text)
+            assert (found and (found.re.pattern, found.span(), found.groups())) == \
+                (expected and (expected.re.pattern, expected.span(), expected.groups())), (field, text)
+
+
+def test_candidates_follow_priority_order():
+    scanner = MetadataScanner({'number': [r'No\.\s*(\d+)', r'(\d{4,})', r'never(\d)']})
+    matches = list(scanner.candidates('number', "Ref 123456 No. 42"))
+    assert [match.group(1) for match in matches] == ['42', '123456']
+
+
+def test_candidates_are_searched_lazily():
+    scanner = MetadataScanner({'number': [r'(\d+)', r'(x+)']})
+    candidates = scanner.candidates('number', "12 xx")
+    assert next(candidates).group(1) == '12'
+    assert next(candidates).group(1) == 'xx'
+    assert next(candidates, None) is None
+
+
+def test_field_flags_apply_per_field():
+    scanner = MetadataScanner({'upper': [r'NAME (\w+)'], 'any': [r'NAME (\w+)']}, flags={'any': re.IGNORECASE})
+    assert scanner.search('upper', "name ravi") is None
+    assert scanner.search('any', "name ravi").group(1) == 'ravi'
+
+
+def test_hdfc_metadata_from_text():
+    extractor = HDFCExtractor("unused.pdf")
+    extractor.extract_metadata("HDFC BANK LIMITED\nAccount No. 50100123456789\nDear Mr. VIKRAM SINGH\n")
+    assert extractor.account_number == "50100123456789"
+    assert extractor.account_holder
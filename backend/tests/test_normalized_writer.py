@@ -0,0 +1,102 @@
+# backend/tests/test_normalized_writer.py
+# NormalizedWriter("json") must write exactly the bytes of the json.dump
+# call process_all used before it, for records and plain dicts alike
+import json
+
+import pytest
+
+from normalizer.normalized_format import (NormalizedStatement, iter_ndjson,
+                                          write_normalized_stream, write_normalized_version)
+from normalizer.records import NormalizedTransaction, record_default
+
+STATEMENT = {
+    "bank_name": "HDFC",
+    "account_number": "50100123456789",
+    "account_holder": "RAHUL SHARMA",
+    "statement_period": "01/04/2024 To 30/04/2024",
+    "transactions": [],
+}
+
+
+def rows(count):
+    return [
+        NormalizedTransaction(f"2024-04-{index % 28 + 1:02d}", f"UPI-SWIGGY \"{index}\" ₹", index * 12345,
+                              "DEBIT" if index % 3 else "CREDIT", "HDFC", "50100123456789", 10_000_00 - index)
+        for index in range(count)
+    ]
+
+
+def legacy_dump(statement, transactions):
+    """The normalized file as process_all wrote it before NormalizedWriter"""
+    return json.dumps({
+        "bank_name": statement.get('bank_name', ''),
+        "account_number": statement.get('account_number', ''),
+        "account_holder": statement.get('account_holder', ''),
+        "statement_period": statement.get('statement_period', ''),
+        "transactions": [transaction.to_dict() for transaction in transactions]
+    }, indent=2)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 57])
+def test_json_stream_is_byte_identical(tmp_path, count):
+    transactions = rows(count)
+    path = tmp_path / "statement_normalized.json"
+    assert write_normalized_stream(path, STATEMENT, iter(transactions), "json") == count
+    assert path.read_text() == legacy_dump(STATEMENT, transactions)
+
+
+def test_dict_rows_write_the_same_bytes(tmp_path):
+    transactions = rows(5)
+    write_normalized_stream(tmp_path / "records.json", STATEMENT, transactions)
+    write_normalized_stream(tmp_path / "dicts.json", STATEMENT, [row.to_dict() for row in transactions])
+    assert (tmp_path / "records.json").read_bytes() == (tmp_path / "dicts.json").read_bytes()
+
+
+def test_missing_header_fields_are_blank(tmp_path):
+    path = tmp_path / "statement_normalized.json"
+    write_normalized_stream(path, {"bank_name": "SBI"}, rows(2))
+    assert path.read_text() == legacy_dump({"bank_name": "SBI"}, rows(2))
+
+
+def test_ndjson_rows(tmp_path):
+    transactions = rows(4)
+    path = tmp_path / "statement_normalized.ndjson"
+    write_normalized_stream(path, STATEMENT, transactions, "ndjson")
+    header = json.loads(path.read_text().splitlines()[0])
+    assert header == {field: STATEMENT[field] for field in header}
+    assert list(iter_ndjson(path)) == [row.to_dict() for row in transactions]
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    path = tmp_path / "statement_normalized.json"
+
+    def broken_rows():
+        yield from rows(3)
+        raise RuntimeError("extraction failed")
+
+    with pytest.raises(RuntimeError):
+        write_normalized_stream(path, STATEMENT, broken_rows())
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("format_version", [1, 2])
+def test_format_versions_load_the_same_rows(tmp_path, format_version):
+    transactions = rows(30)
+    path = tmp_path / "statement_normalized.json"
+    write_normalized_version(path, STATEMENT, transactions, format_version)
+    assert json.loads(path.read_text()).get("format_version", 1) == format_version
+    statement = NormalizedStatement.load(path)
+    assert list(statement.rows()) == [row.to_dict() for row in transactions]
+    assert statement.column_paise("amount") == [row.amount_paise for row in transactions]
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
+
+
+def test_unknown_format_version(tmp_path):
+    with pytest.raises(ValueError):
+        write_normalized_version(tmp_path / "x.json", STATEMENT, rows(1), 3)
+
+
+def test_extracted_records_dump_like_dicts():
+    transactions = rows(3)
+    assert json.dumps({"transactions": transactions}, indent=2, default=record_default) == \
+        json.dumps({"transactions": [row.to_dict() for row in transactions]}, indent=2)
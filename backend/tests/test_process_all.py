@@ -0,0 +1,53 @@
+# backend/tests/test_process_all.py
+# process_all gives the same results with PDFs or their pages read in
+# process pools as in this process, and one bad PDF only fails its own row
+import pytest
+
+from app import BankStatementProcessor
+from synthetic_pdf import LineExtractor, build_pdf, statement_pages
+
+
+@pytest.fixture
+def source(tmp_path):
+    folder = tmp_path / "raw_pdfs" / "hdfc"
+    folder.mkdir(parents=True)
+    for index in range(5):
+        (folder / f"statement_{index}.pdf").write_bytes(build_pdf(statement_pages(1 + index % 3, seed=index)))
+    (folder / "statement_2b.pdf").write_bytes(b"%PDF-1.4 truncated upload")
+    return tmp_path
+
+
+def run(root, name, **options):
+    """process_all into root/name; (summary rows without run metrics or paths, output file bytes)"""
+    processor = BankStatementProcessor(use_cache=False, incremental=False, **options)
+    processor.EXTRACTORS = {"hdfc": LineExtractor}
+    processor.raw_pdf_dir = root / "raw_pdfs"
+    processor.extracted_json_dir = root / name / "extracted_json"
+    processor.normalized_json_dir = root / name / "normalized_json"
+    processor.manifest_path = root / name / "manifest.json"
+    results = processor.process_all()
+    rows = [{field: value for field, value in result.items()
+             if field not in processor.RUN_METRICS + ("extracted", "output")} for result in results]
+    outputs = {path.relative_to(root / name).as_posix(): path.read_bytes()
+               for path in sorted((root / name).rglob("*")) if path.is_file() and path.name != "manifest.json"}
+    return rows, outputs
+
+
+@pytest.mark.parametrize("pools", [{"workers": 3}, {"page_workers": 2}, {"workers": 2, "page_workers": 2}])
+@pytest.mark.parametrize("stream_format", [None, "ndjson"])
+def test_pool_matches_serial(source, stream_format, pools):
+    serial = run(source, "serial", stream_format=stream_format)
+    pooled = run(source, "pooled", stream_format=stream_format, **pools)
+    assert pooled == serial
+    assert len(serial[1]) == (5 if stream_format else 10)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_bad_pdf_is_isolated(source, workers):
+    rows, _ = run(source, "out", workers=workers)
+    assert [row["file"] for row in rows] == [f"statement_{index}.pdf" for index in (0, 1, 2)] + \
+        ["statement_2b.pdf"] + [f"statement_{index}.pdf" for index in (3, 4)]
+    failed = [row for row in rows if "error" in row]
+    assert [row["file"] for row in failed] == ["statement_2b.pdf"]
+    assert all(row["transactions"] == 20 * (1 + index % 3)
+               for index, row in enumerate(row for row in rows if "error" not in row))
@@ -0,0 +1,132 @@
+# backend/tests/test_reconcile.py
+# BalanceReconciler on synthetic balance chains: clean, misplaced amounts,
+# breaks, newest-first order, and page-by-page feeding
+import random
+
+import pytest
+
+import pdf_extractor.reconcile as reconcile
+from normalizer.records import Transaction
+from pdf_extractor.reconcile import ORDER_ASCENDING, ORDER_DESCENDING, BalanceReconciler
+
+
+def chain(count=60, seed=18, opening=10_000_00):
+    """Oldest-first rows whose debit/credit agree with the running balance"""
+    rng = random.Random(seed)
+    balance = opening
+    rows = []
+    for index in range(count):
+        amount = rng.randint(1, 5_000_00)
+        credit = rng.random() < 0.4
+        balance += amount if credit else -amount
+        rows.append(Transaction(
+            f"{index % 28 + 1:02d}/04/24", f"ROW {index}",
+            debit_paise=0 if credit else amount,
+            credit_paise=amount if credit else 0,
+            balance_paise=balance,
+            transaction_type="Credit" if credit else "Debit"
+        ))
+    return rows
+
+
+def as_default_debits(rows, indices):
+    """Record the rows' amounts as debits, as text parsers do without a direction"""
+    for index in indices:
+        amount = rows[index].debit_paise or rows[index].credit_paise
+        rows[index].debit_paise, rows[index].credit_paise = amount, 0
+        rows[index].transaction_type = "Debit"
+    return rows
+
+
+def columns(rows):
+    return [(row.debit_paise, row.credit_paise, row.transaction_type) for row in rows]
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(reconcile, "np", None)
+    return request.param
+
+
+def test_clean_chain_is_left_alone(numpy_mode):
+    rows = chain()
+    expected = columns(rows)
+    reconciler = BalanceReconciler()
+    assert columns(reconciler.reconcile(rows)) == expected
+    report = reconciler.report()
+    assert report["order"] == ORDER_ASCENDING
+    assert (report["checked"], report["matched"], report["corrected"], report["break_count"]) == (59, 59, 0, 0)
+    assert report["integrity"] == 1.0
+
+
+def test_default_debits_move_to_credit(numpy_mode):
+    expected = columns(chain())
+    credits = [index for index, row in enumerate(chain()) if row.credit_paise and index]
+    rows = as_default_debits(chain(), credits)
+    reconciler = BalanceReconciler()
+    assert columns(reconciler.reconcile(rows)) == expected
+    assert reconciler.report()["corrected"] == len(credits)
+
+
+def test_newest_first_order(numpy_mode):
+    expected = columns(chain())[::-1]
+    rows = chain()[::-1]
+    credits = [index for index, row in enumerate(rows) if row.credit_paise and index < len(rows) - 1]
+    reconciler = BalanceReconciler()
+    assert columns(reconciler.reconcile(as_default_debits(rows, credits))) == expected
+    assert reconciler.report()["order"] == ORDER_DESCENDING
+
+
+def test_breaks_are_counted_and_sampled(numpy_mode):
+    rows = chain(count=120)
+    broken = list(range(30, 120, 2))
+    for index in broken:
+        if rows[index].credit_paise:
+            rows[index].credit_paise += 7
+        else:
+            rows[index].debit_paise += 7
+    reconciler = BalanceReconciler()
+    reconciler.reconcile(rows)
+    report = reconciler.report()
+    # A wrong amount breaks its own row; its balance still chains the next
+    assert report["break_count"] == len(broken)
+    assert report["break_sample"] == broken[:BalanceReconciler.BREAK_SAMPLE_SIZE]
+    assert "breaks" not in report
+
+
+def test_contradicted_chain_is_not_corrected(numpy_mode):
+    rows = chain()
+    # Balances printed a row late: every delta belongs to the previous row
+    balances = [row.balance_paise for row in rows]
+    for row, balance in zip(rows[1:], balances):
+        row.balance_paise = balance
+    expected = columns(rows)
+    reconciler = BalanceReconciler()
+    assert columns(reconciler.reconcile(rows)) == expected
+    report = reconciler.report()
+    assert report["correcting"] is False
+    assert report["corrected"] == 0
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 25])
+@pytest.mark.parametrize("newest_first", [False, True])
+def test_page_by_page_matches_whole_document(numpy_mode, page_size, newest_first):
+    def statement():
+        rows = chain(count=90)
+        rows = rows[::-1] if newest_first else rows
+        return as_default_debits(rows, range(0, len(rows), 3))
+
+    whole = BalanceReconciler()
+    expected = columns(whole.reconcile(statement()))
+
+    paged = BalanceReconciler()
+    rows = statement()
+    settled = []
+    for start in range(0, len(rows), page_size):
+        settled.extend(paged.feed(rows[start:start + page_size]))
+    settled.extend(paged.finish())
+    assert columns(settled) == expected
+    assert paged.report() == whole.report()
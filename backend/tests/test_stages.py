@@ -0,0 +1,107 @@
+# backend/tests/test_stages.py
+# StagedPipeline: every item comes out once whatever the worker counts,
+# process_all's results keep discovery order, a failing item only fails
+# itself, and the smallest queues still drain
+import random
+import threading
+import time
+
+import pytest
+
+from app import BankStatementProcessor
+from pipeline.stages import Stage, StagedPipeline
+from synthetic_pdf import LineExtractor, build_pdf, statement_pages
+
+
+def jittered(fn, seed):
+    """fn with a random short sleep first, so workers finish out of order"""
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    def step(item):
+        with lock:
+            delay = rng.random() * 0.004
+        time.sleep(delay)
+        return fn(item)
+    return step
+
+
+def run_to_list(pipeline, items, timeout=30):
+    """pipeline.run(items) in a thread, failing instead of hanging on a deadlock"""
+    collected = []
+    runner = threading.Thread(target=lambda: collected.extend(pipeline.run(items)), daemon=True)
+    runner.start()
+    runner.join(timeout)
+    assert not runner.is_alive(), "pipeline did not drain"
+    return collected
+
+
+@pytest.mark.parametrize("workers", [(1, 1, 1), (3, 1, 2), (4, 4, 4)])
+def test_every_item_comes_out_once(workers):
+    pipeline = StagedPipeline([
+        Stage("add", jittered(lambda item: (item[0], item[1] + 1), 1), workers[0]),
+        Stage("double", jittered(lambda item: (item[0], item[1] * 2), 2), workers[1]),
+        Stage("square", jittered(lambda item: (item[0], item[1] ** 2), 3), workers[2]),
+    ])
+    results = run_to_list(pipeline, ((index, index) for index in range(60)))
+    assert sorted(item for item, _, _ in results) == [(index, ((index + 1) * 2) ** 2) for index in range(60)]
+    assert all(error is None and set(seconds) == {"add", "double", "square"} for _, error, seconds in results)
+    assert [report["items"] for report in pipeline.report().values()] == [60, 60, 60, 60]
+
+
+def test_exception_is_isolated_to_its_item():
+    seen_by_last = []
+
+    def fail_on_seven(item):
+        if item == 7:
+            raise ValueError("bad item")
+        return item
+
+    def last(item):
+        seen_by_last.append(item)
+        return item
+
+    pipeline = StagedPipeline([Stage("first", fail_on_seven, 2), Stage("last", last, 2)])
+    results = run_to_list(pipeline, range(20))
+    errors = {item: error for item, error, _ in results if error is not None}
+    assert list(errors) == [7]
+    assert isinstance(errors[7], ValueError)
+    assert sorted(seen_by_last) == [item for item in range(20) if item != 7]
+    assert pipeline.report()["first"]["failed"] == 1
+    assert pipeline.report()["last"]["items"] == 19
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_queue_size_one_does_not_deadlock(workers):
+    pipeline = StagedPipeline([
+        Stage(name, jittered(lambda item: item, seed), workers, queue_size=1)
+        for seed, name in enumerate(["read", "extract", "normalize", "write"])
+    ])
+    results = run_to_list(pipeline, range(100))
+    assert sorted(item for item, _, _ in results) == list(range(100))
+    assert all(report["max_depth"] <= 1 for report in pipeline.report().values())
+
+
+def test_process_all_keeps_discovery_order(tmp_path):
+    source = tmp_path / "raw_pdfs" / "hdfc"
+    source.mkdir(parents=True)
+    for index in range(8):
+        (source / f"statement_{index}.pdf").write_bytes(build_pdf(statement_pages(1 + index % 3, seed=index)))
+
+    def run(stage_workers, queue_size):
+        processor = BankStatementProcessor(use_cache=False, incremental=False,
+                                           stage_workers=stage_workers, queue_size=queue_size)
+        processor.EXTRACTORS = {"hdfc": LineExtractor}
+        processor.raw_pdf_dir = tmp_path / "raw_pdfs"
+        processor.extracted_json_dir = tmp_path / "extracted_json"
+        processor.normalized_json_dir = tmp_path / "normalized_json"
+        processor.manifest_path = tmp_path / "manifest.json"
+        results = processor.process_all()
+        outputs = [(tmp_path / "normalized_json" / f"statement_{index}_normalized.json").read_bytes()
+                   for index in range(8)]
+        return [{field: value for field, value in result.items() if field not in processor.RUN_METRICS}
+                for result in results], outputs
+
+    serial = run({}, 2)
+    assert [result["file"] for result in serial[0]] == [f"statement_{index}.pdf" for index in range(8)]
+    assert run({"read": 3, "extract": 1, "normalize": 3, "write": 3}, 1) == serial
@@ -0,0 +1,55 @@
+# backend/tests/test_text_backends.py
+# The pdfminer text backend must return the string pdfplumber's
+# extract_text() returns, page for page
+import io
+import random
+
+import pdfplumber
+import pytest
+
+from pdf_extractor.base_extractor import BasePDFExtractor
+from pdf_extractor.text_backends import TEXT_BACKENDS, get_text_backend
+from synthetic_pdf import LineExtractor, build_pdf, statement_pages
+
+
+def random_pages(count, seed=10):
+    """Words at random positions: near-touching, overlapping, off-baseline and out of order"""
+    rng = random.Random(seed)
+    words = ["UPI-SWIGGY", "1,813.63", "(Dr)", "Cr", "back\\slash", "a", "TO TRF.", "", " ", "café", "x  y"]
+    pages = []
+    for _ in range(count):
+        page = []
+        for _ in range(rng.randint(0, 60)):
+            top = rng.choice([rng.uniform(20, 800), 100, 100.4, 101.5, 103.2])
+            x = rng.choice([rng.uniform(10, 560), 40, 40 + rng.uniform(0, 60)])
+            page.append((x, top, rng.choice(words)))
+        pages.append(page)
+    return pages
+
+
+def page_texts(pdf_bytes, backend):
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [get_text_backend(backend).extract_text(page) for page in pdf.pages]
+
+
+@pytest.mark.parametrize("pages", [
+    statement_pages(3),
+    random_pages(25),
+    [[]],
+], ids=["statement", "random", "empty"])
+def test_pdfminer_matches_pdfplumber(pages):
+    pdf_bytes = build_pdf(pages)
+    assert page_texts(pdf_bytes, "pdfminer") == page_texts(pdf_bytes, "pdfplumber")
+
+
+def test_extractors_agree_across_backends(tmp_path):
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(build_pdf(statement_pages(4)))
+    statements = [LineExtractor(str(path), text_backend=backend).extract() for backend in TEXT_BACKENDS]
+    assert all(statement == statements[0] for statement in statements)
+    assert len(statements[0]["transactions"]) == 80
+
+
+def test_unknown_backend_fails_before_reading():
+    with pytest.raises(ValueError):
+        BasePDFExtractor("missing.pdf", text_backend="ocr")
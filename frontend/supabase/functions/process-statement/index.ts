@@ -37,12 +37,132 @@ const CATEGORY_KEYWORDS: Record<string, string[]> = {
   "EMI": ["emi", "loan", "instalment", "installment"],
 };
 
+// Merchant -> category overrides; mirrors MERCHANT_CATEGORIES in
+// backend/normalizer/categorizer.py
+const MERCHANT_CATEGORIES: Record<string, string> = {
+  "barbeque nation": "Food & Dining",
+  "cafe coffee day": "Food & Dining",
+  "dominos": "Food & Dining",
+  "dhaba": "Food & Dining",
+  "haldiram": "Food & Dining",
+  "kfc": "Food & Dining",
+  "mcdonald": "Food & Dining",
+  "pizza hut": "Food & Dining",
+  "starbucks": "Food & Dining",
+  "subway": "Food & Dining",
+  "swiggy": "Food & Dining",
+  "zomato": "Food & Dining",
+  "bharat petroleum": "Travel",
+  "bmrc": "Travel",
+  "bpcl": "Travel",
+  "dmrc": "Travel",
+  "fastag": "Travel",
+  "goibibo": "Travel",
+  "hp petrol": "Travel",
+  "hpcl": "Travel",
+  "indian oil": "Travel",
+  "indianoil": "Travel",
+  "irctc": "Travel",
+  "makemytrip": "Travel",
+  "meru cabs": "Travel",
+  "metro card": "Travel",
+  "metro rch": "Travel",
+  "ola cabs": "Travel",
+  "railway ticket": "Travel",
+  "rapido": "Travel",
+  "uber": "Travel",
+  "house rent": "Rent",
+  "monthly rent": "Rent",
+  "rent payment": "Rent",
+  "act fiber": "Utilities",
+  "airtel": "Utilities",
+  "bescom": "Utilities",
+  "bsnl": "Utilities",
+  "gas cylinder": "Utilities",
+  "hathway": "Utilities",
+  "jio fiber": "Utilities",
+  "jio recharge": "Utilities",
+  "msedcl": "Utilities",
+  "reliancejio": "Utilities",
+  "tata sky": "Utilities",
+  "tpddl": "Utilities",
+  "vi recharge": "Utilities",
+  "vodafone": "Utilities",
+  "ajio": "Shopping",
+  "amazon": "Shopping",
+  "big bazaar": "Shopping",
+  "bigbasket": "Shopping",
+  "decathlon": "Shopping",
+  "dmart": "Shopping",
+  "flipkart": "Shopping",
+  "grofers": "Shopping",
+  "kirana": "Shopping",
+  "lifestyle": "Shopping",
+  "meesho": "Shopping",
+  "more megastore": "Shopping",
+  "more stores": "Shopping",
+  "more supermarket": "Shopping",
+  "myntra": "Shopping",
+  "nature s basket": "Shopping",
+  "pantaloons": "Shopping",
+  "reliance": "Shopping",
+  "shopper s stop": "Shopping",
+  "shoppers stop": "Shopping",
+  "spencer": "Shopping",
+  "westside": "Shopping",
+  "amazon prime": "Entertainment",
+  "amazonprime": "Entertainment",
+  "book my show": "Entertainment",
+  "bookmyshow": "Entertainment",
+  "cinepolis": "Entertainment",
+  "google play": "Entertainment",
+  "hotstar": "Entertainment",
+  "inox": "Entertainment",
+  "netflix": "Entertainment",
+  "pvr": "Entertainment",
+  "sonyliv": "Entertainment",
+  "spotify": "Entertainment",
+  "youtube premium": "Entertainment",
+  "zee5": "Entertainment",
+  "apollo": "Healthcare",
+  "max health": "Healthcare",
+  "medplus": "Healthcare",
+  "netmeds": "Healthcare",
+  "practo": "Healthcare",
+  "paytm": "Transfers",
+  "phonepe": "Transfers",
+  "atm cash": "ATM",
+  "atm wdl": "ATM",
+  "cash dep": "ATM",
+  "cwdr/": "ATM",
+  "sal credit": "Salary",
+  "salary credit": "Salary",
+  "hdfc life": "Insurance",
+  "icici pru": "Insurance",
+  "lic prem": "Insurance",
+  "homecrindfin": "EMI",
+};
+
+// Same answer as the backend's TransactionCategorizer: the longest merchant
+// in the description wins, else the first category with a keyword in it.
+// Matched lower-cased with whitespace collapsed and 2+ digit runs masked
 function categorizeTransaction(description: string): string {
-  const lowerDesc = description.toLowerCase();
-  
+  const text = String(description ?? "").replace(/\d{2,}/g, "#").toLowerCase().split(/\s+/).filter(Boolean).join(" ");
+
+  let merchant: string | null = null;
+  for (const [name, category] of Object.entries(MERCHANT_CATEGORIES)) {
+    if (text.includes(name) && (merchant === null || name.length > merchant.length ||
+        (name.length === merchant.length && category > MERCHANT_CATEGORIES[merchant]))) {
+      merchant = name;
+    }
+  }
+  if (merchant !== null) {
+    return MERCHANT_CATEGORIES[merchant];
+  }
+
   for (const [category, keywords] of Object.entries(CATEGORY_KEYWORDS)) {
     for (const keyword of keywords) {
-      if (lowerDesc.includes(keyword)) {
+      if (text.includes(keyword)) {
         return category;
       }
     }